@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Markdown to Arrow converter
+Converts Markdown tables to Apache Arrow IPC (Feather V2) format
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from ..services.svc_md_to_arrow import convert_md_to_arrow
+from ..utils.input_utils import read_md_input
+from ..utils.logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert Markdown tables to Apache Arrow IPC (Feather V2) format",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("input", help="Input Markdown file path, or - for standard input")
+    parser.add_argument("output", help="Output Arrow file path")
+    parser.add_argument("--strip-wrapper", action="store_true", help="Remove code block wrapper if present")
+    parser.add_argument(
+        "--typed",
+        action="store_true",
+        help="Type columns as booleans, numbers or dates where all values are of the type, instead of text",
+    )
+
+    args = parser.parse_args()
+
+    # Read input
+    try:
+        md_text = read_md_input(args.input)
+    except FileNotFoundError:
+        logger.error(f"Error: Input file '{args.input}' does not exist")
+        sys.exit(1)
+
+    # Convert to Arrow
+    output_path = Path(args.output)
+    try:
+        created_files = convert_md_to_arrow(md_text, output_path, args.strip_wrapper, force_text=not args.typed)
+        for file_path in created_files:
+            logger.info(f"Successfully converted to {file_path}")
+    except ValueError as e:
+        logger.error(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
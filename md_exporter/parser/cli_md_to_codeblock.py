@@ -9,6 +9,7 @@ import sys
 from pathlib import Path
 
 from ..services.svc_md_to_codeblock import convert_md_to_codeblock
+from ..utils.input_utils import read_md_input
 from ..utils.logger_utils import get_logger
 
 logger = get_logger(__name__)
@@ -19,18 +20,18 @@ def main():
         description="Extract code blocks from Markdown and save as files",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
-    parser.add_argument("input", help="Input Markdown file path")
+    parser.add_argument("input", help="Input Markdown file path, or - for standard input")
     parser.add_argument("output", help="Output file or directory path")
     parser.add_argument("--compress", action="store_true", help="Compress all code blocks into a ZIP file")
 
     args = parser.parse_args()
 
     # Read input
-    input_path = Path(args.input)
-    if not input_path.exists():
-        logger.error(f"Error: Input file '{input_path}' does not exist")
+    try:
+        md_text = read_md_input(args.input)
+    except FileNotFoundError:
+        logger.error(f"Error: Input file '{args.input}' does not exist")
         sys.exit(1)
-    md_text = input_path.read_text(encoding="utf-8")
 
     # Convert to code blocks
     output_path = Path(args.output)
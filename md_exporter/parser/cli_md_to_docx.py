@@ -9,6 +9,7 @@ import sys
 from pathlib import Path
 
 from ..services.svc_md_to_docx import convert_md_to_docx
+from ..utils.input_utils import read_md_input
 from ..utils.logger_utils import get_logger
 
 logger = get_logger(__name__)
@@ -18,7 +19,7 @@ def main():
     parser = argparse.ArgumentParser(
         description="Convert Markdown text to DOCX format", formatter_class=argparse.RawDescriptionHelpFormatter
     )
-    parser.add_argument("input", help="Input Markdown file path")
+    parser.add_argument("input", help="Input Markdown file path, or - for standard input")
     parser.add_argument("output", help="Output DOCX file path")
     parser.add_argument("--template", help="Path to DOCX template file (optional)")
     parser.add_argument("--strip-wrapper", action="store_true", help="Remove code block wrapper if present")
@@ -26,11 +27,11 @@ def main():
     args = parser.parse_args()
 
     # Read input
-    input_path = Path(args.input)
-    if not input_path.exists():
-        logger.error(f"Error: Input file '{input_path}' does not exist")
+    try:
+        md_text = read_md_input(args.input)
+    except FileNotFoundError:
+        logger.error(f"Error: Input file '{args.input}' does not exist")
         sys.exit(1)
-    md_text = input_path.read_text(encoding="utf-8")
 
     # Determine template file
     template_path = None
@@ -9,6 +9,7 @@ import sys
 from pathlib import Path
 
 from ..services.svc_md_to_html import convert_md_to_html
+from ..utils.input_utils import read_md_input
 from ..utils.logger_utils import get_logger
 
 logger = get_logger(__name__)
@@ -18,18 +19,18 @@ def main():
     parser = argparse.ArgumentParser(
         description="Convert Markdown text to HTML format", formatter_class=argparse.RawDescriptionHelpFormatter
     )
-    parser.add_argument("input", help="Input Markdown file path")
+    parser.add_argument("input", help="Input Markdown file path, or - for standard input")
     parser.add_argument("output", help="Output HTML file path")
     parser.add_argument("--strip-wrapper", action="store_true", help="Remove code block wrapper if present")
 
     args = parser.parse_args()
 
     # Read input
-    input_path = Path(args.input)
-    if not input_path.exists():
-        logger.error(f"Error: Input file '{input_path}' does not exist")
+    try:
+        md_text = read_md_input(args.input)
+    except FileNotFoundError:
+        logger.error(f"Error: Input file '{args.input}' does not exist")
         sys.exit(1)
-    md_text = input_path.read_text(encoding="utf-8")
 
     # Convert to HTML
     output_path = Path(args.output)
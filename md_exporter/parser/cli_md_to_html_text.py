@@ -6,9 +6,9 @@ Converts Markdown text to HTML and outputs to stdout
 
 import argparse
 import sys
-from pathlib import Path
 
 from ..services.svc_md_to_html_text import convert_md_to_html_text
+from ..utils.input_utils import read_md_input
 from ..utils.logger_utils import get_logger
 
 logger = get_logger(__name__)
@@ -19,17 +19,15 @@ def main():
         description="Convert Markdown text to HTML and output to stdout",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
-    parser.add_argument("input", help="Input Markdown file path")
+    parser.add_argument("input", help="Input Markdown file path, or - for standard input")
 
     args = parser.parse_args()
 
     # Read input
-    input_path = args.input
     try:
-        with open(input_path, encoding="utf-8") as f:
-            md_text = f.read()
+        md_text = read_md_input(args.input)
     except FileNotFoundError:
-        logger.error(f"Error: Input file '{input_path}' does not exist")
+        logger.error(f"Error: Input file '{args.input}' does not exist")
         sys.exit(1)
 
     # Convert to HTML
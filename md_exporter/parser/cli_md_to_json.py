@@ -9,6 +9,7 @@ import sys
 from pathlib import Path
 
 from ..services.svc_md_to_json import convert_md_to_json
+from ..utils.input_utils import read_md_input
 from ..utils.logger_utils import get_logger
 
 logger = get_logger(__name__)
@@ -19,26 +20,41 @@ def main():
         description="Convert Markdown tables to JSON or JSONL format",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
-    parser.add_argument("input", help="Input Markdown file path")
+    parser.add_argument("input", help="Input Markdown file path, or - for standard input")
     parser.add_argument("output", help="Output JSON file path")
     parser.add_argument(
-        "--style", choices=["jsonl", "json_array"], default="jsonl", help="JSON output style (default: jsonl)"
+        "--style",
+        choices=["jsonl", "json_array", "columns", "split"],
+        default="jsonl",
+        help="JSON output style (default: jsonl)",
     )
     parser.add_argument("--strip-wrapper", action="store_true", help="Remove code block wrapper if present")
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Write tables row by row with constant memory, for huge tables",
+    )
+    parser.add_argument(
+        "--typed",
+        action="store_true",
+        help="Type columns as booleans, numbers or dates where all values are of the type, instead of text",
+    )
 
     args = parser.parse_args()
 
     # Read input
-    input_path = Path(args.input)
-    if not input_path.exists():
-        logger.error(f"Error: Input file '{input_path}' does not exist")
+    try:
+        md_text = read_md_input(args.input)
+    except FileNotFoundError:
+        logger.error(f"Error: Input file '{args.input}' does not exist")
         sys.exit(1)
-    md_text = input_path.read_text(encoding="utf-8")
 
     # Convert to JSON
     output_path = Path(args.output)
     try:
-        created_files = convert_md_to_json(md_text, output_path, args.style, args.strip_wrapper)
+        created_files = convert_md_to_json(
+            md_text, output_path, args.style, args.strip_wrapper, args.streaming, force_text=not args.typed
+        )
         for file_path in created_files:
             logger.info(f"Successfully converted to {file_path}")
     except Exception as e:
@@ -9,6 +9,7 @@ import sys
 from pathlib import Path
 
 from ..services.svc_md_to_latex import convert_md_to_latex
+from ..utils.input_utils import read_md_input
 from ..utils.logger_utils import get_logger
 
 logger = get_logger(__name__)
@@ -18,23 +19,35 @@ def main():
     parser = argparse.ArgumentParser(
         description="Convert Markdown tables to LaTeX format", formatter_class=argparse.RawDescriptionHelpFormatter
     )
-    parser.add_argument("input", help="Input Markdown file path")
+    parser.add_argument("input", help="Input Markdown file path, or - for standard input")
     parser.add_argument("output", help="Output LaTeX file path")
     parser.add_argument("--strip-wrapper", action="store_true", help="Remove code block wrapper if present")
+    parser.add_argument(
+        "--longtable",
+        action="store_true",
+        help="Use longtable environment for tables spanning multiple pages, repeating the header row on each page",
+    )
+    parser.add_argument(
+        "--single-document",
+        action="store_true",
+        help="Put all tables into one document, each under a section titled with the preceding heading",
+    )
 
     args = parser.parse_args()
 
     # Read input
-    input_path = Path(args.input)
-    if not input_path.exists():
-        logger.error(f"Error: Input file '{input_path}' does not exist")
+    try:
+        md_text = read_md_input(args.input)
+    except FileNotFoundError:
+        logger.error(f"Error: Input file '{args.input}' does not exist")
         sys.exit(1)
-    md_text = input_path.read_text(encoding="utf-8")
 
     # Convert to LaTeX
     output_path = Path(args.output)
     try:
-        created_files = convert_md_to_latex(md_text, output_path, args.strip_wrapper)
+        created_files = convert_md_to_latex(
+            md_text, output_path, args.strip_wrapper, longtable=args.longtable, single_document=args.single_document
+        )
         for file_path in created_files:
             logger.info(f"Successfully converted to {file_path}")
     except Exception as e:
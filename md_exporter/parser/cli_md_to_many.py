@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Markdown to multiple formats converter
+Converts Markdown text to multiple formats at once
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from ..services.svc_md_to_many import SUPPORTED_TARGETS, convert_md_to_many
+from ..utils.input_utils import read_md_input
+from ..utils.logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert Markdown text to multiple formats at once",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("input", help="Input Markdown file path, or - for standard input")
+    parser.add_argument(
+        "output", help="Output file path without extension, the extension of each target format is applied"
+    )
+    parser.add_argument(
+        "--to",
+        required=True,
+        help=f"Comma separated target formats, e.g. docx,pdf,html (supported: {','.join(sorted(SUPPORTED_TARGETS))})",
+    )
+    parser.add_argument("--strip-wrapper", action="store_true", help="Remove code block wrapper if present")
+
+    args = parser.parse_args()
+
+    # Read input
+    try:
+        md_text = read_md_input(args.input)
+    except FileNotFoundError:
+        logger.error(f"Error: Input file '{args.input}' does not exist")
+        sys.exit(1)
+
+    # Convert to multiple formats
+    output_path = Path(args.output)
+    try:
+        results = convert_md_to_many(md_text, output_path, args.to, args.strip_wrapper)
+        for created_files in results.values():
+            for file_path in created_files:
+                logger.info(f"Successfully converted to {file_path}")
+    except Exception as e:
+        logger.error(f"Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,8 @@ import argparse
 import sys
 from pathlib import Path
 
-from ..services.svc_md_to_pdf import convert_md_to_pdf
+from ..services.svc_md_to_pdf import PdfEngine, convert_md_to_pdf
+from ..utils.input_utils import read_md_input
 from ..utils.logger_utils import get_logger
 
 logger = get_logger(__name__)
@@ -18,23 +19,34 @@ def main():
     parser = argparse.ArgumentParser(
         description="Convert Markdown text to PDF format", formatter_class=argparse.RawDescriptionHelpFormatter
     )
-    parser.add_argument("input", help="Input Markdown file path")
+    parser.add_argument("input", help="Input Markdown file path, or - for standard input")
     parser.add_argument("output", help="Output PDF file path")
     parser.add_argument("--strip-wrapper", action="store_true", help="Remove code block wrapper if present")
+    parser.add_argument(
+        "--engine",
+        choices=[engine.value for engine in PdfEngine],
+        default=PdfEngine.XHTML2PDF.value,
+        help="PDF engine to render with (default: xhtml2pdf)",
+    )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Render chunks split at top-level headings in parallel processes, each starting on a new page",
+    )
 
     args = parser.parse_args()
 
     # Read input
-    input_path = Path(args.input)
-    if not input_path.exists():
-        logger.error(f"Error: Input file '{input_path}' does not exist")
+    try:
+        md_text = read_md_input(args.input)
+    except FileNotFoundError:
+        logger.error(f"Error: Input file '{args.input}' does not exist")
         sys.exit(1)
-    md_text = input_path.read_text(encoding="utf-8")
 
     # Convert to PDF
     output_path = Path(args.output)
     try:
-        convert_md_to_pdf(md_text, output_path, args.strip_wrapper)
+        convert_md_to_pdf(md_text, output_path, args.strip_wrapper, args.engine, parallel=args.parallel or None)
         logger.info(f"Successfully converted to {output_path}")
     except ValueError as e:
         logger.error(f"Error: {e}")
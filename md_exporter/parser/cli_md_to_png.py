@@ -8,7 +8,9 @@ import argparse
 import sys
 from pathlib import Path
 
-from ..services.svc_md_to_png import convert_md_to_png
+from ..services.svc_md_to_pdf import PdfEngine
+from ..services.svc_md_to_png import DEFAULT_PNG_DPI, convert_md_to_png
+from ..utils.input_utils import read_md_input
 from ..utils.logger_utils import get_logger
 
 logger = get_logger(__name__)
@@ -18,24 +20,46 @@ def main():
     parser = argparse.ArgumentParser(
         description="Convert Markdown text to PNG images", formatter_class=argparse.RawDescriptionHelpFormatter
     )
-    parser.add_argument("input", help="Input Markdown file path")
+    parser.add_argument("input", help="Input Markdown file path, or - for standard input")
     parser.add_argument("output", help="Output PNG file path or directory path")
     parser.add_argument("--compress", action="store_true", help="Compress all PNG images into a ZIP file")
     parser.add_argument("--strip-wrapper", action="store_true", help="Remove code block wrapper if present")
+    parser.add_argument(
+        "--engine",
+        choices=[engine.value for engine in PdfEngine],
+        default=PdfEngine.XHTML2PDF.value,
+        help="PDF engine to render with (default: xhtml2pdf)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Number of processes rasterizing pages in parallel (default: 1)"
+    )
+    parser.add_argument(
+        "--dpi", type=int, default=DEFAULT_PNG_DPI, help=f"Resolution of PNG images (default: {DEFAULT_PNG_DPI})"
+    )
+    parser.add_argument("--pages", help='Page numbers or ranges to convert, e.g. "1", "1-3,5" (default: all pages)')
 
     args = parser.parse_args()
 
     # Read input
-    input_path = Path(args.input)
-    if not input_path.exists():
-        logger.error(f"Error: Input file '{input_path}' does not exist")
+    try:
+        md_text = read_md_input(args.input)
+    except FileNotFoundError:
+        logger.error(f"Error: Input file '{args.input}' does not exist")
         sys.exit(1)
-    md_text = input_path.read_text(encoding="utf-8")
 
     # Convert to PNG
     output_path = Path(args.output)
     try:
-        created_files = convert_md_to_png(md_text, output_path, args.compress, args.strip_wrapper)
+        created_files = convert_md_to_png(
+            md_text,
+            output_path,
+            args.compress,
+            args.strip_wrapper,
+            args.engine,
+            args.workers,
+            args.dpi,
+            args.pages,
+        )
         logger.info(f"Successfully processed {len(created_files)} files")
     except Exception as e:
         logger.error(f"Error: {e}")
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Markdown to SQLite converter
+Converts Markdown tables to SQLite database
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from ..services.svc_md_to_sqlite import convert_md_to_sqlite
+from ..utils.input_utils import read_md_input
+from ..utils.logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert Markdown tables to SQLite database, with one SQL table for each Markdown table",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("input", help="Input Markdown file path, or - for standard input")
+    parser.add_argument("output", help="Output SQLite database file path")
+    parser.add_argument("--strip-wrapper", action="store_true", help="Remove code block wrapper if present")
+    parser.add_argument(
+        "--typed",
+        action="store_true",
+        help="Type columns of booleans or numbers as INTEGER or REAL, instead of storing them as TEXT",
+    )
+    parser.add_argument(
+        "--index-columns",
+        help="Comma separated columns to create indexes on, in every table having them, e.g. 'id,name'",
+    )
+
+    args = parser.parse_args()
+
+    # Read input
+    try:
+        md_text = read_md_input(args.input)
+    except FileNotFoundError:
+        logger.error(f"Error: Input file '{args.input}' does not exist")
+        sys.exit(1)
+
+    # Convert to SQLite
+    output_path = Path(args.output)
+    try:
+        convert_md_to_sqlite(
+            md_text,
+            output_path,
+            args.strip_wrapper,
+            force_text=not args.typed,
+            index_columns=args.index_columns,
+        )
+        logger.info(f"Successfully converted to {output_path}")
+    except ValueError as e:
+        logger.error(f"Error: {e}")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"Error: Failed to convert to SQLite - {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
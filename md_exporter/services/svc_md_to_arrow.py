@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Markdown to Arrow conversion service
+Provides common functionality for converting Markdown tables to Apache Arrow IPC file format, also known as Feather V2
+"""
+
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from ..utils.arrow_utils import write_arrow_tables, write_arrow_tables_to_bytes
+from ..utils.markdown_utils import get_md_text
+
+
+def convert_md_to_arrow(
+    md_text: str, output_path: Path, is_strip_wrapper: bool = False, force_text: bool = True
+) -> list[Path]:
+    """
+    Convert Markdown tables to Arrow IPC file format, one file per table
+    The files can be read by `pyarrow.ipc.open_file`, `pyarrow.feather.read_table` or `pandas.read_feather`
+    The heading preceding each table is stored as table name in the schema metadata
+
+    Args:
+        md_text: Markdown text to convert
+        output_path: Path to save the output Arrow file(s)
+        is_strip_wrapper: Whether to remove code block wrapper if present
+        force_text: Whether to keep cell values as text, otherwise columns are typed as booleans, numbers or dates
+            where possible
+
+    Returns:
+        List[Path]: List of paths to the created Arrow files
+
+    Raises:
+        ValueError: If input processing or table parsing fails
+    """
+    # Process Markdown text
+    processed_md = get_md_text(md_text, is_strip_wrapper=is_strip_wrapper)
+
+    # Convert to Arrow
+    return write_arrow_tables(processed_md, output_path, write_arrow_table, force_text=force_text)
+
+
+def convert_md_to_arrow_bytes(md_text: str, is_strip_wrapper: bool = False, force_text: bool = True) -> list[bytes]:
+    """
+    Convert Markdown tables to Arrow IPC file format in memory, one file per table
+
+    Args:
+        md_text: Markdown text to convert
+        is_strip_wrapper: Whether to remove code block wrapper if present
+        force_text: Whether to keep cell values as text, otherwise columns are typed as booleans, numbers or dates
+            where possible
+
+    Returns:
+        List[bytes]: List of contents of the Arrow files in table order
+
+    Raises:
+        ValueError: If input processing or table parsing fails
+    """
+    # Process Markdown text
+    processed_md = get_md_text(md_text, is_strip_wrapper=is_strip_wrapper)
+
+    # Convert to Arrow
+    return write_arrow_tables_to_bytes(processed_md, write_arrow_table, force_text=force_text)
+
+
+def write_arrow_table(table: pa.Table, output_file: Path | pa.NativeFile) -> None:
+    """
+    Write an Arrow table to Arrow IPC file, uncompressed for zero-copy memory mapped reading
+
+    Args:
+        table: Arrow table
+        output_file: Path of the output file or Arrow output stream
+    """
+    feather.write_feather(table, output_file, compression="uncompressed")
@@ -3,17 +3,18 @@
 MdToCodeblock service
 """
 
-import re
-import zipfile
+from collections.abc import Iterator
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 
 from ..utils.logger_utils import get_logger
+from ..utils.zip_utils import write_zip, zip_to_bytes
 
 logger = get_logger(__name__)
 
 
 class CodeBlock:
+    __slots__ = ("lang_type", "code")
+
     def __init__(self, lang_type: str, code: str):
         self.lang_type = lang_type
         self.code = code
@@ -62,16 +63,19 @@ SUFFIX_MAP = {
 
 
 def extract_code_blocks(text: str) -> list[CodeBlock]:
-    """Extract code blocks"""
-    code_blocks: list[CodeBlock] = []
-    pattern = re.compile(r"```([a-zA-Z0-9\+#\-_]*)\s*\n(.*?)\n```", re.DOTALL)
+    """Extract fenced code blocks, with the language from the info string or "text" by default"""
+    return list(iter_code_blocks(text))
+
 
-    for match in pattern.finditer(text):
-        lang_type = match.group(1).strip() or "text"
-        code_content = match.group(2).strip()
-        code_blocks.append(CodeBlock(lang_type, code_content))
+def iter_code_blocks(text: str) -> Iterator[CodeBlock]:
+    """
+    Iterate over fenced code blocks lazily, scanned in a single pass following CommonMark fence rules,
+    with the language from the info string or "text" by default
+    """
+    from ..utils.document_utils import iter_fenced_code_blocks
 
-    return code_blocks
+    for block in iter_fenced_code_blocks(text):
+        yield CodeBlock(block.language or "text", block.code.strip())
 
 
 def get_mime_type(lang_type: str) -> str:
@@ -116,20 +120,9 @@ def convert_md_to_codeblock(
     if compress:
         # Compress into ZIP file
         try:
-            with (
-                NamedTemporaryFile(suffix=".zip", delete=True) as temp_zip_file,
-                zipfile.ZipFile(temp_zip_file.name, mode="w", compression=zipfile.ZIP_DEFLATED) as zip_file,
-            ):
-                for idx, code_block in enumerate(code_blocks, 1):
-                    suffix = get_suffix_by_language(code_block.lang_type)
-                    with NamedTemporaryFile(prefix=f"code_{idx}", suffix=suffix, delete=True) as temp_file:
-                        temp_file.write(code_block.code_bytes)
-                        temp_file.flush()
-                        zip_file.write(temp_file.name, arcname=f"code_{idx}{suffix}")
-                zip_file.close()
-
-                output_path.write_bytes(Path(zip_file.filename).read_bytes())
-                created_files.append(output_path)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            write_zip(output_path, get_code_block_entries(code_blocks))
+            created_files.append(output_path)
 
             logger.info(f"Successfully created ZIP file with {len(code_blocks)} code blocks: {output_path}")
         except Exception as e:
@@ -161,3 +154,44 @@ def convert_md_to_codeblock(
             raise Exception(f"Failed to save code blocks: {e}")
 
     return created_files
+
+
+def convert_md_to_codeblock_bytes(
+    md_text: str, compress: bool = False, is_strip_wrapper: bool = False
+) -> list[tuple[str, bytes]]:
+    """
+    Extract code blocks from Markdown in memory
+    Args:
+        md_text: Markdown text to process
+        compress: Whether to compress all code blocks into a ZIP file
+        is_strip_wrapper: Whether to remove code block wrapper if present
+    Returns:
+        List of (file name, content) pairs, either a single "code.zip" if compress=True,
+        or "code_N" with the suffix by language for each code block
+    Raises:
+        ValueError: If input processing fails or no code blocks found
+        Exception: If conversion fails
+    """
+    # Process Markdown text
+    from ..utils.markdown_utils import get_md_text
+
+    processed_md = get_md_text(md_text, is_strip_wrapper=is_strip_wrapper)
+
+    # Extract code blocks
+    code_blocks = extract_code_blocks(processed_md)
+
+    if not code_blocks:
+        raise ValueError("No code blocks found in the input text")
+
+    entries = get_code_block_entries(code_blocks)
+    if compress:
+        return [("code.zip", zip_to_bytes(entries))]
+    return entries
+
+
+def get_code_block_entries(code_blocks: list[CodeBlock]) -> list[tuple[str, bytes]]:
+    """Get (file name, content) pairs of code blocks, named "code_N" with the suffix by language"""
+    return [
+        (f"code_{idx}{get_suffix_by_language(code_block.lang_type)}", code_block.code_bytes)
+        for idx, code_block in enumerate(code_blocks, 1)
+    ]
@@ -4,14 +4,21 @@ Markdown to CSV conversion service
 Provides common functionality for converting Markdown tables to CSV format
 """
 
+import csv
+from collections.abc import Iterator
 from pathlib import Path
+from typing import TextIO
 
 from ..utils.markdown_utils import get_md_text
-from ..utils.table_utils import parse_md_to_tables
+from ..utils.table_utils import parse_md_to_tables, write_md_tables_streaming
 
 
 def convert_md_to_csv(
-    md_text: str, output_path: Path = None, is_strip_wrapper: bool = False, return_strings: bool = False
+    md_text: str,
+    output_path: Path = None,
+    is_strip_wrapper: bool = False,
+    return_strings: bool = False,
+    streaming: bool = False,
 ) -> list[Path] | list[str]:
     """
     Convert Markdown tables to CSV format
@@ -21,6 +28,8 @@ def convert_md_to_csv(
         output_path: Path to save the output CSV file(s) (optional if return_strings=True)
         is_strip_wrapper: Whether to remove code block wrapper if present
         return_strings: Whether to return CSV strings instead of writing to files
+        streaming: Whether to write tables to files row by row, with memory bounded by a single row
+            instead of the table size, not applicable if return_strings=True
 
     Returns:
         List[Path]: List of paths to the created CSV files if return_strings=False
@@ -32,6 +41,9 @@ def convert_md_to_csv(
     # Process Markdown text
     processed_md = get_md_text(md_text, is_strip_wrapper=is_strip_wrapper)
 
+    if streaming and not return_strings:
+        return write_md_tables_streaming(processed_md, output_path, write_csv_table)
+
     # Parse Markdown tables
     tables = parse_md_to_tables(processed_md)
 
@@ -60,6 +72,38 @@ def convert_md_to_csv(
     return created_files
 
 
+def convert_md_to_csv_bytes(md_text: str, is_strip_wrapper: bool = False) -> list[bytes]:
+    """
+    Convert Markdown tables to CSV format in memory, one file per table
+
+    Args:
+        md_text: Markdown text to convert
+        is_strip_wrapper: Whether to remove code block wrapper if present
+
+    Returns:
+        List[bytes]: List of contents of the CSV files in table order, encoded in UTF-8
+
+    Raises:
+        ValueError: If input processing or table parsing fails
+    """
+    csv_strings = convert_md_to_csv(md_text, is_strip_wrapper=is_strip_wrapper, return_strings=True)
+    return [csv_str.encode("utf-8") for csv_str in csv_strings]
+
+
+def write_csv_table(f: TextIO, columns: list[str], rows: Iterator[list[str]]) -> None:
+    """
+    Write a table to CSV file row by row, in the same format as DataFrame.to_csv
+
+    Args:
+        f: Opened text file
+        columns: Column names
+        rows: Iterator of rows
+    """
+    writer = csv.writer(f, lineterminator="\n")
+    writer.writerow(columns)
+    writer.writerows(rows)
+
+
 def get_csv_output_encoding(csv_str: str) -> str:
     """
     Get the appropriate encoding for CSV output
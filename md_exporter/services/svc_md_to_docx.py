@@ -8,7 +8,7 @@ from pathlib import Path
 
 from ..utils import get_logger
 from ..utils.markdown_utils import get_md_text
-from ..utils.pandoc_utils import pandoc_convert_file
+from ..utils.pandoc_utils import pandoc_convert_to_bytes
 
 logger = get_logger(__name__)
 
@@ -29,41 +29,39 @@ def convert_md_to_docx(
         ValueError: If input processing fails
         Exception: If conversion fails
     """
-    # Process Markdown text
-    processed_md = get_md_text(md_text, is_strip_wrapper=is_strip_wrapper)
+    result_file_bytes = convert_md_to_docx_bytes(md_text, template_path, is_strip_wrapper)
+    output_path.write_bytes(result_file_bytes)
 
-    # Determine template file
-    final_template_path = template_path
-    if not final_template_path:
-        # Use default template
-        final_template_path = get_default_template()
 
-    # Prepare pandoc arguments
-    extra_args = []
-    if final_template_path and final_template_path.exists():
-        extra_args.append(f"--reference-doc={final_template_path}")
+def convert_md_to_docx_bytes(md_text: str, template_path: Path | None = None, is_strip_wrapper: bool = False) -> bytes:
+    """
+    Convert Markdown text to DOCX format in memory
+
+    Args:
+        md_text: Markdown text to convert
+        template_path: Optional path to DOCX template file
+        is_strip_wrapper: Whether to remove code block wrapper if present
 
-    # Convert to DOCX - use pandoc_convert_file with temporary file since convert_text doesn't work for DOCX
-    from tempfile import NamedTemporaryFile
+    Returns:
+        bytes: Content of the DOCX file
 
-    with NamedTemporaryFile(suffix=".md", delete=False, mode="w", encoding="utf-8") as temp_md_file:
-        temp_md_file.write(processed_md)
-        temp_md_file_path = temp_md_file.name
+    Raises:
+        ValueError: If input processing fails
+        Exception: If conversion fails
+    """
+    # Process Markdown text
+    processed_md = get_md_text(md_text, is_strip_wrapper=is_strip_wrapper)
 
-    try:
-        # Convert using pandoc_convert_file
-        pandoc_convert_file(
-            source_file=temp_md_file_path,
-            input_format="markdown",
-            dest_format="docx",
-            outputfile=str(output_path),
-            extra_args=extra_args,
-        )
-    finally:
-        # Clean up temporary file
-        import os
+    # Prepare pandoc arguments
+    extra_args = get_pandoc_extra_args(template_path)
 
-        os.unlink(temp_md_file_path)
+    # Convert to DOCX - pipe markdown to pandoc and capture the DOCX bytes from stdout
+    return pandoc_convert_to_bytes(
+        source_text=processed_md,
+        input_format="markdown",
+        dest_format="docx",
+        extra_args=extra_args,
+    )
 
 
 def get_default_template() -> Path | None:
@@ -80,3 +78,25 @@ def get_default_template() -> Path | None:
     else:
         logger.warning(f"Default DOCX template not found at {default_template}")
         return None
+
+
+def get_pandoc_extra_args(template_path: Path | None = None) -> list[str]:
+    """
+    Get pandoc arguments for DOCX conversion
+
+    Args:
+        template_path: Optional path to DOCX template file, the default template is used if not specified
+
+    Returns:
+        list[str]: Pandoc arguments
+    """
+    # Determine template file
+    final_template_path = template_path
+    if not final_template_path:
+        # Use default template
+        final_template_path = get_default_template()
+
+    extra_args = []
+    if final_template_path and final_template_path.exists():
+        extra_args.append(f"--reference-doc={final_template_path}")
+    return extra_args
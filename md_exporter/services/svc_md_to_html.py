@@ -6,9 +6,8 @@ Provides common functionality for converting Markdown to HTML format
 
 from pathlib import Path
 
-from pypandoc import convert_text
-
 from ..utils.markdown_utils import get_md_text
+from ..utils.pandoc_utils import pandoc_convert_text
 
 
 def convert_md_to_html(md_text: str, output_path: Path, is_strip_wrapper: bool = False) -> None:
@@ -20,6 +19,25 @@ def convert_md_to_html(md_text: str, output_path: Path, is_strip_wrapper: bool =
         output_path: Path to save the output HTML file
         is_strip_wrapper: Whether to remove code block wrapper if present
 
+    Raises:
+        ValueError: If input processing fails
+        Exception: If conversion fails
+    """
+    result_file_bytes = convert_md_to_html_bytes(md_text, is_strip_wrapper)
+    output_path.write_bytes(result_file_bytes)
+
+
+def convert_md_to_html_bytes(md_text: str, is_strip_wrapper: bool = False) -> bytes:
+    """
+    Convert Markdown text to HTML format in memory
+
+    Args:
+        md_text: Markdown text to convert
+        is_strip_wrapper: Whether to remove code block wrapper if present
+
+    Returns:
+        bytes: Content of the HTML file
+
     Raises:
         ValueError: If input processing fails
         Exception: If conversion fails
@@ -28,7 +46,7 @@ def convert_md_to_html(md_text: str, output_path: Path, is_strip_wrapper: bool =
     processed_md = get_md_text(md_text, is_strip_wrapper=is_strip_wrapper)
 
     # Convert to HTML
-    result = convert_text(processed_md, format="markdown", to="html")
-
-    # Write to file
-    output_path.write_bytes(result.encode("utf-8"))
+    result = pandoc_convert_text(
+        processed_md, input_format="markdown", dest_format="html", disabled_input_extensions=[]
+    )
+    return result.encode("utf-8")
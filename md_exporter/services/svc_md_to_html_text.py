@@ -3,12 +3,27 @@
 MdToHtmlText service
 """
 
-from pypandoc import convert_text
+import os
+import re
+
+from ..utils.pandoc_utils import pandoc_convert_text
+from ..utils.render_cache_utils import BlockRenderer, render_markdown_incrementally
+
+# markers of the features of Pandoc Markdown rendered with the content of the whole document,
+# inline notes, example lists, LaTeX macros, divs which may span headings,
+# and raw <pre> elements breaking the numbering of code blocks
+_PANDOC_WHOLE_DOCUMENT_MARKER_PATTERN = re.compile(
+    r"\^\[|\(@|\\(?:re)?newcommand|\\def\b|^:::|<div\b|<pre\b", re.IGNORECASE | re.MULTILINE
+)
+# numbers of code blocks, counted across the document in the IDs "cbN" and "cbN-M" of the code blocks and lines
+_CODE_BLOCK_NUMBER_PATTERN = re.compile(r'(?<=id="cb)\d+|(?<=href="#cb)\d+')
+_CODE_BLOCK_ID_PATTERN = re.compile(r"cb\d+(?:-\d+)?")
 
 
 def convert_md_to_html_text(md_text: str, is_strip_wrapper: bool = False) -> str:
     """
     Convert Markdown text to HTML format
+    Rendered incrementally with the HTML of unchanged blocks reused, if MD_EXPORTER_RENDER_CACHE_SIZE is set
     Args:
         md_text: Markdown text to convert
         is_strip_wrapper: Whether to remove code block wrapper if present
@@ -25,7 +40,58 @@ def convert_md_to_html_text(md_text: str, is_strip_wrapper: bool = False) -> str
 
     # Convert to HTML
     try:
-        html_str = convert_text(processed_md, format="markdown", to="html")
+        html_str = render_markdown_incrementally(processed_md, _PandocHtmlRenderer())
+        if html_str is None:
+            html_str = _render_html(processed_md)
         return html_str
     except Exception as e:
         raise Exception(f"Failed to convert Markdown to HTML: {e}")
+
+
+def _render_html(md_text: str, use_ast_cache: bool = True) -> str:
+    return pandoc_convert_text(
+        md_text, input_format="markdown", dest_format="html", disabled_input_extensions=[], use_ast_cache=use_ast_cache
+    )
+
+
+class _PandocHtmlRenderer(BlockRenderer):
+    """Renderer with Pandoc, as convert_md_to_html_text"""
+
+    name = "pandoc-html"
+    id_separator = "-"
+    # each block is rendered by a Pandoc process
+    max_workers = min(os.cpu_count() or 1, 8)
+    # abbreviations are not supported in Pandoc Markdown
+    definition_kinds = ("link",)
+
+    def is_whole_document(self, prose: str, headings: list[str]) -> bool:
+        # headings are referred to as implicit reference links, e.g. "[Introduction]"
+        return (
+            super().is_whole_document(prose, headings)
+            or bool(_PANDOC_WHOLE_DOCUMENT_MARKER_PATTERN.search(prose))
+            or any(f"[{heading}]" in prose for heading in headings)
+        )
+
+    def render(self, md_text: str, definitions: str, context_ids: list[str], is_last: bool) -> str | None:
+        context_md, context_html = self.get_context_headings(context_ids)
+        # definitions are put after the block, as each block is rendered up to the end of the text
+        # the ASTs of blocks are not cached, as the HTML of the blocks is cached by the render cache
+        html = _render_html(
+            f"{context_md}{md_text}\n\n{definitions}" if definitions else f"{context_md}{md_text}", use_ast_cache=False
+        )
+        if not html.startswith(context_html):
+            return None
+        html = html[len(context_html) :]
+        # a block rendered to nothing, e.g. a metadata block, is rendered as a line break
+        return html if html.strip() or is_last else ""
+
+    def get_ids(self, html: str) -> list[str]:
+        return [block_id for block_id in super().get_ids(html) if not _CODE_BLOCK_ID_PATTERN.fullmatch(block_id)]
+
+    def relocate(self, html: str, state: dict) -> str:
+        # code blocks are numbered from 1 in each block, following the ones in the preceding blocks
+        offset = state.get("code_blocks", 0)
+        if offset:
+            html = _CODE_BLOCK_NUMBER_PATTERN.sub(lambda m: str(int(m.group()) + offset), html)
+        state["code_blocks"] = offset + html.count("<pre")
+        return html
@@ -5,29 +5,27 @@ Provides common functionality for converting Markdown to IPYNB format
 """
 
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 
 from ..utils.markdown_utils import get_md_text
-from ..utils.pandoc_utils import pandoc_convert_file
-
-
-def _enforce_code_cells(md_text: str) -> str:
-    lines = md_text.splitlines()
-    processed_lines = []
-    is_in_codeblock = False
-    MD_CODEBLOCK_DELIMITER = "```"
-    for line in lines:
-        if line == MD_CODEBLOCK_DELIMITER or line.lstrip().startswith(MD_CODEBLOCK_DELIMITER):
-            if not is_in_codeblock:
-                processed_lines.append("```code")
-                is_in_codeblock = True
-            else:
-                processed_lines.append(MD_CODEBLOCK_DELIMITER)
-                is_in_codeblock = False
-        else:
-            processed_lines.append(line)
-    processed_md = "\n".join(processed_lines)
-    return processed_md
+from ..utils.pandoc_utils import pandoc_convert_to_bytes
+
+
+def enforce_code_cells(md_text: str) -> str:
+    """Replace the info strings of fenced code blocks with "code", and close the fences with the opening ones"""
+    from ..utils.document_utils import iter_fenced_code_blocks
+
+    parts = []
+    pos = 0
+    for block in iter_fenced_code_blocks(md_text):
+        parts.append(md_text[pos : block.start])
+        parts.append(f"{block.fence}code\n{block.code}")
+        if block.is_closed:
+            parts.append(block.fence)
+            if md_text[block.end - 1] == "\n":
+                parts.append("\n")
+        pos = block.end
+    parts.append(md_text[pos:])
+    return "".join(parts)
 
 
 def convert_md_to_ipynb(md_text: str, output_path: Path, is_strip_wrapper: bool = False) -> None:
@@ -39,6 +37,25 @@ def convert_md_to_ipynb(md_text: str, output_path: Path, is_strip_wrapper: bool
         output_path: Path to save the output IPYNB file
         is_strip_wrapper: Whether to remove code block wrapper if present
 
+    Raises:
+        ValueError: If input processing fails
+        Exception: If conversion fails
+    """
+    result_file_bytes = convert_md_to_ipynb_bytes(md_text, is_strip_wrapper)
+    output_path.write_bytes(result_file_bytes)
+
+
+def convert_md_to_ipynb_bytes(md_text: str, is_strip_wrapper: bool = False) -> bytes:
+    """
+    Convert Markdown text to IPYNB format in memory
+
+    Args:
+        md_text: Markdown text to convert
+        is_strip_wrapper: Whether to remove code block wrapper if present
+
+    Returns:
+        bytes: Content of the IPYNB file
+
     Raises:
         ValueError: If input processing fails
         Exception: If conversion fails
@@ -48,23 +65,12 @@ def convert_md_to_ipynb(md_text: str, output_path: Path, is_strip_wrapper: bool
 
     # Replace code block delimiters with ```code
     # inorder to separate code cells from Markdown cells
-    processed_md = _enforce_code_cells(processed_md)
-
-    with NamedTemporaryFile(suffix=".md", delete=False, mode="w", encoding="utf-8") as temp_md_file:
-        temp_md_file.write(processed_md)
-        temp_md_file_path = temp_md_file.name
-
-    try:
-        # Convert using pandoc_convert_file
-        pandoc_convert_file(
-            source_file=temp_md_file_path,
-            input_format="markdown",
-            dest_format="ipynb",
-            outputfile=str(output_path),
-            extra_args=[],
-        )
-    finally:
-        # Clean up temporary file
-        import os
-
-        os.unlink(temp_md_file_path)
+    processed_md = enforce_code_cells(processed_md)
+
+    # Convert to IPYNB - pipe markdown to pandoc and capture the notebook from stdout
+    return pandoc_convert_to_bytes(
+        source_text=processed_md,
+        input_format="markdown",
+        dest_format="ipynb",
+        extra_args=[],
+    )
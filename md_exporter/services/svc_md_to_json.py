@@ -3,62 +3,82 @@
 MdToJson service
 """
 
+import io
+import itertools
+from collections.abc import Iterable, Sequence
 from enum import StrEnum
 from pathlib import Path
+from typing import TextIO
 
+import pandas as pd
+
+from ..utils.json_utils import dumps_json, dumps_json_lines
 from ..utils.markdown_utils import get_md_text
-from ..utils.table_utils import parse_md_to_tables
+from ..utils.table_utils import (
+    iter_table_rows,
+    parse_md_to_tables,
+    replace_empty_cells_with_none,
+    write_md_tables_streaming,
+)
+
+# Number of rows serialized at a time
+JSON_BATCH_SIZE = 10_000
 
 
 class JsonOutputStyle(StrEnum):
+    # one object per line
     JSONL = "jsonl"
+    # all objects in a single array
     JSON_ARRAY = "json_array"
-
-
-def get_json_styles(output_style: str) -> tuple[int, bool]:
-    """
-    Get JSON format parameters
-    :return: indent, object_per_line
-    """
-    match output_style:
-        case JsonOutputStyle.JSON_ARRAY:
-            return 0, False
-        case JsonOutputStyle.JSONL:
-            return 0, True
-        case _:
-            return 0, True
+    # object of column names to arrays of values, e.g. {"a":[1,2],"b":[3,4]}
+    COLUMNS = "columns"
+    # object of column names and array of rows, e.g. {"columns":["a","b"],"data":[[1,3],[2,4]]}
+    SPLIT = "split"
 
 
 def convert_md_to_json(
-    md_text: str, output_path: Path, style: str = "jsonl", is_strip_wrapper: bool = False
+    md_text: str,
+    output_path: Path,
+    style: str = "jsonl",
+    is_strip_wrapper: bool = False,
+    streaming: bool = False,
+    force_text: bool = True,
 ) -> list[Path]:
     """
     Convert Markdown tables to JSON or JSONL format
+    Records are serialized with orjson if installed, or the standard json module otherwise,
+    and written to the output files row by row
     Args:
         md_text: Markdown text to convert
         output_path: Path to save the output JSON file
-        style: JSON output style (jsonl or json_array)
+        style: JSON output style (jsonl, json_array, columns or split),
+            columns and split styles don't repeat the column names in each row
         is_strip_wrapper: Whether to remove code block wrapper if present
+        streaming: Whether to write tables to files row by row, with memory bounded by a single row
+            instead of the table size, except for columns style holding the values of a table
+        force_text: Whether to keep cell values as text, otherwise columns are typed as booleans, numbers or dates
+            where possible, with empty cells as null and dates in ISO 8601 format, not applicable if streaming=True
     Returns:
         List of paths to the created JSON files
     Raises:
         ValueError: If input processing fails
         Exception: If conversion fails
     """
-    # Process Markdown text
-    # from md_exporter.utils.utils import get_md_text, parse_md_to_tables
-
     processed_md = get_md_text(md_text, is_strip_wrapper=is_strip_wrapper)
 
+    if streaming:
+        return write_md_tables_streaming(
+            processed_md,
+            output_path,
+            lambda f, columns, rows: write_json_table(f, columns, rows, style),
+        )
+
     # Parse Markdown tables
-    tables = parse_md_to_tables(processed_md)
+    tables = parse_md_to_tables(processed_md, force_value_to_str=force_text)
 
     # Convert to JSON
     created_files = []
     for i, table in enumerate(tables):
-        indent, object_per_line = get_json_styles(style)
-        json_str = table.to_json(index=False, orient="records", force_ascii=False, indent=indent, lines=object_per_line)
-
         # Determine output file name
         if len(tables) > 1:
             output_file = output_path.parent / f"{output_path.stem}_{i + 1}.json"
@@ -66,7 +86,77 @@ def convert_md_to_json(
             output_file = output_path
 
         # Write to file
-        output_file.write_text(json_str, encoding="utf-8")
+        with output_file.open("w", encoding="utf-8", newline="") as f:
+            _write_json_dataframe(f, table, style, force_text)
         created_files.append(output_file)
 
     return created_files
+
+
+def convert_md_to_json_bytes(
+    md_text: str, style: str = "jsonl", is_strip_wrapper: bool = False, force_text: bool = True
+) -> list[bytes]:
+    """
+    Convert Markdown tables to JSON or JSONL format in memory, one file per table
+    Args:
+        md_text: Markdown text to convert
+        style: JSON output style (jsonl, json_array, columns or split)
+        is_strip_wrapper: Whether to remove code block wrapper if present
+        force_text: Whether to keep cell values as text, otherwise columns are typed as booleans, numbers or dates
+            where possible, with empty cells as null and dates in ISO 8601 format
+    Returns:
+        List of contents of the JSON files in table order
+    Raises:
+        ValueError: If input processing fails
+        Exception: If conversion fails
+    """
+    processed_md = get_md_text(md_text, is_strip_wrapper=is_strip_wrapper)
+
+    # Parse Markdown tables
+    tables = parse_md_to_tables(processed_md, force_value_to_str=force_text)
+
+    # Convert to JSON
+    results = []
+    for table in tables:
+        with io.StringIO() as f:
+            _write_json_dataframe(f, table, style, force_text)
+            results.append(f.getvalue().encode("utf-8"))
+    return results
+
+
+def _write_json_dataframe(f: TextIO, table: pd.DataFrame, style: str, force_text: bool) -> None:
+    if not force_text:
+        table = replace_empty_cells_with_none(table)
+    write_json_table(f, list(table.columns), iter_table_rows(table), style)
+
+
+def write_json_table(f: TextIO, columns: list[str], rows: Iterable[Sequence], style: str = "jsonl") -> None:
+    """
+    Write a table to JSON file in batches of rows
+    jsonl and json_array styles are in the same format as DataFrame.to_json with records orientation
+    Args:
+        f: Opened text file
+        columns: Column names
+        rows: Iterable of rows
+        style: JSON output style (jsonl, json_array, columns or split)
+    """
+    if style == JsonOutputStyle.COLUMNS:
+        # values are collected by columns before writing
+        values = [list(column_values) for column_values in zip(*rows)] or [[] for _ in columns]
+        f.write(dumps_json(dict(zip(columns, values))))
+        return
+
+    rows = iter(rows)
+    match style:
+        case JsonOutputStyle.JSON_ARRAY | JsonOutputStyle.SPLIT:
+            f.write("[" if style == JsonOutputStyle.JSON_ARRAY else f'{{"columns":{dumps_json(columns)},"data":[')
+            is_first_batch = True
+            while batch := list(itertools.islice(rows, JSON_BATCH_SIZE)):
+                records = [dict(zip(columns, row)) for row in batch] if style == JsonOutputStyle.JSON_ARRAY else batch
+                # serialize the batch as array, and join the batches without the brackets
+                f.write(("" if is_first_batch else ",") + dumps_json(records)[1:-1])
+                is_first_batch = False
+            f.write("]" if style == JsonOutputStyle.JSON_ARRAY else "]}")
+        case _:
+            while batch := list(itertools.islice(rows, JSON_BATCH_SIZE)):
+                f.write(dumps_json_lines([dict(zip(columns, row)) for row in batch]))
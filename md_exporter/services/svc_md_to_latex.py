@@ -3,54 +3,216 @@
 MdToLatex service
 """
 
+import io
+import itertools
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager, contextmanager
 from pathlib import Path
+from typing import TextIO
 
+from ..utils.document_utils import MarkdownTable
+from ..utils.table_utils import get_column_names, iter_md_tables
 
-def convert_md_to_latex(md_text: str, output_path: Path, is_strip_wrapper: bool = False) -> list[Path]:
+LATEX_COLUMN_ALIGNMENTS = {"left": "l", "center": "c", "right": "r"}
+
+# Replacements of the characters having special meanings in LaTeX
+LATEX_ESCAPES = str.maketrans(
+    {
+        "\\": r"\textbackslash{}",
+        "&": r"\&",
+        "%": r"\%",
+        "$": r"\$",
+        "#": r"\#",
+        "_": r"\_",
+        "{": r"\{",
+        "}": r"\}",
+        "~": r"\textasciitilde{}",
+        "^": r"\textasciicircum{}",
+    }
+)
+
+# Number of rows joined and written at a time
+LATEX_BATCH_SIZE = 10_000
+
+
+def convert_md_to_latex(
+    md_text: str,
+    output_path: Path,
+    is_strip_wrapper: bool = False,
+    longtable: bool = False,
+    single_document: bool = False,
+) -> list[Path]:
     """
     Convert Markdown tables to LaTeX format
+    Rows are written to the files one batch at a time, without holding whole tables in memory
     Args:
         md_text: Markdown text to convert
         output_path: Path to save the output LaTeX file
         is_strip_wrapper: Whether to remove code block wrapper if present
+        longtable: Whether to use longtable environment for tables spanning multiple pages,
+            with the header row repeated on each page
+        single_document: Whether to put all tables into one document, each under a section titled with the
+            heading preceding the table, otherwise each table is written to a separate document
     Returns:
         List of paths to the created LaTeX files
     Raises:
-        ValueError: If input processing fails
+        ValueError: If input processing fails or no table is found
         Exception: If conversion fails
     """
-    # Process Markdown text
-    from ..utils.markdown_utils import get_md_text
-    from ..utils.table_utils import parse_md_to_tables
+    created_files: list[Path] = []
+
+    def open_document(index: int) -> TextIO:
+        output_file = output_path.parent / f"{output_path.stem}_{index}.tex"
+        created_files.append(output_file)
+        return output_file.open("w", encoding="utf-8", newline="")
+
+    _convert_md_to_latex_documents(md_text, open_document, is_strip_wrapper, longtable, single_document)
+
+    # Determine output file name
+    if len(created_files) == 1:
+        created_files = [created_files[0].replace(output_path)]
+    return created_files
+
+
+def convert_md_to_latex_bytes(
+    md_text: str, is_strip_wrapper: bool = False, longtable: bool = False, single_document: bool = False
+) -> list[bytes]:
+    """
+    Convert Markdown tables to LaTeX format in memory
+    Args:
+        md_text: Markdown text to convert
+        is_strip_wrapper: Whether to remove code block wrapper if present
+        longtable: Whether to use longtable environment for tables spanning multiple pages,
+            with the header row repeated on each page
+        single_document: Whether to put all tables into one document, otherwise one document per table
+    Returns:
+        List of contents of the LaTeX files, in table order if not single_document
+    Raises:
+        ValueError: If input processing fails or no table is found
+        Exception: If conversion fails
+    """
+    results: list[bytes] = []
+
+    @contextmanager
+    def open_document(index: int) -> Iterator[TextIO]:
+        with io.StringIO() as f:
+            yield f
+            results.append(f.getvalue().encode("utf-8"))
 
-    processed_md = get_md_text(md_text, is_strip_wrapper=is_strip_wrapper)
+    _convert_md_to_latex_documents(md_text, open_document, is_strip_wrapper, longtable, single_document)
+    return results
+
+
+def _convert_md_to_latex_documents(
+    md_text: str,
+    open_document: Callable[[int], AbstractContextManager[TextIO]],
+    is_strip_wrapper: bool,
+    longtable: bool,
+    single_document: bool,
+) -> None:
+    # Process Markdown text
+    from ..utils.markdown_utils import get_md_text, strip_markdown_wrapper
 
-    # Parse Markdown tables
-    tables = parse_md_to_tables(processed_md)
+    processed_md = strip_markdown_wrapper(get_md_text(md_text, is_strip_wrapper=is_strip_wrapper))
 
     # Convert to LaTeX
-    created_files = []
-    for i, table in enumerate(tables):
-        table_latex_str = table.to_latex(index=False, bold_rows=True)
-        doc_latex_str = (
-            "\\documentclass[]{article}\n"
-            + "\\usepackage{booktabs}\n"
-            + "\\begin{document}\n"
-            + "\n"
-            + table_latex_str
-            + "\n"
-            + "\\end{document}\n"
+    tables = _iter_non_empty_tables(processed_md)
+    first_table = next(tables, None)
+    if first_table is None:
+        raise ValueError("No available tables parsed from markdown text")
+
+    if single_document:
+        with open_document(1) as f:
+            write_latex_document(f, itertools.chain([first_table], tables), longtable, with_sections=True)
+    else:
+        for i, table in enumerate(itertools.chain([first_table], tables)):
+            with open_document(i + 1) as f:
+                write_latex_document(f, [table], longtable)
+
+
+def _iter_non_empty_tables(md_text: str) -> Iterator[MarkdownTable]:
+    """Iterate over tables with at least one row, with the rows read lazily"""
+    for table in iter_md_tables(md_text):
+        first_row = next(table.rows, None)
+        if first_row is not None:
+            table.rows = itertools.chain([first_row], table.rows)
+            yield table
+
+
+def write_latex_document(
+    f: TextIO, tables: Iterable[MarkdownTable], longtable: bool = False, with_sections: bool = False
+) -> None:
+    """
+    Write LaTeX document of tables, in booktabs style
+    Args:
+        f: Opened text file
+        tables: Tables to write
+        longtable: Whether to use longtable environment instead of tabular
+        with_sections: Whether to put each table under an unnumbered section titled with the heading preceding it
+    """
+    f.write("\\documentclass[]{article}\n\\usepackage{booktabs}\n")
+    if longtable:
+        f.write("\\usepackage{longtable}\n")
+    f.write("\\begin{document}\n\n")
+    for table in tables:
+        if with_sections and table.heading:
+            f.write(f"\\section*{{{escape_latex(table.heading)}}}\n\n")
+        write_latex_table(f, get_column_names(table.header), table.rows, table.alignments, longtable)
+        f.write("\n")
+    f.write("\\end{document}\n")
+
+
+def write_latex_table(
+    f: TextIO,
+    columns: list[str],
+    rows: Iterable[list[str]],
+    alignments: list[str | None] | None = None,
+    longtable: bool = False,
+) -> None:
+    """
+    Write a table in LaTeX tabular or longtable environment, with cell values escaped
+    Args:
+        f: Opened text file
+        columns: Column names
+        rows: Iterable of rows of text cells
+        alignments: Alignment of each column, "left", "center", "right" or None for left alignment
+        longtable: Whether to use longtable environment for tables spanning multiple pages,
+            with the header row repeated on each page
+    """
+    environment = "longtable" if longtable else "tabular"
+    header = f"\\toprule\n{_format_latex_row(columns)}\\midrule\n"
+    f.write(f"\\begin{{{environment}}}{{{get_column_format(alignments or [None] * len(columns))}}}\n")
+    f.write(header)
+    if longtable:
+        f.write(
+            f"\\endfirsthead\n{header}\\endhead\n"
+            f"\\midrule\n\\multicolumn{{{len(columns)}}}{{r}}{{Continued on next page}} \\\\\n\\midrule\n\\endfoot\n"
+            "\\bottomrule\n\\endlastfoot\n"
         )
-        result_file_bytes = doc_latex_str.encode("utf-8")
 
-        # Determine output file name
-        if len(tables) > 1:
-            output_file = output_path.parent / f"{output_path.stem}_{i + 1}.tex"
-        else:
-            output_file = output_path
+    rows = iter(rows)
+    while batch := list(itertools.islice(rows, LATEX_BATCH_SIZE)):
+        f.write("".join(map(_format_latex_row, batch)))
 
-        # Write to file
-        output_file.write_bytes(result_file_bytes)
-        created_files.append(output_file)
+    if not longtable:
+        f.write("\\bottomrule\n")
+    f.write(f"\\end{{{environment}}}\n")
 
-    return created_files
+
+def _format_latex_row(cells: list[str]) -> str:
+    return " & ".join([cell.translate(LATEX_ESCAPES) for cell in cells]) + " \\\\\n"
+
+
+def escape_latex(text: str) -> str:
+    """Escape characters having special meanings in LaTeX"""
+    return text.translate(LATEX_ESCAPES)
+
+
+def get_column_format(alignments: list[str | None]) -> str:
+    """
+    Get LaTeX column format from the column alignments of Markdown table
+    Columns without alignment are left aligned
+    Returns:
+        Column format, e.g. "lcr"
+    """
+    return "".join(LATEX_COLUMN_ALIGNMENTS.get(alignment or "", "l") for alignment in alignments)
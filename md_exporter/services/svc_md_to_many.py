@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+MdToMany service
+Converts Markdown text to multiple formats at once, sharing the intermediate artifacts across formats
+"""
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from ..utils.logger_utils import get_logger
+from ..utils.markdown_utils import get_md_text, render_markdown
+from ..utils.pandoc_utils import get_pandoc_ast, pandoc_convert_to_bytes
+
+logger = get_logger(__name__)
+
+# Supported target formats and their file extensions
+SUPPORTED_TARGETS = {
+    "docx": ".docx",
+    "html": ".html",
+    "ipynb": ".ipynb",
+    "md": ".md",
+    "pdf": ".pdf",
+    "png": ".png",
+    "pptx": ".pptx",
+    "xml": ".xml",
+}
+
+# Target formats converted by pandoc from the Markdown text with the default extensions
+PANDOC_AST_TARGETS = {"docx", "pptx"}
+
+
+class SharedArtifacts:
+    """
+    Intermediate artifacts of a Markdown text, computed once on first use and shared across target formats
+    Safe to be used from multiple threads, each artifact is computed by the first thread asking for it
+    """
+
+    def __init__(self, processed_md: str, is_pandoc_ast_shared: bool = False):
+        self.processed_md = processed_md
+        # whether to read the Markdown text into pandoc JSON AST once for the pandoc conversions
+        self.is_pandoc_ast_shared = is_pandoc_ast_shared
+        self._values: dict[str, Any] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    def _get(self, key: str, factory: Callable[[], Any]) -> Any:
+        with self._locks_lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            if key not in self._values:
+                self._values[key] = factory()
+            return self._values[key]
+
+    def markdown_html(self) -> str:
+        """HTML rendered by python-markdown"""
+        return self._get("markdown_html", lambda: render_markdown(self.processed_md))
+
+    def pandoc_ast(self) -> str:
+        """Pandoc JSON AST read with the default Markdown extensions"""
+        return self._get("pandoc_ast", lambda: get_pandoc_ast(self.processed_md))
+
+    def pdf_bytes(self) -> bytes:
+        """PDF rendered from the python-markdown HTML"""
+        from .svc_md_to_pdf import convert_processed_md_to_pdf_bytes
+
+        return self._get("pdf_bytes", lambda: convert_processed_md_to_pdf_bytes(self.processed_md))
+
+
+def _convert_pandoc(artifacts: SharedArtifacts, dest_format: str, extra_args: list[str] | None = None) -> bytes:
+    if artifacts.is_pandoc_ast_shared:
+        return pandoc_convert_to_bytes(
+            source_text=artifacts.pandoc_ast(),
+            input_format="json",
+            dest_format=dest_format,
+            extra_args=extra_args,
+            disabled_input_extensions=[],
+        )
+    return pandoc_convert_to_bytes(
+        source_text=artifacts.processed_md,
+        input_format="markdown",
+        dest_format=dest_format,
+        extra_args=extra_args,
+    )
+
+
+def _export_docx(artifacts: SharedArtifacts, output_file: Path) -> list[Path]:
+    from .svc_md_to_docx import get_pandoc_extra_args
+
+    output_file.write_bytes(_convert_pandoc(artifacts, "docx", get_pandoc_extra_args()))
+    return [output_file]
+
+
+def _export_pptx(artifacts: SharedArtifacts, output_file: Path) -> list[Path]:
+    from .svc_md_to_pptx import get_pandoc_extra_args
+
+    output_file.write_bytes(_convert_pandoc(artifacts, "pptx", get_pandoc_extra_args()))
+    return [output_file]
+
+
+def _export_html(artifacts: SharedArtifacts, output_file: Path) -> list[Path]:
+    # the HTML service parses Markdown with all pandoc extensions enabled
+    result = pandoc_convert_to_bytes(
+        source_text=artifacts.processed_md,
+        input_format="markdown",
+        dest_format="html",
+        disabled_input_extensions=[],
+    )
+    output_file.write_bytes(result)
+    return [output_file]
+
+
+def _export_ipynb(artifacts: SharedArtifacts, output_file: Path) -> list[Path]:
+    from .svc_md_to_ipynb import enforce_code_cells
+
+    result = pandoc_convert_to_bytes(
+        source_text=enforce_code_cells(artifacts.processed_md),
+        input_format="markdown",
+        dest_format="ipynb",
+    )
+    output_file.write_bytes(result)
+    return [output_file]
+
+
+def _export_md(artifacts: SharedArtifacts, output_file: Path) -> list[Path]:
+    output_file.write_text(artifacts.processed_md, encoding="utf-8")
+    return [output_file]
+
+
+def _export_pdf(artifacts: SharedArtifacts, output_file: Path) -> list[Path]:
+    output_file.write_bytes(artifacts.pdf_bytes())
+    return [output_file]
+
+
+def _export_png(artifacts: SharedArtifacts, output_file: Path) -> list[Path]:
+    from .svc_md_to_png import convert_pdf_to_png_images, save_png_images
+
+    return save_png_images(convert_pdf_to_png_images(artifacts.pdf_bytes()), output_file)
+
+
+def _export_xml(artifacts: SharedArtifacts, output_file: Path) -> list[Path]:
+    from .svc_md_to_xml import convert_html_to_xml_bytes
+
+    output_file.write_bytes(convert_html_to_xml_bytes(artifacts.markdown_html()))
+    return [output_file]
+
+
+EXPORTERS: dict[str, Callable[[SharedArtifacts, Path], list[Path]]] = {
+    "docx": _export_docx,
+    "html": _export_html,
+    "ipynb": _export_ipynb,
+    "md": _export_md,
+    "pdf": _export_pdf,
+    "png": _export_png,
+    "pptx": _export_pptx,
+    "xml": _export_xml,
+}
+
+
+def parse_targets(targets: str | list[str]) -> list[str]:
+    """
+    Parse and validate target formats
+    Args:
+        targets: Target formats, as list or comma separated string, e.g. "docx,pdf,html"
+    Returns:
+        List of distinct target formats in the given order
+    Raises:
+        ValueError: If no target or unsupported target is specified
+    """
+    if isinstance(targets, str):
+        targets = targets.split(",")
+    result = []
+    for target in targets:
+        target = target.strip().lower().lstrip(".")
+        if not target or target in result:
+            continue
+        if target not in SUPPORTED_TARGETS:
+            raise ValueError(
+                f"Unsupported target format: {target}, supported formats: {', '.join(sorted(SUPPORTED_TARGETS))}"
+            )
+        result.append(target)
+    if not result:
+        raise ValueError("No target format specified")
+    return result
+
+
+def get_output_file(output_path: Path, target: str) -> Path:
+    """
+    Get output file path of the target format, by replacing or appending the file extension
+    e.g. `report` or `report.docx` -> `report.pdf`
+    """
+    extension = SUPPORTED_TARGETS[target]
+    if output_path.suffix.lower() in SUPPORTED_TARGETS.values():
+        return output_path.with_suffix(extension)
+    return output_path.parent / f"{output_path.name}{extension}"
+
+
+def convert_md_to_many(
+    md_text: str,
+    output_path: Path,
+    targets: str | list[str],
+    is_strip_wrapper: bool = False,
+    max_workers: int | None = None,
+) -> dict[str, list[Path]]:
+    """
+    Convert Markdown text to multiple formats at once
+    The Markdown text is processed once, and the intermediate artifacts (python-markdown HTML, pandoc JSON AST
+    if read by several targets, PDF for PNG) are shared across the target formats, which are converted concurrently
+    Args:
+        md_text: Markdown text to convert
+        output_path: Base path of output files, the file extension of each target format is applied
+        targets: Target formats, as list or comma separated string, e.g. "docx,pdf,html"
+        is_strip_wrapper: Whether to remove code block wrapper if present
+        max_workers: Maximum number of target formats converted concurrently, defaults to the number of targets
+    Returns:
+        Dict of target format to list of paths to the created files
+    Raises:
+        ValueError: If input processing fails or target format is not supported
+        Exception: If conversion fails
+    """
+    target_list = parse_targets(targets)
+
+    # Process Markdown text once for all targets
+    processed_md = get_md_text(md_text, is_strip_wrapper=is_strip_wrapper)
+    artifacts = SharedArtifacts(
+        processed_md, is_pandoc_ast_shared=len(PANDOC_AST_TARGETS.intersection(target_list)) > 1
+    )
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=max_workers or len(target_list)) as executor:
+        futures = {
+            target: executor.submit(EXPORTERS[target], artifacts, get_output_file(output_path, target))
+            for target in target_list
+        }
+
+    results = {}
+    errors = []
+    for target, future in futures.items():
+        try:
+            results[target] = future.result()
+        except Exception as e:
+            logger.exception(f"Failed to convert Markdown to {target}")
+            errors.append(f"{target}: {e}")
+    if errors:
+        raise Exception(f"Failed to convert Markdown to {len(errors)} format(s): {'; '.join(errors)}")
+    return results
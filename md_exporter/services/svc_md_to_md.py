@@ -19,14 +19,29 @@ def convert_md_to_md(md_text: str, output_path: Path, is_strip_wrapper: bool = F
         ValueError: If input processing fails
         Exception: If conversion fails
     """
-    # Process Markdown text
-    from ..utils.markdown_utils import get_md_text
-
-    processed_md = get_md_text(md_text, is_strip_wrapper=is_strip_wrapper)
+    result_file_bytes = convert_md_to_md_bytes(md_text, is_strip_wrapper)
 
     # Write to output file
     try:
-        output_path.write_text(processed_md, encoding="utf-8")
+        output_path.write_bytes(result_file_bytes)
         return output_path
     except Exception as e:
         raise Exception(f"Failed to save MD file: {e}")
+
+
+def convert_md_to_md_bytes(md_text: str, is_strip_wrapper: bool = False) -> bytes:
+    """
+    Convert Markdown text to .md file content in memory
+    Args:
+        md_text: Markdown text to convert
+        is_strip_wrapper: Whether to remove code block wrapper if present
+    Returns:
+        Content of the MD file
+    Raises:
+        ValueError: If input processing fails
+    """
+    # Process Markdown text
+    from ..utils.markdown_utils import get_md_text
+
+    processed_md = get_md_text(md_text, is_strip_wrapper=is_strip_wrapper)
+    return processed_md.encode("utf-8")
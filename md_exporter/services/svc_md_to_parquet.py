@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Markdown to Parquet conversion service
+Provides common functionality for converting Markdown tables to Apache Parquet format
+"""
+
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ..utils.arrow_utils import write_arrow_tables, write_arrow_tables_to_bytes
+from ..utils.markdown_utils import get_md_text
+
+
+def convert_md_to_parquet(
+    md_text: str, output_path: Path, is_strip_wrapper: bool = False, force_text: bool = True
+) -> list[Path]:
+    """
+    Convert Markdown tables to Parquet format, one file per table
+    The heading preceding each table is stored as table name in the schema metadata
+
+    Args:
+        md_text: Markdown text to convert
+        output_path: Path to save the output Parquet file(s)
+        is_strip_wrapper: Whether to remove code block wrapper if present
+        force_text: Whether to keep cell values as text, otherwise columns are typed as booleans, numbers or dates
+            where possible
+
+    Returns:
+        List[Path]: List of paths to the created Parquet files
+
+    Raises:
+        ValueError: If input processing or table parsing fails
+    """
+    # Process Markdown text
+    processed_md = get_md_text(md_text, is_strip_wrapper=is_strip_wrapper)
+
+    # Convert to Parquet
+    return write_arrow_tables(processed_md, output_path, write_parquet_table, force_text=force_text)
+
+
+def convert_md_to_parquet_bytes(md_text: str, is_strip_wrapper: bool = False, force_text: bool = True) -> list[bytes]:
+    """
+    Convert Markdown tables to Parquet format in memory, one file per table
+
+    Args:
+        md_text: Markdown text to convert
+        is_strip_wrapper: Whether to remove code block wrapper if present
+        force_text: Whether to keep cell values as text, otherwise columns are typed as booleans, numbers or dates
+            where possible
+
+    Returns:
+        List[bytes]: List of contents of the Parquet files in table order
+
+    Raises:
+        ValueError: If input processing or table parsing fails
+    """
+    # Process Markdown text
+    processed_md = get_md_text(md_text, is_strip_wrapper=is_strip_wrapper)
+
+    # Convert to Parquet
+    return write_arrow_tables_to_bytes(processed_md, write_parquet_table, force_text=force_text)
+
+
+def write_parquet_table(table: pa.Table, output_file: Path | pa.NativeFile) -> None:
+    """
+    Write an Arrow table to Parquet file
+
+    Args:
+        table: Arrow table
+        output_file: Path of the output file or Arrow output stream
+    """
+    pq.write_table(table, output_file)
@@ -4,27 +4,97 @@ Markdown to PDF conversion service
 Provides common functionality for converting Markdown to PDF format
 """
 
+import io
+import math
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from enum import StrEnum
 from pathlib import Path
 
-from ..utils.markdown_utils import convert_markdown_to_html, get_md_text
+from ..utils.logger_utils import get_logger
+from ..utils.markdown_utils import convert_markdown_to_html, get_md_text, split_markdown_at_top_level_headings
 from ..utils.text_utils import contains_chinese, contains_japanese
 
+logger = get_logger(__name__)
 
-def convert_to_html_with_font_support(md_text: str) -> str:
+# Buffer size of xhtml2pdf before spooling to temporary file
+PISA_CAPACITY = 500 * 1024 * 1024
+
+# Page layout of the PyMuPDF engine, A4 paper with margins in points
+PYMUPDF_PAPER_SIZE = "a4"
+PYMUPDF_PAGE_MARGIN = 36
+
+# Size in bytes of Markdown text, above which the PDF is rendered in chunks in parallel
+# Set by environment variable MD_EXPORTER_PDF_PARALLEL_THRESHOLD, and parallel rendering is disabled if set to 0
+# Disabled by default, as each chunk starts on a new page
+PDF_PARALLEL_THRESHOLD_ENV = "MD_EXPORTER_PDF_PARALLEL_THRESHOLD"
+DEFAULT_PDF_PARALLEL_THRESHOLD = 0
+
+# Max number of processes rendering the chunks, defaults to the number of CPUs
+PDF_PARALLEL_WORKERS_ENV = "MD_EXPORTER_PDF_PARALLEL_WORKERS"
+
+# File name of the builtin CJK font (Droid Sans Fallback) of PyMuPDF, referenced by @font-face in HTML
+PYMUPDF_CJK_FONT_FILE = "pymupdf-cjk.ttf"
+
+
+class PdfEngine(StrEnum):
+    XHTML2PDF = "xhtml2pdf"
+    PYMUPDF = "pymupdf"
+
+
+def convert_to_html_with_font_support(
+    md_text: str, html_str: str | None = None, engine: str = PdfEngine.XHTML2PDF
+) -> str:
     """
     Convert Markdown to HTML and add Chinese/Japanese font support
 
     Args:
         md_text: Markdown text to convert
+        html_str: Optional HTML already converted from the Markdown text, to skip converting again
+        engine: PDF engine to render the HTML with, either "xhtml2pdf" or "pymupdf"
 
     Returns:
         str: HTML string with appropriate font support
     """
-    html_str = convert_markdown_to_html(md_text)
+    if html_str is None:
+        html_str = convert_markdown_to_html(md_text)
 
     if not contains_chinese(md_text) and not contains_japanese(md_text):
         return html_str
 
+    return add_cjk_font_css(html_str, engine)
+
+
+def add_cjk_font_css(html_str: str, engine: str = PdfEngine.XHTML2PDF) -> str:
+    """
+    Add Chinese/Japanese font CSS for the PDF engine to HTML
+
+    Args:
+        html_str: HTML string
+        engine: PDF engine to render the HTML with, either "xhtml2pdf" or "pymupdf"
+
+    Returns:
+        str: HTML string with the font CSS
+    """
+    if engine == PdfEngine.PYMUPDF:
+        # Use the CJK font builtin to PyMuPDF for the glyphs missing in the default sans-serif font
+        css_style = f"""
+    <style>
+        @font-face {{
+            font-family: cjk;
+            src: url({PYMUPDF_CJK_FONT_FILE});
+        }}
+        html {{
+            font-family: sans-serif, cjk;
+        }}
+    </style>
+    """
+        return f"""
+    {css_style}
+    {html_str}
+    """
+
     # Add Chinese/Japanese font CSS
     font_families = ",".join(
         [
@@ -50,7 +120,13 @@ def convert_to_html_with_font_support(md_text: str) -> str:
     return result
 
 
-def convert_md_to_pdf(md_text: str, output_path: Path, is_strip_wrapper: bool = False) -> None:
+def convert_md_to_pdf(
+    md_text: str,
+    output_path: Path,
+    is_strip_wrapper: bool = False,
+    engine: str = PdfEngine.XHTML2PDF,
+    parallel: bool | None = None,
+) -> None:
     """
     Convert Markdown text to PDF format
 
@@ -58,6 +134,41 @@ def convert_md_to_pdf(md_text: str, output_path: Path, is_strip_wrapper: bool =
         md_text: Markdown text to convert
         output_path: Path to save the output PDF file
         is_strip_wrapper: Whether to remove code block wrapper if present
+        engine: PDF engine, either "xhtml2pdf" (default) or "pymupdf"
+        parallel: Whether to render chunks split at top-level headings in parallel, each starting on a new page,
+            defaults to enabled only if MD_EXPORTER_PDF_PARALLEL_THRESHOLD is set and the Markdown text is larger
+
+    Raises:
+        ValueError: If input processing fails
+        Exception: If conversion fails
+    """
+    # Convert to PDF
+    result_file_bytes = convert_md_to_pdf_bytes(
+        md_text, is_strip_wrapper=is_strip_wrapper, engine=engine, parallel=parallel
+    )
+
+    # Write to file
+    output_path.write_bytes(result_file_bytes)
+
+
+def convert_md_to_pdf_bytes(
+    md_text: str,
+    is_strip_wrapper: bool = False,
+    engine: str = PdfEngine.XHTML2PDF,
+    parallel: bool | None = None,
+) -> bytes:
+    """
+    Convert Markdown text to PDF format in memory
+
+    Args:
+        md_text: Markdown text to convert
+        is_strip_wrapper: Whether to remove code block wrapper if present
+        engine: PDF engine, either "xhtml2pdf" (default) or "pymupdf"
+        parallel: Whether to render chunks split at top-level headings in parallel, each starting on a new page,
+            defaults to enabled only if MD_EXPORTER_PDF_PARALLEL_THRESHOLD is set and the Markdown text is larger
+
+    Returns:
+        bytes: Content of the PDF file
 
     Raises:
         ValueError: If input processing fails
@@ -66,18 +177,208 @@ def convert_md_to_pdf(md_text: str, output_path: Path, is_strip_wrapper: bool =
     # Process Markdown text
     processed_md = get_md_text(md_text, is_strip_wrapper=is_strip_wrapper)
 
+    return convert_processed_md_to_pdf_bytes(processed_md, engine=engine, parallel=parallel)
+
+
+def convert_processed_md_to_pdf_bytes(
+    processed_md: str, engine: str = PdfEngine.XHTML2PDF, parallel: bool | None = None
+) -> bytes:
+    """
+    Convert Markdown text already processed by get_md_text to PDF, e.g. shared by other exporters
+
+    Args:
+        processed_md: Processed Markdown text
+        engine: PDF engine, either "xhtml2pdf" (default) or "pymupdf"
+        parallel: Whether to render chunks split at top-level headings in parallel, each starting on a new page,
+            defaults to enabled only if MD_EXPORTER_PDF_PARALLEL_THRESHOLD is set and the Markdown text is larger
+
+    Returns:
+        bytes: Content of the PDF file
+    """
+    if parallel is None:
+        threshold = int(os.environ.get(PDF_PARALLEL_THRESHOLD_ENV, DEFAULT_PDF_PARALLEL_THRESHOLD))
+        parallel = 0 < threshold < len(processed_md.encode("utf-8"))
+
+    if parallel:
+        chunks = _split_into_chunks(processed_md, _get_parallel_workers())
+        if len(chunks) > 1:
+            return _convert_chunks_to_pdf_bytes(chunks, processed_md, engine)
+
     # Convert to HTML with font support
-    html_str = convert_to_html_with_font_support(processed_md)
+    html_str = convert_to_html_with_font_support(processed_md, engine=engine)
+    return convert_html_to_pdf_bytes(html_str, engine=engine)
+
+
+def _get_parallel_workers() -> int:
+    return max(int(os.environ.get(PDF_PARALLEL_WORKERS_ENV, 0)) or os.cpu_count() or 1, 1)
+
+
+def _split_into_chunks(processed_md: str, chunk_count: int) -> list[str]:
+    """Split Markdown text at top-level headings, and group the sections into chunks of similar size"""
+    sections = split_markdown_at_top_level_headings(processed_md)
+    target_size = math.ceil(len(processed_md) / chunk_count)
+    chunks = []
+    current = []
+    current_size = 0
+    for section in sections:
+        if current and current_size + len(section) > target_size:
+            chunks.append("".join(current))
+            current = []
+            current_size = 0
+        current.append(section)
+        current_size += len(section)
+    if current:
+        chunks.append("".join(current))
+    return chunks
+
+
+def _convert_chunks_to_pdf_bytes(chunks: list[str], processed_md: str, engine: str) -> bytes:
+    """Render chunks to PDF in a process pool, and merge them in order"""
+    # use the same fonts for all chunks, as decided by the whole text
+    is_cjk = contains_chinese(processed_md) or contains_japanese(processed_md)
+    workers = min(_get_parallel_workers(), len(chunks))
+    logger.debug(f"Rendering PDF in {len(chunks)} chunks with {workers} processes")
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pdf_bytes_list = list(
+                executor.map(_convert_chunk_to_pdf_bytes, chunks, [is_cjk] * len(chunks), [engine] * len(chunks))
+            )
+    except (OSError, RuntimeError) as e:
+        # e.g. process creation not permitted or broken process pool
+        logger.warning(f"Failed to render PDF chunks in parallel, falling back to sequential rendering: {e}")
+        pdf_bytes_list = [_convert_chunk_to_pdf_bytes(chunk, is_cjk, engine) for chunk in chunks]
+    return merge_pdf_bytes(pdf_bytes_list)
+
+
+def _convert_chunk_to_pdf_bytes(chunk: str, is_cjk: bool, engine: str) -> bytes:
+    html_str = convert_markdown_to_html(chunk)
+    if is_cjk:
+        html_str = add_cjk_font_css(html_str, engine)
+    return convert_html_to_pdf_bytes(html_str, engine=engine)
+
+
+def merge_pdf_bytes(pdf_bytes_list: list[bytes]) -> bytes:
+    """
+    Merge PDF files in order, with the outlines joined and their page numbers shifted accordingly
+
+    Args:
+        pdf_bytes_list: Contents of the PDF files in order
+
+    Returns:
+        bytes: Content of the merged PDF file
+    """
+    import pymupdf
+
+    merged = pymupdf.open()
+    headings = []
+    for pdf_bytes in pdf_bytes_list:
+        with pymupdf.open(stream=pdf_bytes, filetype="pdf") as doc:
+            page_offset = merged.page_count
+            headings.extend((level, title, page_num + page_offset) for level, title, page_num in doc.get_toc())
+            merged.insert_pdf(doc)
+    merged.set_toc(_build_toc(headings))
+    return merged.tobytes(garbage=3, deflate=True)
+
+
+def convert_html_to_pdf_bytes(html_str: str, engine: str = PdfEngine.XHTML2PDF) -> bytes:
+    """
+    Convert HTML to PDF with the selected engine
+
+    Args:
+        html_str: HTML string to convert
+        engine: PDF engine, either "xhtml2pdf" (default) or "pymupdf"
+
+    Returns:
+        bytes: Content of the PDF file
+
+    Raises:
+        ValueError: If the engine is not supported
+    """
+    if engine == PdfEngine.XHTML2PDF:
+        return convert_html_to_pdf_bytes_with_xhtml2pdf(html_str)
+    if engine == PdfEngine.PYMUPDF:
+        return convert_html_to_pdf_bytes_with_pymupdf(html_str)
+    raise ValueError(f"Unsupported PDF engine: {engine}, supported engines: {', '.join(PdfEngine)}")
+
+
+def convert_html_to_pdf_bytes_with_xhtml2pdf(html_str: str) -> bytes:
+    """
+    Convert HTML to PDF with xhtml2pdf
+
+    Args:
+        html_str: HTML string to convert
 
-    # Convert to PDF - import pisa here to avoid slow startup
+    Returns:
+        bytes: Content of the PDF file
+    """
+    # import pisa here to avoid slow startup
     from xhtml2pdf import pisa
 
-    result_file_bytes = pisa.CreatePDF(
+    return pisa.CreatePDF(
         src=html_str,
         dest_bytes=True,
         encoding="utf-8",
-        capacity=400 * 1024 * 1024,
+        capacity=PISA_CAPACITY,
     )
 
-    # Write to file
-    output_path.write_bytes(result_file_bytes)
+
+def convert_html_to_pdf_bytes_with_pymupdf(html_str: str) -> bytes:
+    """
+    Convert HTML to PDF with the layout engine of MuPDF (pymupdf.Story), without buffering the whole document in Python
+    The outline of the PDF is generated from the headings, as xhtml2pdf does
+
+    Args:
+        html_str: HTML string to convert
+
+    Returns:
+        bytes: Content of the PDF file
+    """
+    # import pymupdf here to avoid slow startup
+    import pymupdf
+
+    is_cjk_font_used = PYMUPDF_CJK_FONT_FILE in html_str
+    archive = pymupdf.Archive()
+    if is_cjk_font_used:
+        archive.add(pymupdf.Font("cjk").buffer, PYMUPDF_CJK_FONT_FILE)
+
+    # MuPDF applies only the style sheets preceding the content, so pass all of them as user CSS
+    user_css = "\n".join(re.findall(r"<style>(.*?)</style>", html_str, flags=re.DOTALL))
+    story = pymupdf.Story(html=html_str, user_css=user_css, archive=archive)
+    mediabox = pymupdf.paper_rect(PYMUPDF_PAPER_SIZE)
+    where = mediabox + (PYMUPDF_PAGE_MARGIN, PYMUPDF_PAGE_MARGIN, -PYMUPDF_PAGE_MARGIN, -PYMUPDF_PAGE_MARGIN)
+
+    headings = []
+
+    def record_heading(position) -> None:
+        if position.heading and (position.open_close & 1) and position.text:
+            headings.append((position.heading, position.text.strip(), position.page_num))
+
+    buffer = io.BytesIO()
+    writer = pymupdf.DocumentWriter(buffer)
+    page_num = 0
+    more = True
+    while more:
+        page_num += 1
+        device = writer.begin_page(mediabox)
+        more, _ = story.place(where)
+        story.element_positions(record_heading, {"page_num": page_num})
+        story.draw(device)
+        writer.end_page()
+    writer.close()
+
+    doc = pymupdf.open(stream=buffer.getvalue(), filetype="pdf")
+    doc.set_toc(_build_toc(headings))
+    # embed only the glyphs used instead of the whole fonts
+    doc.subset_fonts()
+    return doc.tobytes(garbage=3, deflate=True)
+
+
+def _build_toc(headings: list[tuple[int, str, int]]) -> list[list]:
+    """Build PDF outline from headings of (level, title, page number), closing the gaps of skipped heading levels"""
+    toc = []
+    last_level = 0
+    for level, title, page_num in headings:
+        level = min(level, last_level + 1)
+        toc.append([level, title, page_num])
+        last_level = level
+    return toc
@@ -3,53 +3,30 @@
 MdToPng service
 """
 
-import io
-import zipfile
+import math
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 
 from ..utils.logger_utils import get_logger
-from ..utils.markdown_utils import convert_markdown_to_html
-from ..utils.text_utils import contains_chinese, contains_japanese
+from ..utils.zip_utils import write_zip, zip_to_bytes
+from .svc_md_to_pdf import PdfEngine, convert_processed_md_to_pdf_bytes
 
 logger = get_logger(__name__)
 
-
-def convert_to_html_with_font_support(md_text: str) -> str:
-    """Convert Markdown to HTML with Chinese font support"""
-
-    html_str = convert_markdown_to_html(md_text)
-
-    if not contains_chinese(md_text) and not contains_japanese(md_text):
-        return html_str
-
-    # Add Chinese font CSS
-    font_families = ",".join(
-        [
-            "Sans-serif",
-            "STSong-Light",
-            "MSung-Light",
-            "HeiseiMin-W3",
-        ]
-    )
-    css_style = f"""
-    <style>
-        html {{
-            -pdf-word-wrap: CJK;
-            font-family: "{font_families}"; 
-        }}
-    </style>
-    """
-
-    result = f"""
-    {css_style}
-    {html_str}
-    """
-    return result
+# Resolution of PNG images, 144 DPI is 2x zoom of the 72 DPI of PDF
+DEFAULT_PNG_DPI = 144
 
 
 def convert_md_to_png(
-    md_text: str, output_path: Path, compress: bool = False, is_strip_wrapper: bool = False
+    md_text: str,
+    output_path: Path,
+    compress: bool = False,
+    is_strip_wrapper: bool = False,
+    engine: str = PdfEngine.XHTML2PDF,
+    workers: int = 1,
+    dpi: int = DEFAULT_PNG_DPI,
+    pages: str | None = None,
 ) -> list[Path]:
     """
     Convert Markdown text to PNG images
@@ -58,6 +35,10 @@ def convert_md_to_png(
         output_path: Path to save the output PNG files or ZIP file
         compress: Whether to compress all PNG images into a ZIP file
         is_strip_wrapper: Whether to remove code block wrapper if present
+        engine: PDF engine to render the pages with, either "xhtml2pdf" (default) or "pymupdf"
+        workers: Number of processes rasterizing the pages in parallel, defaults to 1
+        dpi: Resolution of the PNG images, defaults to 144
+        pages: Page numbers or ranges to convert, e.g. "1", "1-3,5" or "2-", defaults to all pages
     Returns:
         List of paths to the created files
     Raises:
@@ -69,88 +50,217 @@ def convert_md_to_png(
 
     processed_md = get_md_text(md_text, is_strip_wrapper=is_strip_wrapper)
 
-    output_filename = output_path.stem if output_path.suffix else "output"
-    created_files = []
-    images_for_zip = []
+    try:
+        # Convert to PDF
+        pdf_bytes = convert_processed_md_to_pdf_bytes(processed_md, engine=engine)
+
+        # Convert PDF pages to PNG images
+        page_numbers = get_png_page_numbers(pdf_bytes, pages)
+        images = convert_pdf_to_png_images(pdf_bytes, workers=workers, dpi=dpi, page_numbers=page_numbers)
+
+        return save_png_images(images, output_path, compress, page_numbers)
+    except Exception as e:
+        raise Exception(f"Failed to convert to PNG: {e}")
+
+
+def convert_md_to_png_bytes(
+    md_text: str,
+    compress: bool = False,
+    is_strip_wrapper: bool = False,
+    engine: str = PdfEngine.XHTML2PDF,
+    workers: int = 1,
+    dpi: int = DEFAULT_PNG_DPI,
+    pages: str | None = None,
+) -> list[tuple[str, bytes]]:
+    """
+    Convert Markdown text to PNG images in memory
+    Args:
+        md_text: Markdown text to convert
+        compress: Whether to compress all PNG images into a ZIP file
+        is_strip_wrapper: Whether to remove code block wrapper if present
+        engine: PDF engine to render the pages with, either "xhtml2pdf" (default) or "pymupdf"
+        workers: Number of processes rasterizing the pages in parallel, defaults to 1
+        dpi: Resolution of the PNG images, defaults to 144
+        pages: Page numbers or ranges to convert, e.g. "1", "1-3,5" or "2-", defaults to all pages
+    Returns:
+        List of (file name, content) pairs, either a single "images.zip" if compress=True,
+        or "pageN.png" for each page
+    Raises:
+        ValueError: If input processing fails
+        Exception: If conversion fails
+    """
+    # Process Markdown text
+    from ..utils.markdown_utils import get_md_text
+
+    processed_md = get_md_text(md_text, is_strip_wrapper=is_strip_wrapper)
 
     try:
-        # Convert to HTML
-        html_str = convert_to_html_with_font_support(processed_md)
+        # Convert to PDF
+        pdf_bytes = convert_processed_md_to_pdf_bytes(processed_md, engine=engine)
 
-        # Convert to PDF - import heavy dependencies here to avoid slow startup
-        from xhtml2pdf import pisa
+        # Convert PDF pages to PNG images
+        page_numbers = get_png_page_numbers(pdf_bytes, pages)
+        images = convert_pdf_to_png_images(pdf_bytes, workers=workers, dpi=dpi, page_numbers=page_numbers)
+    except Exception as e:
+        raise Exception(f"Failed to convert to PNG: {e}")
 
-        result_file_bytes = pisa.CreatePDF(
-            src=html_str,
-            dest_bytes=True,
-            encoding="utf-8",
-            capacity=500 * 1024 * 1024,
-        )
+    if compress:
+        return [("images.zip", zip_to_bytes(get_zip_entries(images, page_numbers)))]
+    return [(f"page{page_num}.png", image_bytes) for page_num, image_bytes in zip(page_numbers, images)]
 
-        # Open PDF and convert to PNG - import pymupdf and PIL here
-        import pymupdf
-        from PIL import Image
 
-        doc = pymupdf.open(stream=result_file_bytes)
-        total_page_count = doc.page_count
-        zoom = 2
+def get_png_page_numbers(pdf_bytes: bytes, pages: str | None = None) -> list[int]:
+    """
+    Get page numbers of PDF to convert
+    Args:
+        pdf_bytes: Content of the PDF file
+        pages: Page numbers or ranges, e.g. "1", "1-3,5" or "2-", defaults to all pages
+    Returns:
+        List of 1-based page numbers in page order
+    """
+    import pymupdf
 
-        for page_num in range(total_page_count):
-            page = doc.load_page(page_num)
-            mat = pymupdf.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat)
+    with pymupdf.open(stream=pdf_bytes) as doc:
+        page_count = doc.page_count
+    return parse_page_range(pages, page_count)
 
-            # Convert to PIL Image
-            img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
 
-            # Save to memory
-            img_buffer = io.BytesIO()
-            img.save(img_buffer, format="PNG")
-            img_buffer.seek(0)
+def parse_page_range(pages: str | None, page_count: int) -> list[int]:
+    """
+    Parse page numbers or ranges, e.g. "1", "1-3,5", "2-" or "-3"
+    Args:
+        pages: Comma separated page numbers or ranges of 1-based page numbers, all pages if empty
+        page_count: Total number of pages
+    Returns:
+        List of distinct 1-based page numbers in page order
+    Raises:
+        ValueError: If the page range is invalid or out of the pages
+    """
+    if not pages or not pages.strip():
+        return list(range(1, page_count + 1))
+
+    page_numbers = set()
+    for part in pages.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            if "-" in part:
+                start, stop = part.split("-", 1)
+                start = int(start) if start.strip() else 1
+                stop = int(stop) if stop.strip() else page_count
+            else:
+                start = stop = int(part)
+        except ValueError:
+            raise ValueError(f"Invalid page range: {part}")
+        if start < 1 or stop > page_count or start > stop:
+            raise ValueError(f"Page range {part} is out of the {page_count} page(s)")
+        page_numbers.update(range(start, stop + 1))
+    if not page_numbers:
+        raise ValueError(f"Invalid page range: {pages}")
+    return sorted(page_numbers)
+
+
+def convert_pdf_to_png_images(
+    pdf_bytes: bytes,
+    workers: int = 1,
+    dpi: int = DEFAULT_PNG_DPI,
+    page_numbers: list[int] | None = None,
+) -> list[bytes]:
+    """
+    Render pages of PDF to PNG images
+    Args:
+        pdf_bytes: Content of the PDF file
+        workers: Number of processes rasterizing ranges of pages in parallel, defaults to 1
+        dpi: Resolution of the PNG images, defaults to 144
+        page_numbers: 1-based page numbers to render, defaults to all pages
+    Returns:
+        List of PNG image bytes in page order
+    """
+    if page_numbers is None:
+        page_numbers = get_png_page_numbers(pdf_bytes)
+
+    workers = min(workers, len(page_numbers))
+    if workers <= 1:
+        return _convert_pages_to_png_images(pdf_bytes, page_numbers, dpi)
+
+    # split pages into contiguous ranges, one per worker
+    range_size = math.ceil(len(page_numbers) / workers)
+    page_ranges = [page_numbers[i : i + range_size] for i in range(0, len(page_numbers), range_size)]
+    try:
+        with ProcessPoolExecutor(max_workers=len(page_ranges)) as executor:
+            # each worker opens the PDF by itself, as PyMuPDF documents can't be shared across threads or processes
+            results = executor.map(
+                _convert_pages_to_png_images,
+                [pdf_bytes] * len(page_ranges),
+                page_ranges,
+                [dpi] * len(page_ranges),
+            )
+            return [image for images in results for image in images]
+    except (OSError, RuntimeError) as e:
+        # e.g. process creation not permitted or broken process pool
+        logger.warning(f"Failed to rasterize pages in parallel, falling back to sequential rasterization: {e}")
+        return _convert_pages_to_png_images(pdf_bytes, page_numbers, dpi)
+
+
+def _convert_pages_to_png_images(pdf_bytes: bytes, page_numbers: list[int], dpi: int) -> list[bytes]:
+    """Render pages of PDF to PNG images, encoded directly from the pixmaps"""
+    # import pymupdf here to avoid slow startup
+    import pymupdf
+
+    with pymupdf.open(stream=pdf_bytes) as doc:
+        return [doc.load_page(page_num - 1).get_pixmap(dpi=dpi).tobytes("png") for page_num in page_numbers]
 
+
+def save_png_images(
+    images: list[bytes], output_path: Path, compress: bool = False, page_numbers: list[int] | None = None
+) -> list[Path]:
+    """
+    Save PNG images as files or into a ZIP file
+    Args:
+        images: List of PNG image bytes in page order
+        output_path: Path to save the output PNG files or ZIP file
+        compress: Whether to compress all PNG images into a ZIP file
+        page_numbers: 1-based page numbers of the images used in file names, defaults to 1, 2, 3...
+    Returns:
+        List of paths to the created files
+    """
+    output_filename = output_path.stem if output_path.suffix else "output"
+    total_page_count = len(images)
+    page_numbers = page_numbers or list(range(1, total_page_count + 1))
+    created_files = []
+
+    if not compress:
+        for page_num, image_bytes in zip(page_numbers, images):
             # Create file name
             if total_page_count > 1:
-                image_filename = f"{output_filename}_page{page_num + 1}.png"
+                image_filename = f"{output_filename}_page{page_num}.png"
             else:
                 image_filename = f"{output_filename}.png"
 
-            image_bytes = img_buffer.getvalue()
-
-            if not compress:
-                # Save PNG file directly
-                if output_path.suffix and total_page_count == 1:
-                    output_file = output_path
-                else:
-                    output_file = (
-                        output_path.parent / image_filename if output_path.suffix else output_path / image_filename
-                    )
-
-                output_file.parent.mkdir(parents=True, exist_ok=True)
-                output_file.write_bytes(image_bytes)
-                created_files.append(output_file)
-                logger.info(f"Successfully converted to {output_file}")
+            # Save PNG file directly
+            if output_path.suffix and total_page_count == 1:
+                output_file = output_path
             else:
-                # Add to ZIP list
-                images_for_zip.append({"blob": image_bytes, "suffix": ".png"})
-
-        # If compression to ZIP is needed
-        if compress and images_for_zip:
-            with (
-                NamedTemporaryFile(suffix=".zip", delete=True) as temp_zip_file,
-                zipfile.ZipFile(temp_zip_file.name, mode="w", compression=zipfile.ZIP_DEFLATED) as zip_file,
-            ):
-                for idx, image_data in enumerate(images_for_zip, 1):
-                    with NamedTemporaryFile(delete=True) as temp_file:
-                        temp_file.write(image_data["blob"])
-                        temp_file.flush()
-                        zip_file.write(temp_file.name, arcname=f"image_{idx}{image_data['suffix']}")
-                zip_file.close()
-
-                output_path.write_bytes(Path(zip_file.filename).read_bytes())
-                created_files.append(output_path)
-                logger.info(f"Successfully created ZIP file with {len(images_for_zip)} PNG images: {output_path}")
+                output_file = (
+                    output_path.parent / image_filename if output_path.suffix else output_path / image_filename
+                )
 
-    except Exception as e:
-        raise Exception(f"Failed to convert to PNG: {e}")
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            output_file.write_bytes(image_bytes)
+            created_files.append(output_file)
+            logger.info(f"Successfully converted to {output_file}")
+
+    # If compression to ZIP is needed
+    elif images:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        write_zip(output_path, get_zip_entries(images, page_numbers))
+        created_files.append(output_path)
+        logger.info(f"Successfully created ZIP file with {len(images)} PNG images: {output_path}")
 
     return created_files
+
+
+def get_zip_entries(images: list[bytes], page_numbers: list[int]) -> Iterator[tuple[str, bytes]]:
+    """Get (name in archive, content) pairs of PNG images, named "image_N.png" by page number"""
+    return ((f"image_{page_num}.png", image_bytes) for page_num, image_bytes in zip(page_numbers, images))
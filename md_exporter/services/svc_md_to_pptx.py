@@ -3,13 +3,11 @@
 MdToPptx service
 """
 
-import os
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 
 from ..utils import get_logger
 from ..utils.markdown_utils import get_md_text
-from ..utils.pandoc_utils import pandoc_convert_file
+from ..utils.pandoc_utils import pandoc_convert_to_bytes
 
 logger = get_logger(__name__)
 
@@ -46,38 +44,54 @@ def convert_md_to_pptx(
         ValueError: If input processing fails
         Exception: If conversion fails
     """
+    result_file_bytes = convert_md_to_pptx_bytes(md_text, template_path, is_strip_wrapper)
+    output_path.write_bytes(result_file_bytes)
+    return output_path
+
+
+def convert_md_to_pptx_bytes(md_text: str, template_path: Path | None = None, is_strip_wrapper: bool = False) -> bytes:
+    """
+    Convert Markdown text to PPTX format in memory using pandoc
+    Args:
+        md_text: Markdown text to convert
+        template_path: Path to PPTX template file (optional)
+        is_strip_wrapper: Whether to remove code block wrapper if present
+    Returns:
+        Content of the PPTX file
+    Raises:
+        ValueError: If input processing fails
+        Exception: If conversion fails
+    """
     # Process Markdown text
     processed_md = get_md_text(md_text, is_strip_wrapper=is_strip_wrapper)
 
+    # Prepare pandoc arguments
+    extra_args = get_pandoc_extra_args(template_path)
+
+    # Convert to PPTX - pipe markdown to pandoc and capture the PPTX bytes from stdout
+    return pandoc_convert_to_bytes(
+        source_text=processed_md,
+        input_format="markdown",
+        dest_format="pptx",
+        extra_args=extra_args,
+    )
+
+
+def get_pandoc_extra_args(template_path: Path | None = None) -> list[str]:
+    """
+    Get pandoc arguments for PPTX conversion
+    Args:
+        template_path: Path to PPTX template file (optional), the default template is used if not specified
+    Returns:
+        Pandoc arguments
+    """
     # Determine template file
     final_template_path = template_path
     if not final_template_path:
         # Use default template
         final_template_path = get_default_template()
 
-    # Convert to PPTX using pandoc
-
-    # Prepare pandoc arguments
     extra_args = []
     if final_template_path and final_template_path.exists():
         extra_args.append(f"--reference-doc={final_template_path}")
-
-    # Convert to PPTX - use convert_file with temporary file since convert_text doesn't work well for PPTX
-    with NamedTemporaryFile(suffix=".md", delete=False, mode="w", encoding="utf-8") as temp_md_file:
-        temp_md_file.write(processed_md)
-        temp_md_file_path = temp_md_file.name
-
-    try:
-        # Convert using pandoc_convert_file
-        pandoc_convert_file(
-            source_file=temp_md_file_path,
-            input_format="markdown",
-            dest_format="pptx",
-            outputfile=str(output_path),
-            extra_args=extra_args,
-        )
-        return output_path
-    finally:
-        # Clean up temporary file
-        if os.path.exists(temp_md_file_path):
-            os.unlink(temp_md_file_path)
+    return extra_args
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Markdown to SQLite conversion service
+Provides common functionality for converting Markdown tables to SQLite database
+"""
+
+import itertools
+import re
+import sqlite3
+from pathlib import Path
+
+import pandas as pd
+
+from ..utils.markdown_utils import get_md_text
+from ..utils.table_utils import SUGGESTED_SHEET_NAME, parse_md_to_tables, replace_empty_cells_with_none
+
+# Number of rows inserted by each executemany call
+SQLITE_BATCH_SIZE = 10_000
+
+_NON_IDENTIFIER_PATTERN = re.compile(r"\W+")
+
+
+def convert_md_to_sqlite(
+    md_text: str,
+    output_path: Path,
+    is_strip_wrapper: bool = False,
+    force_text: bool = True,
+    index_columns: str | list[str] | None = None,
+) -> Path:
+    """
+    Convert Markdown tables to a SQLite database, with one SQL table for each Markdown table
+    SQL tables are named from the heading preceding each table, or "table_N" by default
+    All tables are loaded in a single transaction, and the database file is removed if loading fails
+
+    Args:
+        md_text: Markdown text to convert
+        output_path: Path to save the output SQLite database file, replaced if exists
+        is_strip_wrapper: Whether to remove code block wrapper if present
+        force_text: Whether to store cell values as text, otherwise columns of booleans or numbers are typed as
+            INTEGER or REAL, and dates are stored as text in "YYYY-MM-DD HH:MM:SS"
+        index_columns: Columns to create indexes on in every table having them,
+            as list or comma separated string, e.g. "id,name"
+
+    Returns:
+        Path: Path to the created SQLite database file
+
+    Raises:
+        ValueError: If input processing or table parsing fails, or an index column is not found in any table
+        Exception: If conversion fails
+    """
+    tables, index_columns = _parse_tables(md_text, is_strip_wrapper, force_text, index_columns)
+
+    # Convert to SQLite
+    output_path.unlink(missing_ok=True)
+    try:
+        # autocommit mode, with the transaction controlled explicitly
+        conn = sqlite3.connect(output_path, isolation_level=None)
+        try:
+            write_sqlite_tables(conn, tables, index_columns)
+        finally:
+            conn.close()
+    except Exception:
+        output_path.unlink(missing_ok=True)
+        raise
+
+    return output_path
+
+
+def convert_md_to_sqlite_bytes(
+    md_text: str,
+    is_strip_wrapper: bool = False,
+    force_text: bool = True,
+    index_columns: str | list[str] | None = None,
+) -> bytes:
+    """
+    Convert Markdown tables to a SQLite database in memory, in the same way as convert_md_to_sqlite
+
+    Args:
+        md_text: Markdown text to convert
+        is_strip_wrapper: Whether to remove code block wrapper if present
+        force_text: Whether to store cell values as text, otherwise columns of booleans or numbers are typed as
+            INTEGER or REAL, and dates are stored as text in "YYYY-MM-DD HH:MM:SS"
+        index_columns: Columns to create indexes on in every table having them,
+            as list or comma separated string, e.g. "id,name"
+
+    Returns:
+        bytes: Content of the SQLite database file
+
+    Raises:
+        ValueError: If input processing or table parsing fails, or an index column is not found in any table
+        Exception: If conversion fails
+    """
+    tables, index_columns = _parse_tables(md_text, is_strip_wrapper, force_text, index_columns)
+
+    # Convert to SQLite in an in-memory database, and serialize it to the content of database file
+    conn = sqlite3.connect(":memory:", isolation_level=None)
+    try:
+        write_sqlite_tables(conn, tables, index_columns)
+        return conn.serialize()
+    finally:
+        conn.close()
+
+
+def _parse_tables(
+    md_text: str, is_strip_wrapper: bool, force_text: bool, index_columns: str | list[str] | None
+) -> tuple[list[pd.DataFrame], list[str]]:
+    """Parse Markdown tables and the index columns, checking that each index column is found in a table"""
+    # Process Markdown text
+    processed_md = get_md_text(md_text, is_strip_wrapper=is_strip_wrapper)
+
+    # Parse Markdown tables
+    tables = parse_md_to_tables(processed_md, force_value_to_str=force_text)
+
+    if isinstance(index_columns, str):
+        index_columns = index_columns.split(",")
+    index_columns = [col.strip() for col in index_columns or [] if col.strip()]
+    missing_columns = [col for col in index_columns if not any(col in table.columns for table in tables)]
+    if missing_columns:
+        raise ValueError(f"Index columns not found in any table: {', '.join(missing_columns)}")
+    return tables, index_columns
+
+
+def write_sqlite_tables(conn: sqlite3.Connection, tables: list[pd.DataFrame], index_columns: list[str]) -> None:
+    """
+    Write tables to SQLite database in a single transaction, named from the heading preceding each table
+
+    Args:
+        conn: SQLite connection in autocommit mode
+        tables: Tables to write
+        index_columns: Columns to create indexes on in every table having them
+    """
+    # skip the rollback journal, as the database is discarded as a whole on failure
+    conn.execute("PRAGMA journal_mode = OFF")
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute("BEGIN")
+    # tables and indexes share a single namespace in SQLite
+    used_names: set[str] = set()
+    for i, table in enumerate(tables):
+        table_name = _get_unique_name(
+            _to_identifier(table.attrs.get(SUGGESTED_SHEET_NAME)) or f"table_{i + 1}", used_names
+        )
+        write_sqlite_table(conn, table_name, table, index_columns, used_names)
+    conn.execute("COMMIT")
+
+
+def write_sqlite_table(
+    conn: sqlite3.Connection,
+    table_name: str,
+    table: pd.DataFrame,
+    index_columns: list[str] | None = None,
+    used_names: set[str] | None = None,
+) -> None:
+    """
+    Create SQL table and insert rows of the table in batches, in the ongoing transaction
+
+    Args:
+        conn: SQLite connection
+        table_name: Name of the SQL table
+        table: Table to insert
+        index_columns: Columns to create indexes on, if present in the table
+        used_names: Lowercase names of the tables and indexes in the database, to name the indexes distinctly
+    """
+    if used_names is None:
+        used_names = {table_name.lower()}
+    table = replace_empty_cells_with_none(table)
+    used_column_names: set[str] = set()
+    column_names = [_get_unique_name(str(col), used_column_names) for col in table.columns]
+    columns = [_get_column_values(table[col]) for col in table.columns]
+    column_defs = ", ".join(f"{_quote(name)} {_get_column_type(values)}" for name, values in zip(column_names, columns))
+    conn.execute(f"CREATE TABLE {_quote(table_name)} ({column_defs})")
+
+    insert_sql = (
+        f"INSERT INTO {_quote(table_name)} ({', '.join(_quote(name) for name in column_names)}) "
+        f"VALUES ({', '.join('?' * len(column_names))})"
+    )
+    rows = zip(*columns)
+    while batch := list(itertools.islice(rows, SQLITE_BATCH_SIZE)):
+        conn.executemany(insert_sql, batch)
+
+    # create indexes after loading rows, which is faster than maintaining them on every insert
+    for col in index_columns or []:
+        if col not in table.columns:
+            continue
+        column_name = column_names[list(table.columns).index(col)]
+        index_name = _get_unique_name(f"idx_{table_name}_{column_name}", used_names)
+        conn.execute(f"CREATE INDEX {_quote(index_name)} ON {_quote(table_name)} ({_quote(column_name)})")
+
+
+def _get_column_values(column: pd.Series) -> list:
+    """Get values of column as Python objects supported by SQLite, with dates as text in "YYYY-MM-DD HH:MM:SS" """
+    if pd.api.types.infer_dtype(column, skipna=True) in ("datetime", "datetime64"):
+        column = pd.to_datetime(column).dt.strftime("%Y-%m-%d %H:%M:%S")
+        column = column.astype(object).where(column.notna(), None)
+    return column.tolist()
+
+
+def _get_column_type(values: list) -> str:
+    """Get SQLite column type of values"""
+    types = {type(value) for value in values if value is not None}
+    if types and types <= {int, bool}:
+        return "INTEGER"
+    if types and types <= {int, float}:
+        return "REAL"
+    return "TEXT"
+
+
+def _to_identifier(name: str | None) -> str:
+    """Convert heading to SQL identifier, with runs of non-word characters replaced by underscore"""
+    identifier = _NON_IDENTIFIER_PATTERN.sub("_", name or "").strip("_")
+    # names starting with "sqlite_" are reserved for internal use by SQLite
+    return f"t_{identifier}" if identifier.lower().startswith("sqlite_") else identifier
+
+
+def _get_unique_name(name: str, used_names: set[str]) -> str:
+    """Get name distinct from the used ones case-insensitively, by appending "_N" to the name"""
+    unique_name = name
+    suffix_num = 1
+    while unique_name.lower() in used_names:
+        suffix_num += 1
+        unique_name = f"{name}_{suffix_num}"
+    used_names.add(unique_name.lower())
+    return unique_name
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
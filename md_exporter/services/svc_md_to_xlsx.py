@@ -4,13 +4,36 @@ Markdown to XLSX conversion service
 Provides common functionality for converting Markdown tables to XLSX format
 """
 
+import io
+import itertools
+import re
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from tempfile import NamedTemporaryFile
+from typing import BinaryIO
 
-import pandas as pd
+import numpy as np
 
-from ..utils.markdown_utils import get_md_text
-from ..utils.table_utils import SUGGESTED_SHEET_NAME, parse_md_to_tables
+from ..utils.markdown_utils import get_md_text, strip_markdown_wrapper
+from ..utils.table_utils import (
+    MAX_HEADING_LENGTH,
+    SUGGESTED_SHEET_NAME,
+    get_column_names,
+    iter_md_tables,
+    iter_table_rows,
+    parse_md_to_tables,
+)
+
+# Max length of sheet names in Excel
+MAX_SHEET_NAME_LENGTH = 31
+
+# Max number of rows in a sheet in Excel, including the header row
+MAX_SHEET_ROWS = 1_048_576
+
+# Number of rows written and measured for column widths at a time
+ROW_BATCH_SIZE = 10_000
+
+# Max width of columns in characters
+MAX_COLUMN_WIDTH = 200
 
 
 def convert_md_to_xlsx(
@@ -18,40 +41,166 @@ def convert_md_to_xlsx(
 ) -> None:
     """
     Convert Markdown tables to XLSX format
+    Rows are written with constant memory by xlsxwriter, and tables exceeding the row limit of Excel
+    are split across numbered sheets, e.g. "Sales", "Sales (2)"
 
     Args:
         md_text: Markdown text to convert
         output_path: Path to save the output XLSX file
         is_strip_wrapper: Whether to remove code block wrapper if present
-        force_text: Whether to convert cell values to text type
+        force_text: Whether to convert cell values to text type, otherwise columns are typed as booleans, numbers
+            or dates where possible
 
     Raises:
         ValueError: If input processing or table parsing fails
         Exception: If conversion fails
     """
+    _convert_md_to_xlsx(md_text, output_path, is_strip_wrapper, force_text)
+
+
+def convert_md_to_xlsx_bytes(md_text: str, is_strip_wrapper: bool = False, force_text: bool = True) -> bytes:
+    """
+    Convert Markdown tables to XLSX format in memory
+
+    Args:
+        md_text: Markdown text to convert
+        is_strip_wrapper: Whether to remove code block wrapper if present
+        force_text: Whether to convert cell values to text type, otherwise columns are typed as booleans, numbers
+            or dates where possible
+
+    Returns:
+        bytes: Content of the XLSX file
+
+    Raises:
+        ValueError: If input processing or table parsing fails
+        Exception: If conversion fails
+    """
+    buffer = io.BytesIO()
+    _convert_md_to_xlsx(md_text, buffer, is_strip_wrapper, force_text)
+    return buffer.getvalue()
+
+
+def _convert_md_to_xlsx(md_text: str, output: Path | BinaryIO, is_strip_wrapper: bool, force_text: bool) -> None:
     # Process Markdown text
     processed_md = get_md_text(md_text, is_strip_wrapper=is_strip_wrapper)
 
-    # Parse Markdown tables
-    tables = parse_md_to_tables(processed_md, force_value_to_str=force_text)
+    if force_text:
+        # Read text cells of tables row by row
+        tables = _iter_text_tables(strip_markdown_wrapper(processed_md))
+    else:
+        # Parse Markdown tables with typed columns
+        tables = (
+            (table.attrs.get(SUGGESTED_SHEET_NAME), list(table.columns), iter_table_rows(table))
+            for table in parse_md_to_tables(processed_md, force_value_to_str=False)
+        )
 
     # Convert to XLSX
-    with NamedTemporaryFile(suffix=".xlsx", delete=False) as temp_xlsx_file:
-        temp_xlsx_path = temp_xlsx_file.name
+    if not write_xlsx(output, tables):
+        raise ValueError("Failed to parse markdown to tables, exception: No available tables parsed from markdown text")
 
+
+def _iter_text_tables(md_text: str) -> Iterator[tuple[str | None, list[str], Iterator[tuple]]]:
+    """Iterate over tables with at least one row, as (suggested sheet name, column names, rows)"""
+    for table in iter_md_tables(md_text):
+        first_row = next(table.rows, None)
+        if first_row is None:
+            continue
+        sheet_name = table.heading[:MAX_HEADING_LENGTH] if table.heading else None
+        yield sheet_name, get_column_names(table.header), itertools.chain([first_row], table.rows)
+
+
+def write_xlsx(output: Path | BinaryIO, tables: Iterable[tuple[str | None, list[str], Iterable[tuple | list]]]) -> int:
+    """
+    Write tables to XLSX file with xlsxwriter in constant memory mode, one sheet per table
+    Columns are sized to fit their values, and tables exceeding the row limit are split across numbered sheets
+
+    Args:
+        output: Path or writable binary stream to save the output XLSX file
+        tables: Iterable of (suggested sheet name, column names, rows) of tables
+
+    Returns:
+        int: Number of tables written, the file is not created if there is no table
+    """
+    import xlsxwriter
+
+    workbook = None
+    used_names: set[str] = set()
+    table_count = 0
     try:
-        with pd.ExcelWriter(temp_xlsx_path, engine="openpyxl") as writer:
-            for i, table in enumerate(tables):
-                sheet_name = table.attrs.get(SUGGESTED_SHEET_NAME, f"Sheet{i + 1}")
-                table.to_excel(writer, sheet_name=sheet_name, index=False, na_rep="")
-                # Auto-fit column width if supported
-                if hasattr(writer.sheets[sheet_name], "autofit"):
-                    writer.sheets[sheet_name].autofit(max_width=200)
-
-        # Read temp file and write to target
-        output_path.write_bytes(Path(temp_xlsx_path).read_bytes())
+        for i, (suggested_sheet_name, columns, rows) in enumerate(tables):
+            rows = iter(rows)
+            batch = list(itertools.islice(rows, ROW_BATCH_SIZE))
+            if not batch:
+                continue
+            if workbook is None:
+                workbook = xlsxwriter.Workbook(
+                    output,
+                    {
+                        "constant_memory": True,
+                        # write cell values as plain text, not as formulas or hyperlinks
+                        "strings_to_formulas": False,
+                        "strings_to_urls": False,
+                        # display format of date cells in typed columns
+                        "default_date_format": "yyyy-mm-dd",
+                    },
+                )
+                header_format = workbook.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"})
+            base_name = _get_base_sheet_name(suggested_sheet_name, i)
+            table_count += 1
+
+            while batch:
+                # start a new sheet with header row
+                worksheet = workbook.add_worksheet(_get_unique_sheet_name(base_name, used_names))
+                worksheet.write_row(0, 0, columns, header_format)
+                row_num = 1
+                column_widths = _measure_widths([columns])
+                while batch:
+                    for row in batch:
+                        worksheet.write_row(row_num, 0, row)
+                        row_num += 1
+                    column_widths = np.maximum(column_widths, _measure_widths(batch))
+                    # read no more rows than the space left in the sheet
+                    batch = list(itertools.islice(rows, min(ROW_BATCH_SIZE, MAX_SHEET_ROWS - row_num)))
+                _set_column_widths(worksheet, column_widths)
+                # continue with the remaining rows on the next sheet
+                batch = list(itertools.islice(rows, ROW_BATCH_SIZE))
     finally:
-        # Clean up temporary file
-        import os
+        if workbook is not None:
+            workbook.close()
+    return table_count
+
+
+def _measure_widths(rows: Iterable[tuple | list]) -> np.ndarray:
+    """
+    Measure display widths of cells in rows, vectorized over the whole batch of rows
+    East Asian wide characters (3 bytes in UTF-8) are counted as 2, as the average of characters and UTF-8 bytes
+    """
+    cells = np.asarray([["" if value is None else str(value) for value in row] for row in rows], dtype=np.str_)
+    if cells.size == 0:
+        return np.zeros(cells.shape[-1] if cells.ndim == 2 else 0, dtype=np.int64)
+    char_lengths = np.char.str_len(cells)
+    byte_lengths = np.char.str_len(np.char.encode(cells, "utf-8"))
+    return ((char_lengths + byte_lengths + 1) // 2).max(axis=0)
+
+
+def _set_column_widths(worksheet, column_widths: np.ndarray) -> None:
+    for col, width in enumerate(column_widths):
+        worksheet.set_column(col, col, min(int(width) + 2, MAX_COLUMN_WIDTH))
+
+
+def _get_base_sheet_name(suggested_sheet_name: str | None, index: int) -> str:
+    """Get valid sheet name from the suggested sheet name, or "SheetN" by default"""
+    base_name = re.sub(r"[\[\]:*?/\\]", " ", suggested_sheet_name or "").strip("' ")
+    return base_name[:MAX_SHEET_NAME_LENGTH] or f"Sheet{index + 1}"
+
 
-        os.unlink(temp_xlsx_path)
+def _get_unique_sheet_name(base_name: str, used_names: set[str]) -> str:
+    """Get sheet name distinct from the used ones, by appending " (N)" to the base name"""
+    sheet_name = base_name
+    suffix_num = 1
+    while sheet_name.lower() in used_names:
+        suffix_num += 1
+        suffix = f" ({suffix_num})"
+        sheet_name = f"{base_name[: MAX_SHEET_NAME_LENGTH - len(suffix)]}{suffix}"
+    used_names.add(sheet_name.lower())
+    return sheet_name
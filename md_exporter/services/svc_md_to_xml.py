@@ -3,15 +3,29 @@
 MdToXml service
 """
 
+import contextlib
+import io
+import re
+from collections.abc import Iterator
 from pathlib import Path
+from typing import BinaryIO
 
-import markdown
 from lxml import etree, html
+from markdown.extensions.toc import slugify, unique
+
+# Size of Markdown chunks rendered and written at a time, in characters
+XML_CHUNK_SIZE = 64 * 1024
+
+_HEADING_TAGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+
+# Heading rendered after each chunk to find where the chunk ends in the rendered HTML
+_CHUNK_END_MARKER = "MdExporterChunkEnd"
 
 
 def convert_md_to_xml(md_text: str, output_path: Path, is_strip_wrapper: bool = False) -> Path:
     """
     Convert Markdown text to XML format
+    The XML is written to the output file incrementally, one chunk of Markdown at a time
     Args:
         md_text: Markdown text to convert
         output_path: Path to save the output XML file
@@ -29,13 +43,158 @@ def convert_md_to_xml(md_text: str, output_path: Path, is_strip_wrapper: bool =
 
     # Convert to XML
     try:
-        html_str = markdown.markdown(text=processed_md, extensions=["extra", "toc"])
-        xml_element = html.fromstring(html_str)
-        result_file_bytes = etree.tostring(
-            element_or_tree=xml_element, xml_declaration=True, pretty_print=True, encoding="UTF-8"
-        )
-
-        output_path.write_bytes(result_file_bytes)
+        write_xml(output_path, processed_md)
         return output_path
     except Exception as e:
         raise Exception(f"Failed to convert Markdown to XML: {e}")
+
+
+def convert_md_to_xml_bytes(md_text: str, is_strip_wrapper: bool = False) -> bytes:
+    """
+    Convert Markdown text to XML format in memory
+    Args:
+        md_text: Markdown text to convert
+        is_strip_wrapper: Whether to remove code block wrapper if present
+    Returns:
+        Content of the XML file
+    Raises:
+        ValueError: If input processing fails
+        Exception: If conversion fails
+    """
+    # Process Markdown text
+    from ..utils.markdown_utils import get_md_text
+
+    processed_md = get_md_text(md_text, is_strip_wrapper=is_strip_wrapper)
+
+    # Convert to XML
+    try:
+        buffer = io.BytesIO()
+        write_xml(buffer, processed_md)
+        return buffer.getvalue()
+    except Exception as e:
+        raise Exception(f"Failed to convert Markdown to XML: {e}")
+
+
+def write_xml(output: Path | BinaryIO, processed_md: str) -> None:
+    """
+    Render Markdown text to XML incrementally with lxml.etree.xmlfile, one chunk of Markdown at a time,
+    so that only a chunk of the rendered HTML and its elements is held in memory
+    The output is the same as convert_html_to_xml_bytes of the whole rendered HTML,
+    with the elements wrapped in a <div> root element unless there is a single one
+    Args:
+        output: Path or writable binary stream to save the output XML file
+        processed_md: Processed Markdown text
+    Raises:
+        ValueError: If nothing is rendered from the Markdown text
+    """
+    nodes = _iter_html_nodes(processed_md)
+    first_nodes = [node for node in (next(nodes, None), next(nodes, None)) if node is not None]
+    if not first_nodes:
+        raise ValueError("Document is empty")
+
+    with output.open("wb") if isinstance(output, Path) else contextlib.nullcontext(output) as f:
+        single_element = len(first_nodes) == 1 and not isinstance(first_nodes[0], str)
+        with etree.xmlfile(f, encoding="UTF-8") as xf:
+            xf.write_declaration()
+            if single_element:
+                # single element as the root element, pretty-printed with the line break after it
+                first_nodes[0].tail = None
+                xf.write(first_nodes[0], pretty_print=True)
+            else:
+                with xf.element("div"):
+                    for node in first_nodes:
+                        xf.write(node)
+                    for node in nodes:
+                        xf.write(node)
+        if not single_element:
+            # line break after the root element, as pretty-printed
+            f.write(b"\n")
+
+
+def _iter_html_nodes(processed_md: str) -> Iterator[etree._Element | str]:
+    """
+    Iterate over top-level elements and texts of the HTML rendered from Markdown text, chunk by chunk
+    Heading IDs generated separately in each chunk are made unique across chunks, as in the whole document
+    """
+    from ..utils.markdown_utils import split_markdown_into_chunks
+
+    chunks, definitions = split_markdown_into_chunks(processed_md, XML_CHUNK_SIZE)
+    used_ids: set[str] = set()
+    is_first_chunk = True
+    chunk = next(chunks, None)
+    while chunk is not None:
+        next_chunk = next(chunks, None)
+        nodes = _render_chunk(chunk, definitions, is_last_chunk=next_chunk is None)
+        if nodes is None:
+            # the chunk does not end at a block boundary, e.g. inside a raw HTML block, so render it with the next one
+            chunk = f"{chunk}{next_chunk}"
+            continue
+
+        if is_first_chunk:
+            used_ids.update(node_id for node in nodes if not isinstance(node, str) for node_id in node.xpath(".//@id"))
+            is_first_chunk = False
+        else:
+            _make_heading_ids_unique(nodes, used_ids)
+        yield from nodes
+        chunk = next_chunk
+
+
+def _render_chunk(chunk: str, definitions: str, is_last_chunk: bool) -> list[etree._Element | str] | None:
+    """
+    Render Markdown chunk to HTML elements and texts, with the definitions of the whole document
+    A marker heading is rendered after a chunk other than the last one, in place of the heading starting the next chunk,
+    to keep the line breaks after the chunk as the tail of its last element, as they are in the whole document
+    Returns:
+        List of elements and texts, or None if the marker heading is not rendered as the last element separately
+    """
+    from ..utils.markdown_utils import render_markdown
+
+    md_text = f"{definitions}\n\n{chunk}" if definitions else chunk
+    if is_last_chunk:
+        return html.fragments_fromstring(render_markdown(md_text))
+
+    nodes = html.fragments_fromstring(render_markdown(f"{md_text}# {_CHUNK_END_MARKER}\n"))
+    marker = nodes.pop() if nodes else None
+    if (
+        not nodes
+        or isinstance(marker, str)
+        or marker.tag != "h1"
+        or marker.text_content() != _CHUNK_END_MARKER
+        or isinstance(nodes[-1], str)
+    ):
+        return None
+    return nodes
+
+
+def _make_heading_ids_unique(nodes: list[etree._Element | str], used_ids: set[str]) -> None:
+    """
+    Regenerate heading IDs generated in a chunk, in the same way as the toc extension does for the whole document,
+    so that they are unique with the IDs used in previous chunks
+    """
+    elements = [node for node in nodes if not isinstance(node, str)]
+    generated_id_headings = []
+    for element in elements:
+        for descendant in element.iter():
+            element_id = descendant.get("id")
+            if element_id is None:
+                continue
+            if descendant.tag in _HEADING_TAGS:
+                slug = slugify(descendant.text_content(), "-")
+                if element_id == slug or re.fullmatch(rf"{re.escape(slug)}_\d+", element_id):
+                    generated_id_headings.append((descendant, slug))
+                    continue
+            used_ids.add(element_id)
+    for heading, slug in generated_id_headings:
+        heading.set("id", unique(slug, used_ids))
+
+
+def convert_html_to_xml_bytes(html_str: str) -> bytes:
+    """
+    Convert HTML rendered from Markdown to pretty-printed XML
+    Args:
+        html_str: HTML string to convert
+    Returns:
+        Bytes of the XML document
+    """
+    xml_element = html.fromstring(html_str)
+    return etree.tostring(element_or_tree=xml_element, xml_declaration=True, pretty_print=True, encoding="UTF-8")
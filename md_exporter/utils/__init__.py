@@ -1,12 +1,16 @@
+from .document_utils import MarkdownDocument, parse_markdown_document
 from .file_utils import get_meta_data
 from .logger_utils import get_logger
 from .markdown_utils import convert_markdown_to_html, get_md_text, strip_markdown_wrapper
 from .mimetype_utils import MimeType
 from .param_utils import get_md_text_from_tool_params, get_param_value
-from .table_utils import SUGGESTED_SHEET_NAME, extract_headings, parse_md_to_tables
+from .table_utils import COLUMN_ALIGNMENTS, SUGGESTED_SHEET_NAME, parse_md_to_tables, scan_md_tables
 from .text_utils import contains_chinese, contains_japanese, normalize_line_breaks, remove_think_tags
 
 __all__ = [
+    # document_utils
+    "MarkdownDocument",
+    "parse_markdown_document",
     # file_utils
     "get_meta_data",
     # logger_utils
@@ -22,8 +26,9 @@ __all__ = [
     "get_param_value",
     # table_utils
     "parse_md_to_tables",
-    "extract_headings",
+    "scan_md_tables",
     "SUGGESTED_SHEET_NAME",
+    "COLUMN_ALIGNMENTS",
     # text_utils
     "contains_chinese",
     "contains_japanese",
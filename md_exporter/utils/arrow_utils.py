@@ -0,0 +1,84 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+from .table_utils import SUGGESTED_SHEET_NAME, parse_md_to_tables, replace_empty_cells_with_none
+
+# Key of schema metadata holding the table name, from the nearest heading preceding the table
+TABLE_NAME_METADATA_KEY = b"table_name"
+
+
+def convert_table_to_arrow(table: pd.DataFrame) -> pa.Table:
+    """
+    Convert parsed Markdown table to Arrow table, with the suggested sheet name as table name in schema metadata
+    Empty cells of typed columns become nulls, while text columns keep them as empty strings
+    """
+    arrow_table = pa.Table.from_pandas(replace_empty_cells_with_none(table), preserve_index=False)
+
+    table_name = table.attrs.get(SUGGESTED_SHEET_NAME)
+    if table_name:
+        metadata = {**(arrow_table.schema.metadata or {}), TABLE_NAME_METADATA_KEY: table_name.encode("utf-8")}
+        arrow_table = arrow_table.replace_schema_metadata(metadata)
+    return arrow_table
+
+
+def write_arrow_tables(
+    md_text: str,
+    output_path: Path,
+    write_table: Callable[[pa.Table, Path | pa.NativeFile], None],
+    force_text: bool = True,
+) -> list[Path]:
+    """
+    Write tables of Markdown text to columnar files, one file per table
+    Tables are written to files named with suffix "_N" if there are multiple tables, as the other table exports do
+    Args:
+        md_text: Markdown text
+        output_path: Path of the output file
+        write_table: Function writing an Arrow table to file path or Arrow output stream
+        force_text: Whether to keep cell values as text, otherwise columns are typed as booleans, numbers or dates
+            where possible
+    Returns:
+        List of paths to the created files
+    Raises:
+        ValueError: If no table is found
+    """
+    tables = parse_md_to_tables(md_text, force_value_to_str=force_text)
+
+    created_files = []
+    for i, table in enumerate(tables):
+        if len(tables) > 1:
+            output_file = output_path.parent / f"{output_path.stem}_{i + 1}{output_path.suffix}"
+        else:
+            output_file = output_path
+        write_table(convert_table_to_arrow(table), output_file)
+        created_files.append(output_file)
+    return created_files
+
+
+def write_arrow_tables_to_bytes(
+    md_text: str,
+    write_table: Callable[[pa.Table, Path | pa.NativeFile], None],
+    force_text: bool = True,
+) -> list[bytes]:
+    """
+    Write tables of Markdown text to columnar files in memory, one file per table
+    Args:
+        md_text: Markdown text
+        write_table: Function writing an Arrow table to file path or Arrow output stream
+        force_text: Whether to keep cell values as text, otherwise columns are typed as booleans, numbers or dates
+            where possible
+    Returns:
+        List of contents of the files in table order
+    Raises:
+        ValueError: If no table is found
+    """
+    tables = parse_md_to_tables(md_text, force_value_to_str=force_text)
+
+    results = []
+    for table in tables:
+        sink = pa.BufferOutputStream()
+        write_table(convert_table_to_arrow(table), sink)
+        results.append(sink.getvalue().to_pybytes())
+    return results
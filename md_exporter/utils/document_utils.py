@@ -0,0 +1,651 @@
+#!/usr/bin/env python3
+"""
+Block-level document model of Markdown text
+Markdown text is scanned once into front matter, headings, paragraphs, fenced code blocks, tables and definitions,
+and the parsed documents are memoized by content hash, so that the exporters of the same text share a single scan
+"""
+
+import html
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from enum import StrEnum
+
+# Max number of parsed documents kept in the LRU cache, set by environment variable MD_EXPORTER_DOCUMENT_CACHE_SIZE
+# The document cache is disabled if set to 0
+DOCUMENT_CACHE_SIZE_ENV = "MD_EXPORTER_DOCUMENT_CACHE_SIZE"
+DEFAULT_DOCUMENT_CACHE_SIZE = 8
+
+# code fences of CommonMark, e.g. "```python", indented by up to 3 spaces, which are removed from the lines of the code
+_FENCE_PATTERN = re.compile(r"^( {0,3})(`{3,}|~{3,})(.*)$", re.MULTILINE)
+_FENCE_INDENT_PATTERNS = {indent: re.compile(rf"^ {{1,{indent}}}", re.MULTILINE) for indent in (1, 2, 3)}
+_ATX_HEADING_PATTERN = re.compile(r"^ {0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$")
+_SETEXT_UNDERLINE_PATTERN = re.compile(r"^ {0,3}(=+|-+)[ \t]*$")
+_FRONT_MATTER_END_PATTERN = re.compile(r"^(?:---|\.\.\.)[ \t]*$")
+_BLANK_LINE_PATTERN = re.compile(r"[ \t]*(?:\n|$)")
+# lines of indented code blocks, indented by 4 spaces or a tab
+_INDENTED_CODE_LINE_PATTERN = re.compile(r"(?: {4}|\t)[ \t]*\S")
+# link reference definitions, footnote definitions and abbreviation definitions
+_DEFINITION_PATTERNS = {
+    "link": re.compile(r"^ {0,3}\[(?!\^)[^\]]+\]:\s*\S"),
+    "footnote": re.compile(r"^ {0,3}\[\^[^\]]+\]:"),
+    "abbreviation": re.compile(r"^\*\[[^\]]+\]:"),
+}
+
+# cells of GFM pipe tables, and inline Markdown in cells and headings
+_DELIMITER_CELL_PATTERN = re.compile(r"^(:?)-+(:?)$")
+_UNESCAPED_PIPE_PATTERN = re.compile(r"(?<!\\)\|")
+_CODE_SPAN_PATTERN = re.compile(r"(`+)(.+?)(?<!`)\1(?!`)")
+_IMAGE_PATTERN = re.compile(r"!\[([^\]]*)\]\([^)]*\)")
+_LINK_PATTERN = re.compile(r"\[([^\]]+)\](?:\([^)]*\)|\[[^\]]*\])")
+_HTML_TAG_PATTERN = re.compile(r"</?[A-Za-z][^>]*>")
+_STRONG_PATTERN = re.compile(r"(\*\*|(?<!\w)__)(.+?)\1")
+_EMPHASIS_PATTERN = re.compile(r"(\*|(?<!\w)_)(.+?)\1(?!\w)")
+_ESCAPE_PATTERN = re.compile(r"\\([\\`*_{}\[\]()#+\-.!|])")
+_INLINE_MARKUP_CHARS = re.compile(r"[`*_\[<&\\]")
+
+
+class BlockType(StrEnum):
+    FRONT_MATTER = "front_matter"
+    HEADING = "heading"
+    PARAGRAPH = "paragraph"
+    CODE_BLOCK = "code_block"
+    TABLE = "table"
+    DEFINITION = "definition"
+
+
+class MarkdownTable:
+    def __init__(
+        self,
+        header: list[str],
+        rows: list[list[str]] | Iterator[list[str]],
+        alignments: list[str | None],
+        heading: str | None = None,
+        start_line: int = 0,
+        end_line: int = 0,
+    ):
+        self.header = header
+        self.rows = rows
+        # alignment of each column, "left", "center", "right" or None if not specified
+        self.alignments = alignments
+        # text of the nearest heading preceding the table
+        self.heading = heading
+        # span of the table in lines of the Markdown text, [start_line, end_line)
+        self.start_line = start_line
+        self.end_line = end_line
+
+
+def strip_inline_markdown(text: str) -> str:
+    """Convert inline Markdown of a table cell or heading to plain text, as it is displayed"""
+    if not _INLINE_MARKUP_CHARS.search(text):
+        return text.strip()
+
+    # keep contents of code spans literally
+    code_spans = []
+
+    def hold_code_span(match: re.Match) -> str:
+        code_spans.append(match.group(2).strip())
+        return f"\x00{len(code_spans) - 1}\x00"
+
+    text = _CODE_SPAN_PATTERN.sub(hold_code_span, text)
+    text = _IMAGE_PATTERN.sub(r"\1", text)
+    text = _LINK_PATTERN.sub(r"\1", text)
+    text = _HTML_TAG_PATTERN.sub("", text)
+    text = _STRONG_PATTERN.sub(r"\2", text)
+    text = _EMPHASIS_PATTERN.sub(r"\2", text)
+    text = _ESCAPE_PATTERN.sub(r"\1", text)
+    text = html.unescape(text)
+    if code_spans:
+        text = re.sub(r"\x00(\d+)\x00", lambda match: code_spans[int(match.group(1))], text)
+    return text.strip()
+
+
+def split_table_row(line: str) -> list[str]:
+    """Split a row of GFM pipe table into raw cells, at pipes not escaped by backslash"""
+    line = line.strip()
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|") and not line.endswith("\\|"):
+        line = line[:-1]
+    return [cell.strip().replace("\\|", "|") for cell in _UNESCAPED_PIPE_PATTERN.split(line)]
+
+
+def parse_delimiter_row(line: str) -> list[str | None] | None:
+    """Parse delimiter row of GFM pipe table to column alignments, or None if the line is not a delimiter row"""
+    if "-" not in line or not set(line.strip()) <= set("|:- \t"):
+        return None
+    cells = split_table_row(line)
+    alignments = []
+    for cell in cells:
+        match = _DELIMITER_CELL_PATTERN.match(cell)
+        if not match:
+            return None
+        left, right = match.groups()
+        if left and right:
+            alignments.append("center")
+        elif right:
+            alignments.append("right")
+        elif left:
+            alignments.append("left")
+        else:
+            alignments.append(None)
+    # a delimiter row without any pipe is a thematic break or setext underline instead
+    if len(cells) == 1 and "|" not in line:
+        return None
+    return alignments
+
+
+def parse_header_row(line: str, column_count: int) -> list[str] | None:
+    """Parse header row of GFM pipe table, or None if its cells don't match the delimiter row"""
+    if not _UNESCAPED_PIPE_PATTERN.search(line):
+        return None
+    cells = split_table_row(line)
+    if len(cells) != column_count and not line.lstrip().startswith("|"):
+        # skip the leading text before the first pipe, e.g. "Here is the table: | a | b |"
+        cells = split_table_row(line[_UNESCAPED_PIPE_PATTERN.search(line).start() :])
+    return cells if len(cells) == column_count else None
+
+
+class MarkdownBlock:
+    """
+    Block of Markdown text, spanning lines [start_line, end_line) and characters [start, end) of the text,
+    including the line break of its last line
+    """
+
+    __slots__ = ("block_type", "start_line", "end_line", "start", "end")
+
+    def __init__(self, block_type: BlockType, start_line: int, end_line: int, start: int, end: int):
+        self.block_type = block_type
+        self.start_line = start_line
+        self.end_line = end_line
+        self.start = start
+        self.end = end
+
+
+class HeadingBlock(MarkdownBlock):
+    __slots__ = ("level", "text")
+
+    def __init__(self, start_line: int, end_line: int, start: int, end: int, level: int, text: str):
+        super().__init__(BlockType.HEADING, start_line, end_line, start, end)
+        self.level = level
+        # heading in plain text
+        self.text = text
+
+
+class FencedCodeBlock(MarkdownBlock):
+    __slots__ = ("fence", "info", "indent", "is_closed", "code_start", "code_end", "_text")
+
+    def __init__(
+        self,
+        text: str,
+        start_line: int,
+        end_line: int,
+        start: int,
+        end: int,
+        fence: str,
+        info: str,
+        indent: int,
+        is_closed: bool,
+        code_start: int,
+        code_end: int,
+    ):
+        super().__init__(BlockType.CODE_BLOCK, start_line, end_line, start, end)
+        # opening fence, e.g. "```" or "~~~~"
+        self.fence = fence
+        # info string following the opening fence, e.g. "python title='example'"
+        self.info = info
+        # number of spaces indenting the opening fence, removed from the lines of the code
+        self.indent = indent
+        # whether the block ends with a closing fence, otherwise it runs to the end of the text
+        self.is_closed = is_closed
+        # offsets of the text between the fences
+        self.code_start = code_start
+        self.code_end = code_end
+        self._text = text
+
+    @property
+    def code(self) -> str:
+        """Text between the fences, sliced from the Markdown text on access"""
+        code = self._text[self.code_start : self.code_end]
+        return _FENCE_INDENT_PATTERNS[self.indent].sub("", code) if self.indent else code
+
+    @property
+    def language(self) -> str:
+        """Language of the code block, the first word of the info string"""
+        return self.info.split(maxsplit=1)[0] if self.info else ""
+
+
+class TableBlock(MarkdownBlock):
+    __slots__ = ("table",)
+
+    def __init__(self, table: MarkdownTable, start: int):
+        super().__init__(BlockType.TABLE, table.start_line, table.end_line, start, start)
+        self.table = table
+
+
+class DefinitionBlock(MarkdownBlock):
+    __slots__ = ("kind",)
+
+    def __init__(self, start_line: int, start: int, end: int, kind: str):
+        super().__init__(BlockType.DEFINITION, start_line, start_line + 1, start, end)
+        # "link", "footnote" or "abbreviation"
+        self.kind = kind
+
+
+class MarkdownDocument:
+    """
+    Markdown text parsed into blocks, in document order
+    Blank lines and lines in no block, e.g. continuations of footnote definitions, are not included in any block
+    """
+
+    def __init__(self, text: str, blocks: list[MarkdownBlock]):
+        self.text = text
+        self.blocks = blocks
+
+    @property
+    def front_matter(self) -> str | None:
+        """YAML front matter between "---" lines at the start of the text, without the delimiter lines"""
+        if self.blocks and self.blocks[0].block_type == BlockType.FRONT_MATTER:
+            lines = self.get_block_text(self.blocks[0]).splitlines(keepends=True)
+            return "".join(lines[1:-1])
+        return None
+
+    @property
+    def headings(self) -> list[HeadingBlock]:
+        return [block for block in self.blocks if isinstance(block, HeadingBlock)]
+
+    @property
+    def code_blocks(self) -> list[FencedCodeBlock]:
+        return [block for block in self.blocks if isinstance(block, FencedCodeBlock)]
+
+    @property
+    def tables(self) -> list[MarkdownTable]:
+        return [block.table for block in self.blocks if isinstance(block, TableBlock)]
+
+    def get_definitions(self, kind: str) -> list[DefinitionBlock]:
+        return [block for block in self.blocks if isinstance(block, DefinitionBlock) and block.kind == kind]
+
+    def get_block_text(self, block: MarkdownBlock) -> str:
+        return self.text[block.start : block.end]
+
+
+class _LineReader:
+    """Read lines of text lazily, with one line of lookahead and the offsets of the lines read"""
+
+    def __init__(self, text: str, start: int = 0, line_num: int = 0):
+        self.text = text
+        # number of lines read
+        self.line_num = line_num
+        # offsets of the start and the end of the last line read, including its line break
+        self.line_start = start
+        self.line_end = start
+        self._next_line_end = self._find_line_end(start)
+
+    def _find_line_end(self, start: int) -> int:
+        # slice lines one at a time, without copying the whole text
+        return self.text.find("\n", start) + 1 or len(self.text)
+
+    def peek(self) -> str | None:
+        if self.line_end >= len(self.text):
+            return None
+        return self.text[self.line_end : self._next_line_end].rstrip("\r\n")
+
+    def next(self) -> str | None:
+        line = self.peek()
+        if line is not None:
+            self.line_num += 1
+            self.line_start = self.line_end
+            self.line_end = self._next_line_end
+            self._next_line_end = self._find_line_end(self.line_end)
+        return line
+
+    def skip_to(self, line_start: int) -> None:
+        """Skip the lines up to the line starting at the offset"""
+        if line_start > self.line_end:
+            self.line_num += self.text.count("\n", self.line_end, line_start)
+            if line_start == len(self.text) and not self.text.endswith("\n"):
+                # the last line without line break
+                self.line_num += 1
+            self.line_start = self.line_end = line_start
+            self._next_line_end = self._find_line_end(line_start)
+
+
+def iter_markdown_blocks(md_text: str) -> Iterator[MarkdownBlock]:
+    """
+    Scan Markdown text line by line into blocks, in a single pass without rendering
+    Tables are detected as GFM pipe tables, each with the nearest heading preceding it
+    The rows of each table are read lazily, and the rows not consumed are skipped when moving to the next block,
+    with the end of the table block updated accordingly
+    Args:
+        md_text: Markdown text
+    Returns:
+        Iterator of blocks, in document order
+    """
+    reader = _LineReader(md_text)
+    heading = None
+    prev_line = ""
+    # start of the ongoing paragraph, as (line number, offset)
+    paragraph_start: tuple[int, int] | None = None
+
+    def end_paragraph(end_line: int, end: int) -> Iterator[MarkdownBlock]:
+        nonlocal paragraph_start
+        if paragraph_start is not None:
+            yield MarkdownBlock(BlockType.PARAGRAPH, paragraph_start[0], end_line, paragraph_start[1], end)
+            paragraph_start = None
+
+    if reader.peek() == "---" and (front_matter_end := _get_front_matter_end(md_text)):
+        while reader.line_end < front_matter_end:
+            prev_line = reader.next()
+        yield MarkdownBlock(BlockType.FRONT_MATTER, 0, reader.line_num, 0, reader.line_end)
+
+    while (line := reader.next()) is not None:
+        start_line = reader.line_num - 1
+        start = reader.line_start
+
+        # fenced code blocks
+        fence_match = _match_opening_fence(line)
+        if fence_match:
+            yield from end_paragraph(start_line, start)
+            yield _read_fenced_code_block(reader, fence_match)
+            prev_line = line
+            continue
+
+        # tables
+        next_line = reader.peek()
+        if next_line is not None and "|" in line:
+            alignments = parse_delimiter_row(next_line)
+            header = parse_header_row(line, len(alignments)) if alignments else None
+            if header is not None:
+                yield from end_paragraph(start_line, start)
+                # skip the delimiter row
+                reader.next()
+                header = [strip_inline_markdown(cell) for cell in header]
+                table = MarkdownTable(header, [], alignments, heading, start_line, reader.line_num)
+                block = TableBlock(table, start)
+                block.end = reader.line_end
+                table.rows = _iter_table_rows(reader, block)
+                yield block
+                for _ in table.rows:
+                    pass
+                prev_line = line
+                continue
+
+        # headings
+        atx_match = _ATX_HEADING_PATTERN.match(line)
+        if atx_match:
+            yield from end_paragraph(start_line, start)
+            text = strip_inline_markdown(atx_match.group(2) or "")
+            heading = text or heading
+            yield HeadingBlock(start_line, reader.line_num, start, reader.line_end, len(atx_match.group(1)), text)
+            prev_line = line
+            continue
+        if (
+            line.strip()
+            and next_line is not None
+            and _SETEXT_UNDERLINE_PATTERN.match(next_line)
+            and not prev_line.strip()
+        ):
+            yield from end_paragraph(start_line, start)
+            text = strip_inline_markdown(line)
+            heading = text or heading
+            level = 1 if reader.next().strip().startswith("=") else 2
+            yield HeadingBlock(start_line, reader.line_num, start, reader.line_end, level, text)
+            prev_line = next_line
+            continue
+
+        # definitions
+        kind = next((kind for kind, pattern in _DEFINITION_PATTERNS.items() if pattern.match(line)), None)
+        if kind:
+            yield from end_paragraph(start_line, start)
+            yield DefinitionBlock(start_line, start, reader.line_end, kind)
+        elif not line.strip():
+            yield from end_paragraph(start_line, start)
+        elif paragraph_start is None:
+            paragraph_start = (start_line, start)
+        prev_line = line
+
+    yield from end_paragraph(reader.line_num, reader.line_end)
+
+
+def _get_front_matter_end(md_text: str) -> int:
+    """
+    Get the end of YAML front matter at the start of the text, starting with "---" and ending with "---" or "...",
+    or 0 if there is no front matter
+    """
+    reader = _LineReader(md_text)
+    reader.next()
+    if not (reader.peek() or "").strip():
+        # a thematic break followed by a blank line
+        return 0
+    while (line := reader.next()) is not None:
+        if _FRONT_MATTER_END_PATTERN.match(line):
+            return reader.line_end
+    return 0
+
+
+def _match_opening_fence(line: str) -> re.Match | None:
+    """Match opening code fence"""
+    fence_match = _FENCE_PATTERN.match(line)
+    return fence_match if fence_match and _is_opening_fence(fence_match) else None
+
+
+def _is_opening_fence(fence_match: re.Match) -> bool:
+    """Whether the fence matched is an opening fence, without backticks in the info string of backtick fence"""
+    return fence_match.group(2)[0] != "`" or "`" not in fence_match.group(3)
+
+
+def _find_fence_line(text: str, pos: int, marker: str) -> int:
+    """
+    Find the next line from the line starting at the offset, starting with the marker after up to 3 spaces,
+    located by str.find instead of matching each line
+    Returns:
+        Offset of the start of the line, or -1 if not found
+    """
+    while (marker_start := text.find(marker, pos)) != -1:
+        line_start = text.rfind("\n", pos, marker_start) + 1 or pos
+        if marker_start - line_start <= 3 and not text[line_start:marker_start].strip(" "):
+            return line_start
+        # skip the line, as fences start lines
+        pos = text.find("\n", marker_start) + 1
+        if not pos:
+            break
+    return -1
+
+
+def _find_fenced_code_end(text: str, fence: str, code_start: int) -> tuple[int, int, bool]:
+    """
+    Find the end of fenced code block by searching for the closing fence of the same character
+    and at least the same length as the opening fence, followed by nothing but whitespace
+    Returns:
+        End of the code, end of the block including the line of the closing fence, and whether the block is closed,
+        or the end of the text if there is no closing fence
+    """
+    pos = code_start
+    while (line_start := _find_fence_line(text, pos, fence)) != -1:
+        line_end = text.find("\n", line_start) + 1 or len(text)
+        if not text[line_start:line_end].strip().strip(fence[0]):
+            return line_start, line_end, True
+        pos = line_end
+    return len(text), len(text), False
+
+
+def _read_fenced_code_block(reader: _LineReader, fence_match: re.Match) -> FencedCodeBlock:
+    """Read lines of fenced code block, up to the closing fence or the end of the text"""
+    start_line = reader.line_num - 1
+    start = reader.line_start
+    code_start = reader.line_end
+    code_end, end, is_closed = _find_fenced_code_end(reader.text, fence_match.group(2), code_start)
+    reader.skip_to(end)
+    return FencedCodeBlock(
+        reader.text,
+        start_line,
+        reader.line_num,
+        start,
+        end,
+        fence_match.group(2),
+        fence_match.group(3).strip(),
+        len(fence_match.group(1)),
+        is_closed,
+        code_start,
+        code_end,
+    )
+
+
+def iter_fenced_code_blocks(md_text: str) -> Iterator[FencedCodeBlock]:
+    """
+    Scan Markdown text for fenced code blocks following CommonMark fence rules, in a single pass
+    Only the lines of the opening and closing fences are matched, found by str.find without reading other lines,
+    so that the scan is linear in the length of the text, including for unclosed fences
+    The blocks are the same as the fenced code blocks of iter_markdown_blocks
+    Args:
+        md_text: Markdown text
+    Returns:
+        Iterator of fenced code blocks, in document order
+    """
+    pos = _get_front_matter_end(md_text) if _LineReader(md_text).peek() == "---" else 0
+    line_num = md_text.count("\n", 0, pos)
+    # starts of the next lines with backtick and tilde fences, each found again only once passed
+    backtick_line = _find_fence_line(md_text, pos, "```")
+    tilde_line = _find_fence_line(md_text, pos, "~~~")
+    while True:
+        if 0 <= backtick_line < pos:
+            backtick_line = _find_fence_line(md_text, pos, "```")
+        if 0 <= tilde_line < pos:
+            tilde_line = _find_fence_line(md_text, pos, "~~~")
+        if backtick_line < 0 and tilde_line < 0:
+            break
+        line_start = tilde_line if backtick_line < 0 or 0 <= tilde_line < backtick_line else backtick_line
+        line_num += md_text.count("\n", pos, line_start)
+        fence_match = _FENCE_PATTERN.match(md_text, line_start)
+        code_start = md_text.find("\n", line_start) + 1 or len(md_text)
+        if not _is_opening_fence(fence_match):
+            pos = code_start
+            line_num += 1
+            continue
+        code_end, end, is_closed = _find_fenced_code_end(md_text, fence_match.group(2), code_start)
+        end_line = line_num + 1 + md_text.count("\n", code_start, end)
+        if end == len(md_text) and end > code_start and not md_text.endswith("\n"):
+            # the last line without line break
+            end_line += 1
+        yield FencedCodeBlock(
+            md_text,
+            line_num,
+            end_line,
+            line_start,
+            end,
+            fence_match.group(2),
+            fence_match.group(3).strip(),
+            len(fence_match.group(1)),
+            is_closed,
+            code_start,
+            code_end,
+        )
+        pos = end
+        line_num = end_line
+
+
+def _iter_table_rows(reader: _LineReader, block: TableBlock) -> Iterator[list[str]]:
+    table = block.table
+    column_count = len(table.header)
+    while (line := reader.peek()) is not None and line.strip() and "|" in line and not _match_opening_fence(line):
+        reader.next()
+        table.end_line = block.end_line = reader.line_num
+        block.end = reader.line_end
+        cells = [strip_inline_markdown(cell) for cell in split_table_row(line)]
+        # fit the row to the number of columns
+        yield cells[:column_count] + [""] * (column_count - len(cells))
+
+
+def split_text_at_offsets(md_text: str, boundaries: list[int], removed_blocks: list[MarkdownBlock]) -> Iterator[str]:
+    """
+    Split text at the offsets in order, without the text of the blocks removed
+    A removed block is removed with the blank line following it, so that the blank lines around it are not doubled,
+    and is kept if removing it would join the indented code blocks around it
+    """
+    removed = iter(removed_blocks)
+    block = next(removed, None)
+    start = 0
+    for boundary in [*boundaries, len(md_text)]:
+        parts = []
+        pos = start
+        while block is not None and block.start < boundary:
+            blank_line = _BLANK_LINE_PATTERN.match(md_text, block.end)
+            end = min(blank_line.end(), boundary) if blank_line else block.end
+            if not _is_between_indented_code(md_text, block.start, end):
+                parts.append(md_text[pos : block.start])
+                pos = end
+            block = next(removed, None)
+        parts.append(md_text[pos:boundary])
+        yield "".join(parts)
+        start = boundary
+
+
+def _is_between_indented_code(md_text: str, start: int, end: int) -> bool:
+    """Whether the nearest non-blank lines before start and from end are both lines of indented code blocks"""
+    line_end = start
+    while line_end > 0:
+        line_start = md_text.rfind("\n", 0, line_end - 1) + 1
+        if not _BLANK_LINE_PATTERN.fullmatch(md_text, line_start, line_end):
+            break
+        line_end = line_start
+    if line_end <= 0 or not _INDENTED_CODE_LINE_PATTERN.match(md_text, line_start):
+        return False
+
+    line_start = end
+    while (blank_line := _BLANK_LINE_PATTERN.match(md_text, line_start)) and blank_line.end() > line_start:
+        line_start = blank_line.end()
+    return bool(_INDENTED_CODE_LINE_PATTERN.match(md_text, line_start))
+
+
+def join_block_texts(md_text: str, blocks: list[MarkdownBlock]) -> str:
+    """Join the text of the blocks, each ending with a line break"""
+    texts = (md_text[block.start : block.end] for block in blocks)
+    return "".join(text if text.endswith("\n") else f"{text}\n" for text in texts)
+
+
+def parse_markdown_document(md_text: str) -> MarkdownDocument:
+    """
+    Parse Markdown text into a document of blocks, with all rows of tables read
+    Documents are memoized in an LRU cache keyed by content hash, and are shared, so they are not to be modified
+    Args:
+        md_text: Markdown text
+    Returns:
+        Parsed document
+    """
+    cache_size = get_document_cache_size()
+    if cache_size <= 0:
+        return _parse_markdown_document(md_text)
+
+    key = (hash(md_text), len(md_text))
+    with _document_cache_lock:
+        document = _document_cache.get(key)
+        if document is not None and document.text == md_text:
+            _document_cache.move_to_end(key)
+            return document
+
+    document = _parse_markdown_document(md_text)
+    with _document_cache_lock:
+        _document_cache[key] = document
+        while len(_document_cache) > cache_size:
+            _document_cache.popitem(last=False)
+    return document
+
+
+def get_document_cache_size() -> int:
+    return int(os.environ.get(DOCUMENT_CACHE_SIZE_ENV, DEFAULT_DOCUMENT_CACHE_SIZE))
+
+
+def _parse_markdown_document(md_text: str) -> MarkdownDocument:
+    blocks = []
+    for block in iter_markdown_blocks(md_text):
+        if isinstance(block, TableBlock):
+            block.table.rows = list(block.table.rows)
+        blocks.append(block)
+    return MarkdownDocument(md_text, blocks)
+
+
+# LRU cache of parsed documents, keyed by (hash, length) of the text and checked against the text on hits
+_document_cache: OrderedDict[tuple[int, int], MarkdownDocument] = OrderedDict()
+_document_cache_lock = threading.Lock()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Input reading utility functions
+"""
+
+import io
+import mmap
+import re
+import sys
+from pathlib import Path
+
+# Input path for reading from standard input
+STDIN_INPUT = "-"
+
+# Min size of input files read by memory mapping, in bytes
+MMAP_MIN_SIZE = 1024 * 1024
+
+_LEADING_WHITESPACE_BYTES_PATTERN = re.compile(rb"\s*")
+
+
+def read_md_input(input_arg: str) -> str:
+    """
+    Read input Markdown text in UTF-8 from a file, or from standard input if the input is "-"
+    Large files are memory-mapped, and the text is decoded from the mapping without the surrounding whitespace,
+    which is stripped in processing Markdown text anyway, so that the file content is neither read into bytes
+    nor copied again by stripping, and peak memory stays close to one copy of the text
+    Line breaks are translated to "\\n", as in reading in text mode
+    Args:
+        input_arg: Input file path, or "-" for standard input
+    Returns:
+        Markdown text
+    Raises:
+        FileNotFoundError: If the input file does not exist
+    """
+    if input_arg == STDIN_INPUT:
+        text = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="").read()
+    else:
+        input_path = Path(input_arg)
+        if not input_path.is_file():
+            raise FileNotFoundError(f"Input file '{input_path}' does not exist")
+        if input_path.stat().st_size < MMAP_MIN_SIZE:
+            return input_path.read_text(encoding="utf-8")
+        with input_path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = _LEADING_WHITESPACE_BYTES_PATTERN.match(mm).end()
+            end = len(mm)
+            while end > start and mm[end - 1] in b" \t\n\r\x0b\x0c":
+                end -= 1
+            with memoryview(mm)[start:end] as content:
+                text = str(content, "utf-8")
+    return _translate_line_breaks(text)
+
+
+def _translate_line_breaks(text: str) -> str:
+    """Translate "\\r\\n" and "\\r" line breaks to "\\n", copying the text only if it has any"""
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
@@ -0,0 +1,43 @@
+import json
+from datetime import date, datetime
+from typing import Any
+
+import numpy as np
+
+try:
+    # optional faster serializer
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(obj: Any) -> str:
+    """
+    Serialize object to compact JSON text, with orjson if installed or the standard json module otherwise
+    Non-ASCII characters are kept as is, and forward slashes are escaped as DataFrame.to_json does
+    Dates are serialized in ISO 8601 format
+    """
+    if orjson is not None:
+        text = orjson.dumps(obj, default=_to_json_value).decode("utf-8")
+    else:
+        text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_to_json_value)
+    return text.replace("/", "\\/")
+
+
+def dumps_json_lines(objs: list[Any]) -> str:
+    """Serialize objects to JSON Lines text, one object per line ending with newline, in the same way as dumps_json"""
+    if not objs:
+        return ""
+    if orjson is not None:
+        lines = b"".join(orjson.dumps(obj, default=_to_json_value, option=orjson.OPT_APPEND_NEWLINE) for obj in objs)
+        return lines.decode("utf-8").replace("/", "\\/")
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=_to_json_value).encode
+    return "".join(f"{dumps(obj)}\n" for obj in objs).replace("/", "\\/")
+
+
+def _to_json_value(obj: Any) -> Any:
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
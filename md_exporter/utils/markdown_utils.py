@@ -1,3 +1,7 @@
+import re
+import threading
+from collections.abc import Iterator
+
 import markdown
 
 
@@ -26,9 +30,39 @@ CSS_FOR_TABLE = """
 """
 
 
-def convert_markdown_to_html(md_text: str) -> str:
-    """Convert Markdown to HTML"""
-    html = markdown.markdown(text=md_text, extensions=["extra", "toc"])
+MARKDOWN_EXTENSIONS = ("extra", "toc")
+
+# python-markdown converters of each thread by extensions, reused across renderings
+_markdown_converters = threading.local()
+
+
+def render_markdown(md_text: str) -> str:
+    """Render Markdown to HTML with python-markdown"""
+    md = get_markdown_converter(MARKDOWN_EXTENSIONS)
+    try:
+        return md.convert(md_text)
+    finally:
+        # release the state of the document, e.g. stashed HTML and references
+        md.reset()
+
+
+def get_markdown_converter(extensions: tuple[str, ...]) -> markdown.Markdown:
+    """
+    Get python-markdown converter with the extensions, created once per thread and reused,
+    as loading and registering the extensions takes a large part of rendering small documents
+    The converter is not reentrant, and is to be reset after each conversion
+    """
+    if not hasattr(_markdown_converters, "by_extensions"):
+        _markdown_converters.by_extensions = {}
+    converters: dict[tuple[str, ...], markdown.Markdown] = _markdown_converters.by_extensions
+    md = converters.get(extensions)
+    if md is None:
+        md = converters[extensions] = markdown.Markdown(extensions=list(extensions))
+    return md
+
+
+def add_css_for_table(html: str) -> str:
+    """Add CSS for table if HTML contains table"""
     return (
         f"""
     {html}
@@ -39,28 +73,113 @@ def convert_markdown_to_html(md_text: str) -> str:
     )
 
 
+def convert_markdown_to_html(md_text: str) -> str:
+    """
+    Convert Markdown to HTML
+    Rendered incrementally with the HTML of unchanged blocks reused, if MD_EXPORTER_RENDER_CACHE_SIZE is set
+    """
+    from .render_cache_utils import PythonMarkdownRenderer, render_markdown_incrementally
+
+    html = render_markdown_incrementally(md_text, PythonMarkdownRenderer())
+    return add_css_for_table(html if html is not None else render_markdown(md_text))
+
+
 def get_md_text(
     md_text: str,
     is_strip_wrapper: bool = False,
     is_remove_think_tag: bool = True,
     is_normalize_line_breaks: bool = True,
 ) -> str:
-    """Process Markdown text"""
-    from .text_utils import normalize_line_breaks, remove_think_tags
+    """
+    Process Markdown text
+    Stripping, removing think tags and normalizing line breaks are done in one scan by preprocess_text
+    """
+    from .text_utils import preprocess_text
 
-    md_text = md_text.strip() if md_text else None
-    if not md_text:
+    if not md_text or md_text.isspace():
         raise ValueError("Empty input md_text")
 
-    # Remove think tags
-    if is_remove_think_tag:
-        md_text = remove_think_tags(md_text)
-
     if is_strip_wrapper:
-        md_text = strip_markdown_wrapper(md_text)
+        # the wrapper is stripped after removing think tags and before normalizing line breaks
+        md_text = strip_markdown_wrapper(
+            preprocess_text(md_text, is_remove_think_tag=is_remove_think_tag, is_normalize_line_breaks=False)
+        )
+        return preprocess_text(
+            md_text, is_strip=False, is_remove_think_tag=False, is_normalize_line_breaks=is_normalize_line_breaks
+        )
 
-    # Normalize line breaks
-    if is_normalize_line_breaks:
-        md_text = normalize_line_breaks(md_text)
+    return preprocess_text(
+        md_text, is_remove_think_tag=is_remove_think_tag, is_normalize_line_breaks=is_normalize_line_breaks
+    )
 
-    return md_text
+
+# Markers of the features of python-markdown rendered with the content of the whole document,
+# the table of contents, Markdown in HTML blocks and footnotes, which prevent rendering the text in parts
+WHOLE_DOCUMENT_MARKER_PATTERN = re.compile(r"\[TOC\]|<[^>]*\smarkdown\s*=|\[\^[^\]]+\]", re.IGNORECASE)
+
+
+def split_markdown_at_top_level_headings(md_text: str) -> list[str]:
+    """
+    Split Markdown text into sections, each starting at a top-level heading (the smallest heading level in use)
+    Headings in fenced code blocks are ignored, and link reference definitions are copied into every section
+    so that reference links keep resolving across sections
+    The whole text is a single section if it has footnotes, a table of contents marker or Markdown in HTML blocks,
+    which are rendered with the content of the whole document
+    """
+    from .document_utils import join_block_texts, parse_markdown_document, split_text_at_offsets
+
+    if WHOLE_DOCUMENT_MARKER_PATTERN.search(md_text):
+        return [md_text]
+
+    document = parse_markdown_document(md_text)
+    headings = document.headings
+    if not headings:
+        return [md_text]
+
+    top_level = min(heading.level for heading in headings)
+    boundaries = [heading.start for heading in headings if heading.level == top_level and heading.start > 0]
+    reference_definitions = document.get_definitions("link")
+    sections = [
+        section for section in split_text_at_offsets(md_text, boundaries, reference_definitions) if section.strip()
+    ]
+
+    if reference_definitions:
+        definitions = join_block_texts(md_text, reference_definitions)
+        sections = [f"{section.rstrip()}\n\n{definitions}" for section in sections]
+    return sections
+
+
+def split_markdown_into_chunks(md_text: str, chunk_size: int) -> tuple[Iterator[str], str]:
+    """
+    Split Markdown text into chunks of at least chunk_size characters, at headings outside fenced code blocks,
+    so that the chunks can be rendered one at a time
+    The whole text is a single chunk if it has footnotes, a table of contents marker or Markdown in HTML blocks,
+    which are rendered with the content of the whole document
+    Returns:
+        Iterator of chunks, and the link reference and abbreviation definitions of the whole text,
+        which are removed from the chunks and to be rendered with each chunk
+    """
+    from .document_utils import (
+        DefinitionBlock,
+        HeadingBlock,
+        iter_markdown_blocks,
+        join_block_texts,
+        split_text_at_offsets,
+    )
+
+    if len(md_text) <= chunk_size or WHOLE_DOCUMENT_MARKER_PATTERN.search(md_text):
+        return iter([md_text]), ""
+
+    # scan the blocks lazily, without holding the rows of tables as the memoized document does
+    boundaries = []
+    definitions = []
+    chunk_start = 0
+    for block in iter_markdown_blocks(md_text):
+        if isinstance(block, HeadingBlock) and block.start - chunk_start >= chunk_size:
+            boundaries.append(block.start)
+            chunk_start = block.start
+        elif isinstance(block, DefinitionBlock):
+            if block.kind == "footnote":
+                return iter([md_text]), ""
+            definitions.append(block)
+    return split_text_at_offsets(md_text, boundaries, definitions), join_block_texts(md_text, definitions)
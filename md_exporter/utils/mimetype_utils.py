@@ -2,6 +2,7 @@ from enum import StrEnum
 
 
 class MimeType(StrEnum):
+    ARROW = "application/vnd.apache.arrow.file"
     CSS = "text/css"
     CSV = "text/csv"
     DOCX = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
@@ -12,6 +13,7 @@ class MimeType(StrEnum):
     JSON = "application/json"
     LATEX = "application/x-tex"
     MD = "text/markdown"
+    PARQUET = "application/vnd.apache.parquet"
     PDF = "application/pdf"
     PHP = "application/x-httpd-php"
     PNG = "image/png"
@@ -19,6 +21,7 @@ class MimeType(StrEnum):
     PY = "text/x-python"
     RST = "text/prs.fallenstein.rst"
     RUBY = "text/x-ruby"
+    SQLITE = "application/vnd.sqlite3"
     TXT = "text/plain"
     SH = "application/x-sh"
     SVG = "image/svg+xml"
@@ -35,6 +38,7 @@ class MimeType(StrEnum):
         :return: file extension with "." as prefix, e.g. ".txt"
         """
         mime_type_map = {
+            cls.ARROW: ".arrow",
             cls.CSS: ".css",
             cls.CSV: ".csv",
             cls.EPUB: ".epub",
@@ -45,6 +49,7 @@ class MimeType(StrEnum):
             cls.JSON: ".json",
             cls.LATEX: ".tex",
             cls.MD: ".md",
+            cls.PARQUET: ".parquet",
             cls.PDF: ".pdf",
             cls.PHP: ".php",
             cls.PNG: ".png",
@@ -52,6 +57,7 @@ class MimeType(StrEnum):
             cls.PY: ".py",
             cls.RST: ".rst",
             cls.RUBY: ".rb",
+            cls.SQLITE: ".sqlite",
             cls.TXT: ".txt",
             cls.SH: ".sh",
             cls.SVG: ".svg",
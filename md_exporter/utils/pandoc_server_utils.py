@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Pandoc server pool utility functions
+Keeps long-lived `pandoc server` processes alive to avoid process spawn and RTS startup on every conversion
+"""
+
+import atexit
+import base64
+import json
+import os
+import queue
+import socket
+import subprocess
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+from pypandoc import get_pandoc_path
+
+from .logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Number of pandoc server processes kept alive in the pool
+PANDOC_SERVER_POOL_SIZE_ENV = "MD_EXPORTER_PANDOC_SERVER_POOL_SIZE"
+DEFAULT_PANDOC_SERVER_POOL_SIZE = 2
+
+# Timeout in seconds for a single conversion, the default of pandoc server (2s) is too short for large documents
+PANDOC_SERVER_TIMEOUT_SECONDS = 120
+PANDOC_SERVER_STARTUP_TIMEOUT_SECONDS = 10
+
+
+class PandocServerWorker:
+    """A long-lived `pandoc server` process listening on a local port"""
+
+    def __init__(self, pandoc_path: str):
+        self.port = _find_free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        self.process = subprocess.Popen(
+            [pandoc_path, "server", f"--port={self.port}", f"--timeout={PANDOC_SERVER_TIMEOUT_SECONDS}"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        self._wait_until_ready()
+
+    def _wait_until_ready(self) -> None:
+        deadline = time.monotonic() + PANDOC_SERVER_STARTUP_TIMEOUT_SECONDS
+        while time.monotonic() < deadline:
+            if not self.is_alive():
+                raise RuntimeError(f"pandoc server exited with code {self.process.returncode}")
+            try:
+                with urllib.request.urlopen(f"{self.url}/version", timeout=1):
+                    return
+            except OSError:
+                time.sleep(0.05)
+        self.close()
+        raise RuntimeError(f"pandoc server not ready on port {self.port}")
+
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+
+    def convert(self, payload: dict) -> dict:
+        request = urllib.request.Request(
+            self.url,
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json", "Accept": "application/json"},
+        )
+        with urllib.request.urlopen(request, timeout=PANDOC_SERVER_TIMEOUT_SECONDS + 5) as response:
+            return json.loads(response.read())
+
+    def close(self) -> None:
+        if self.is_alive():
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+
+class PandocServerPool:
+    """A fixed-size pool of pandoc server workers, each serving one conversion at a time"""
+
+    def __init__(self, size: int, pandoc_path: str):
+        self.size = size
+        self.pandoc_path = pandoc_path
+        self._workers: queue.Queue[PandocServerWorker] = queue.Queue()
+        self._all_workers: list[PandocServerWorker] = []
+        try:
+            for _ in range(size):
+                self._add_worker()
+        except Exception:
+            self.close()
+            raise
+
+    def _add_worker(self) -> None:
+        worker = PandocServerWorker(self.pandoc_path)
+        self._all_workers.append(worker)
+        self._workers.put(worker)
+
+    def convert(
+        self,
+        source_text: str,
+        input_format: str,
+        dest_format: str,
+        extra_args: list[str] | None = None,
+    ) -> bytes:
+        """
+        Convert text with a pooled pandoc server
+        :return: bytes of the conversion result
+        """
+        payload = {"text": source_text, "from": input_format, "to": dest_format}
+        payload.update(_to_server_options(extra_args or []))
+
+        worker = self._workers.get()
+        try:
+            if not worker.is_alive():
+                new_worker = PandocServerWorker(self.pandoc_path)
+                self._all_workers.remove(worker)
+                self._all_workers.append(new_worker)
+                worker = new_worker
+            result = worker.convert(payload)
+        finally:
+            self._workers.put(worker)
+
+        if "error" in result:
+            raise RuntimeError(f"pandoc server conversion failed: {result['error']}")
+        output = result["output"]
+        if result.get("base64"):
+            return base64.b64decode(output)
+        # keep the trailing line break as written by the pandoc command line
+        return (output if output.endswith("\n") else f"{output}\n").encode("utf-8")
+
+    def close(self) -> None:
+        for worker in self._all_workers:
+            worker.close()
+
+
+def _find_free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _to_server_options(extra_args: list[str]) -> dict:
+    """
+    Translate pandoc command line arguments to pandoc server options
+    Files referenced by the arguments are embedded, as pandoc server has no access to the file system
+    """
+    options = {}
+    files = {}
+    for arg in extra_args:
+        if arg.startswith("--reference-doc="):
+            reference_doc = Path(arg[len("--reference-doc=") :])
+            options["reference-doc"] = reference_doc.name
+            files[reference_doc.name] = base64.b64encode(reference_doc.read_bytes()).decode("ascii")
+        else:
+            raise ValueError(f"Unsupported pandoc argument for pandoc server: {arg}")
+    if files:
+        options["files"] = files
+    return options
+
+
+_pool: PandocServerPool | None = None
+_pool_lock = threading.Lock()
+_pool_failed = False
+
+
+def get_pandoc_server_pool() -> PandocServerPool | None:
+    """
+    Get the process-wide pandoc server pool, starting it on first use
+    :return: the pool, or None if pandoc server is unavailable
+    """
+    global _pool, _pool_failed
+    if _pool or _pool_failed:
+        return _pool
+
+    with _pool_lock:
+        if _pool or _pool_failed:
+            return _pool
+        try:
+            size = int(os.environ.get(PANDOC_SERVER_POOL_SIZE_ENV, DEFAULT_PANDOC_SERVER_POOL_SIZE))
+            _pool = PandocServerPool(size=max(size, 1), pandoc_path=get_pandoc_path())
+            atexit.register(_pool.close)
+            logger.debug(f"Started pandoc server pool with {_pool.size} workers")
+        except Exception as e:
+            _pool_failed = True
+            logger.warning(f"Pandoc server pool unavailable, falling back to pandoc subprocess: {e}")
+    return _pool
@@ -3,10 +3,14 @@
 Pandoc utility functions
 """
 
+import hashlib
 import os
-import tempfile
+import subprocess
+import threading
+from collections import OrderedDict
+from pathlib import Path
 
-from pypandoc import convert_file
+from pypandoc import convert_file, get_pandoc_path
 
 from md_exporter.utils import get_logger
 
@@ -16,8 +20,65 @@ DEFAULT_DISABLED_INPUT_EXTENSIONS = [
     "space_in_atx_header",  # https://pandoc.org/MANUAL.html#extension-space_in_atx_header
 ]
 
+# Pandoc engines, set by environment variable MD_EXPORTER_PANDOC_ENGINE
+PANDOC_ENGINE_ENV = "MD_EXPORTER_PANDOC_ENGINE"
+PANDOC_ENGINE_SUBPROCESS = "subprocess"  # start a new pandoc process for each conversion (default)
+PANDOC_ENGINE_SERVER = "server"  # reuse a pool of long-lived `pandoc server` processes
+
+# Max total size in bytes of pandoc JSON ASTs kept in the LRU cache,
+# set by environment variable MD_EXPORTER_PANDOC_AST_CACHE_MAX_BYTES
+# The AST cache is disabled if set to 0 (default), as reading into the AST costs an extra pandoc run on cache misses
+PANDOC_AST_CACHE_MAX_BYTES_ENV = "MD_EXPORTER_PANDOC_AST_CACHE_MAX_BYTES"
+DEFAULT_PANDOC_AST_CACHE_MAX_BYTES = 0
+
 logger = get_logger(__name__)
 
+# LRU cache of pandoc JSON AST and its size in bytes, keyed by (content hash, input format with extensions)
+_ast_cache: OrderedDict[tuple[str, str], tuple[str, int]] = OrderedDict()
+_ast_cache_bytes = 0
+_ast_cache_lock = threading.Lock()
+_ast_key_locks: dict[tuple[str, str], threading.Lock] = {}
+
+
+def get_pandoc_engine() -> str:
+    return os.environ.get(PANDOC_ENGINE_ENV, PANDOC_ENGINE_SUBPROCESS).strip().lower()
+
+
+def get_pandoc_ast_cache_max_bytes() -> int:
+    return int(os.environ.get(PANDOC_AST_CACHE_MAX_BYTES_ENV, DEFAULT_PANDOC_AST_CACHE_MAX_BYTES))
+
+
+def _build_input_format(input_format: str, enabled: list[str], disabled: list[str]) -> str:
+    """Build format string with extensions, e.g. `markdown+ext1-ext2`"""
+    if not input_format:
+        raise ValueError("input_format must be specified")
+    format_w_extensions = input_format
+    if enabled:
+        format_w_extensions += "+" + "+".join(enabled)
+    if disabled:
+        format_w_extensions += "-" + "-".join(disabled)
+    return format_w_extensions
+
+
+def _convert_with_server(source_text: str, input_format: str, dest_format: str, extra_args: list[str]) -> bytes | None:
+    """
+    Convert with the pandoc server pool if the server engine is enabled
+    :return: bytes of the conversion result, or None if the caller should fall back to pandoc subprocess
+    """
+    if get_pandoc_engine() != PANDOC_ENGINE_SERVER:
+        return None
+
+    from .pandoc_server_utils import get_pandoc_server_pool
+
+    pool = get_pandoc_server_pool()
+    if not pool:
+        return None
+    try:
+        return pool.convert(source_text, input_format, dest_format, extra_args)
+    except Exception as e:
+        logger.warning(f"Failed to convert with pandoc server, falling back to pandoc subprocess: {e}")
+        return None
+
 
 def pandoc_convert_file(
     source_file: str,
@@ -32,17 +93,14 @@ def pandoc_convert_file(
     Convert file using pandoc
     """
     extra_args = extra_args or []
-    enabled = enabled_input_extensions or []
-    disabled = disabled_input_extensions or []
+    format_w_extensions = _build_input_format(input_format, enabled_input_extensions, disabled_input_extensions)
 
-    # Build format string with extensions
-    if not input_format:
-        raise ValueError("input_format must be specified")
-    format_w_extensions = input_format
-    if enabled:
-        format_w_extensions += "+" + "+".join(enabled)
-    if disabled:
-        format_w_extensions += "-" + "-".join(disabled)
+    result_bytes = _convert_with_server(
+        Path(source_file).read_text(encoding="utf-8"), format_w_extensions, dest_format, extra_args
+    )
+    if result_bytes is not None:
+        Path(outputfile).write_bytes(result_bytes)
+        return
 
     convert_file(
         source_file=source_file,
@@ -53,28 +111,133 @@ def pandoc_convert_file(
     )
 
 
+def pandoc_convert_text(
+    source_text: str,
+    input_format: str,
+    dest_format: str,
+    extra_args: list[str] = None,
+    enabled_input_extensions: list[str] = DEFAULT_ENABLED_INPUT_EXTENSIONS,
+    disabled_input_extensions: list[str] = DEFAULT_DISABLED_INPUT_EXTENSIONS,
+    use_ast_cache: bool = True,
+) -> str:
+    """
+    Convert text to a textual format (e.g. HTML) using pandoc
+    """
+    return pandoc_convert_to_bytes(
+        source_text,
+        input_format,
+        dest_format,
+        extra_args,
+        enabled_input_extensions,
+        disabled_input_extensions,
+        use_ast_cache,
+    ).decode("utf-8")
+
+
+def pandoc_convert_to_bytes(
+    source_text: str,
+    input_format: str,
+    dest_format: str,
+    extra_args: list[str] = None,
+    enabled_input_extensions: list[str] = DEFAULT_ENABLED_INPUT_EXTENSIONS,
+    disabled_input_extensions: list[str] = DEFAULT_DISABLED_INPUT_EXTENSIONS,
+    use_ast_cache: bool = True,
+) -> bytes:
+    """
+    Convert text in memory using pandoc, without temporary input or output files
+    The source text is piped to stdin and the result (binary formats included) is captured from stdout
+    If the AST cache is enabled and use_ast_cache is set, the source text is read into the cached pandoc JSON AST first,
+    so that converting the same text to other formats or again skips the reader
+    """
+    extra_args = extra_args or []
+    format_w_extensions = _build_input_format(input_format, enabled_input_extensions, disabled_input_extensions)
+
+    if use_ast_cache and input_format != "json" and get_pandoc_ast_cache_max_bytes() > 0:
+        source_text = _get_pandoc_ast(source_text, format_w_extensions)
+        if dest_format == "json":
+            return source_text.encode("utf-8")
+        format_w_extensions = "json"
+
+    return _convert(source_text, format_w_extensions, dest_format, extra_args)
+
+
+def get_pandoc_ast(
+    source_text: str,
+    input_format: str = "markdown",
+    enabled_input_extensions: list[str] = DEFAULT_ENABLED_INPUT_EXTENSIONS,
+    disabled_input_extensions: list[str] = DEFAULT_DISABLED_INPUT_EXTENSIONS,
+) -> str:
+    """
+    Get pandoc JSON AST of the source text, from the LRU cache keyed by content hash if available
+    """
+    format_w_extensions = _build_input_format(input_format, enabled_input_extensions, disabled_input_extensions)
+    if get_pandoc_ast_cache_max_bytes() <= 0:
+        return _convert(source_text, format_w_extensions, "json", []).decode("utf-8")
+    return _get_pandoc_ast(source_text, format_w_extensions)
+
+
+def _get_pandoc_ast(source_text: str, format_w_extensions: str) -> str:
+    global _ast_cache_bytes
+
+    key = (hashlib.sha256(source_text.encode("utf-8")).hexdigest(), format_w_extensions)
+    with _ast_cache_lock:
+        entry = _ast_cache.get(key)
+        if entry is not None:
+            _ast_cache.move_to_end(key)
+            return entry[0]
+        # make concurrent requests for the same text wait for a single pandoc reader run
+        key_lock = _ast_key_locks.setdefault(key, threading.Lock())
+
+    with key_lock:
+        with _ast_cache_lock:
+            entry = _ast_cache.get(key)
+        if entry is not None:
+            return entry[0]
+        try:
+            ast_bytes = _convert(source_text, format_w_extensions, "json", [])
+            ast = ast_bytes.decode("utf-8")
+            # an AST larger than the whole cache is not cached, instead of evicting all the others
+            max_bytes = get_pandoc_ast_cache_max_bytes()
+            if len(ast_bytes) <= max_bytes:
+                with _ast_cache_lock:
+                    _ast_cache[key] = (ast, len(ast_bytes))
+                    _ast_cache_bytes += len(ast_bytes)
+                    while _ast_cache_bytes > max_bytes:
+                        _, (_, evicted_bytes) = _ast_cache.popitem(last=False)
+                        _ast_cache_bytes -= evicted_bytes
+        finally:
+            with _ast_cache_lock:
+                _ast_key_locks.pop(key, None)
+    return ast
+
+
+def _convert(source_text: str, format_w_extensions: str, dest_format: str, extra_args: list[str]) -> bytes:
+    """Convert text with pandoc server if enabled, or with pandoc subprocess"""
+    result_bytes = _convert_with_server(source_text, format_w_extensions, dest_format, extra_args)
+    if result_bytes is not None:
+        return result_bytes
+
+    completed = subprocess.run(
+        [get_pandoc_path(), "--from", format_w_extensions, "--to", dest_format, "--output", "-", *extra_args],
+        input=source_text.encode("utf-8"),
+        capture_output=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(
+            f"Pandoc died with exitcode {completed.returncode} during conversion: "
+            f"{completed.stderr.decode('utf-8', errors='replace')}"
+        )
+    return completed.stdout
+
+
 def _warmup_pandoc() -> None:
     """
-    Warm up pandoc by converting a mock Markdown file
+    Warm up pandoc by converting a mock Markdown text
     This improves loading speed for subsequent pandoc operations
     """
     try:
-        # Create a temporary directory
-        with tempfile.TemporaryDirectory(delete=True) as temp_dir:
-            # Create a mock Markdown file
-            input_file = os.path.join(temp_dir, "mock.md")
-            output_file = os.path.join(temp_dir, "mock.docx")
-
-            # Write minimal Markdown content
-            with open(input_file, "w") as f:
-                f.write("# Test\n\nThis is a test.")
-
-            # Convert the file
-            pandoc_convert_file(
-                source_file=input_file, input_format="markdown", dest_format="docx", outputfile=output_file
-            )
-
-            logger.debug("Pandoc warm-up completed successfully")
+        pandoc_convert_to_bytes(source_text="# Test\n\nThis is a test.", input_format="markdown", dest_format="docx")
+        logger.debug("Pandoc warm-up completed successfully")
     except Exception as e:
         # Log the error but don't block module import
         logger.debug(f"Pandoc warm-up failed: {e}")
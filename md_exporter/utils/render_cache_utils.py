@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Incremental rendering of Markdown text to HTML
+The text is split into blocks at headings, and the HTML of each block is cached by content hash,
+so that rendering a document edited since the previous rendering only renders the changed blocks again
+"""
+
+import hashlib
+import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from .document_utils import (
+    DefinitionBlock,
+    FencedCodeBlock,
+    HeadingBlock,
+    iter_markdown_blocks,
+    join_block_texts,
+    split_text_at_offsets,
+)
+from .markdown_utils import WHOLE_DOCUMENT_MARKER_PATTERN, render_markdown
+
+# Max number of rendered blocks kept in the LRU cache, set by environment variable MD_EXPORTER_RENDER_CACHE_SIZE
+# Incremental rendering is disabled if set to 0
+RENDER_CACHE_SIZE_ENV = "MD_EXPORTER_RENDER_CACHE_SIZE"
+DEFAULT_RENDER_CACHE_SIZE = 0
+
+_ID_ATTRIBUTE_PATTERN = re.compile(r'\sid="([^"]*)"')
+# IDs set explicitly by attribute lists, e.g. "## Details {#details}" or "{: #details .note}"
+_EXPLICIT_ID_PATTERN = re.compile(r"\{(?:[^{}\n]*?[\s:])?#([^\s{}]+)")
+# IDs written in the headings preceding a block, as the context of the IDs generated in the block
+_CONTEXT_ID_PATTERN = re.compile(r"[\w.:-]*")
+
+
+class RenderedBlock:
+    __slots__ = ("html", "ids")
+
+    def __init__(self, html: str, ids: list[str]):
+        self.html = html
+        # IDs of the elements in the HTML, in document order
+        self.ids = ids
+
+
+class BlockRenderer(ABC):
+    """
+    Renderer of Markdown blocks to HTML fragments, which are concatenated to the HTML of the whole document
+    Heading IDs unique in the whole document are generated by rendering a block after the headings with the IDs
+    used in the preceding blocks
+    """
+
+    # name of the renderer in the cache keys
+    name = ""
+    # separator of the number suffixed to heading IDs to make them unique, e.g. "intro_1"
+    id_separator = "_"
+    # max number of blocks rendered concurrently
+    max_workers = 1
+    # kinds of the definitions rendered with every block, as they are referred to across the document
+    definition_kinds = ("link", "abbreviation")
+
+    def is_whole_document(self, prose: str, headings: list[str]) -> bool:
+        """
+        Whether the text has features rendered with the content of the whole document
+        Args:
+            prose: Text outside fenced code blocks
+            headings: Text of the headings
+        """
+        return bool(WHOLE_DOCUMENT_MARKER_PATTERN.search(prose))
+
+    @abstractmethod
+    def render(self, md_text: str, definitions: str, context_ids: list[str], is_last: bool) -> str | None:
+        """
+        Render a block with the definitions of the whole text,
+        preceded by the headings with the context IDs, which are removed from the HTML
+        Returns:
+            HTML of the block ending with the separator from the next block, or None if the block does not end
+            at a block boundary and is to be rendered with the next block
+        """
+
+    def get_ids(self, html: str) -> list[str]:
+        return _ID_ATTRIBUTE_PATTERN.findall(html)
+
+    @staticmethod
+    def get_context_headings(context_ids: list[str]) -> tuple[str, str]:
+        """Get the Markdown and the rendered HTML of the headings with the context IDs"""
+        context_md = "".join(f"# _ {{#{context_id}}}\n\n" for context_id in context_ids)
+        context_html = "".join(f'<h1 id="{context_id}">_</h1>\n' for context_id in context_ids)
+        return context_md, context_html
+
+    def relocate(self, html: str, state: dict) -> str:
+        """
+        Adjust the HTML of a block rendered alone to follow the HTML of the preceding blocks,
+        e.g. numbers of the elements counted across the document, with the state kept across the blocks
+        """
+        return html
+
+
+class PythonMarkdownRenderer(BlockRenderer):
+    """Renderer with python-markdown, as render_markdown"""
+
+    name = "python-markdown"
+    id_separator = "_"
+
+    # heading rendered after a block other than the last one, to find where the block ends in the rendered HTML
+    _END_MARKER = "MdExporterBlockEnd"
+    _END_MARKER_HTML = f'<h1 id="{_END_MARKER.lower()}">{_END_MARKER}</h1>'
+
+    def render(self, md_text: str, definitions: str, context_ids: list[str], is_last: bool) -> str | None:
+        context_md, context_html = self.get_context_headings(context_ids)
+        # definitions are put before the block, so that the HTML of the block ends right before the marker
+        md_text = f"{context_md}{definitions}\n\n{md_text}" if definitions else f"{context_md}{md_text}"
+        html = render_markdown(md_text if is_last else f"{md_text}# {self._END_MARKER}\n")
+        if not html.startswith(context_html):
+            return None
+        html = html[len(context_html) :]
+        if is_last:
+            return html
+        return html[: -len(self._END_MARKER_HTML)] if html.endswith(self._END_MARKER_HTML) else None
+
+
+def render_markdown_incrementally(md_text: str, renderer: BlockRenderer) -> str | None:
+    """
+    Render Markdown text to HTML block by block, with the HTML of each block cached by content hash
+    The text is split before the headings following a blank line outside fenced code blocks,
+    and the definitions referred to across the document are rendered with every block
+    Args:
+        md_text: Markdown text
+        renderer: Renderer of blocks
+    Returns:
+        HTML of the whole text, or None if incremental rendering is disabled or not applicable to the text,
+        which is to be rendered as a whole
+    """
+    if get_render_cache_size() <= 0:
+        return None
+    blocks, definitions, headings, prose = _split_into_blocks(md_text, renderer.definition_kinds)
+    if renderer.is_whole_document(prose, headings):
+        return None
+    # IDs generated for the whole document avoid the explicit IDs anywhere in it, including in the following blocks
+    explicit_ids = set(_EXPLICIT_ID_PATTERN.findall(prose))
+    used_explicit_ids: set[str] = set()
+    if renderer.max_workers > 1:
+        _prefetch_blocks(blocks, definitions, renderer)
+
+    htmls: list[str] = []
+    used_ids: set[str] = set()
+    state: dict = {}
+    pending = ""
+    for i, block in enumerate(blocks):
+        block = pending + block
+        is_last = i == len(blocks) - 1
+        rendered = _get_rendered_block(block, definitions, [], is_last, renderer)
+        if rendered is None:
+            # the block does not end at a block boundary, e.g. inside a raw HTML block, so render it with the next one
+            pending = block
+            continue
+        pending = ""
+
+        if used_ids.intersection(rendered.ids):
+            # render again after the headings with the IDs used in the preceding blocks which the IDs may depend on
+            context_ids = _get_context_ids(rendered.ids, used_ids, renderer.id_separator)
+            if not all(_CONTEXT_ID_PATTERN.fullmatch(context_id) for context_id in context_ids):
+                return None
+            rendered = _get_rendered_block(block, definitions, context_ids, is_last, renderer)
+            if rendered is None:
+                return None
+        for block_id in explicit_ids.intersection(rendered.ids):
+            # an ID set explicitly is also generated, for an element rendered without the explicit IDs of other blocks
+            if block_id in used_explicit_ids or rendered.ids.count(block_id) > 1:
+                return None
+            used_explicit_ids.add(block_id)
+        htmls.append(renderer.relocate(rendered.html, state))
+        used_ids.update(rendered.ids)
+    return "".join(htmls)
+
+
+def get_render_cache_size() -> int:
+    return int(os.environ.get(RENDER_CACHE_SIZE_ENV, DEFAULT_RENDER_CACHE_SIZE))
+
+
+def _split_into_blocks(md_text: str, definition_kinds: tuple[str, ...]) -> tuple[list[str], str, list[str], str]:
+    """
+    Split Markdown text before the headings following a blank line
+    Returns:
+        Blocks without the definitions, the definitions, the headings in plain text,
+        and the text outside fenced code blocks
+    """
+    boundaries = []
+    definitions = []
+    headings = []
+    code_blocks = []
+    prev_end_line = 0
+    for block in iter_markdown_blocks(md_text):
+        if isinstance(block, HeadingBlock):
+            headings.append(block.text)
+            if block.start > 0 and block.start_line > prev_end_line and md_text[block.start] not in " \t":
+                boundaries.append(block.start)
+        elif isinstance(block, DefinitionBlock) and block.kind in definition_kinds:
+            definitions.append(block)
+        elif isinstance(block, FencedCodeBlock):
+            code_blocks.append(block)
+        prev_end_line = block.end_line
+    blocks = list(split_text_at_offsets(md_text, boundaries, definitions))
+    prose = "".join(split_text_at_offsets(md_text, [], code_blocks))
+    return blocks, join_block_texts(md_text, definitions), headings, prose
+
+
+def _get_context_ids(ids: list[str], used_ids: set[str], id_separator: str) -> list[str]:
+    """Get the used IDs which the IDs may be made unique against, the IDs with or without the number suffixes"""
+    suffix_pattern = re.compile(rf"{re.escape(id_separator)}\d+$")
+    bases = {base for block_id in ids for base in (block_id, suffix_pattern.sub("", block_id))}
+    return sorted(
+        used_id
+        for used_id in used_ids
+        if used_id in bases or (suffix_pattern.search(used_id) and suffix_pattern.sub("", used_id) in bases)
+    )
+
+
+def _get_cache_key(
+    renderer: BlockRenderer, block: str, definitions: str, context_ids: list[str], is_last: bool
+) -> tuple[str, str]:
+    content = "\x00".join([*context_ids, str(is_last), definitions, block])
+    return renderer.name, hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _get_rendered_block(
+    block: str, definitions: str, context_ids: list[str], is_last: bool, renderer: BlockRenderer
+) -> RenderedBlock | None:
+    key = _get_cache_key(renderer, block, definitions, context_ids, is_last)
+    with _render_cache_lock:
+        rendered = _render_cache.get(key)
+        if rendered is not None:
+            _render_cache.move_to_end(key)
+            return rendered
+
+    html = renderer.render(block, definitions, context_ids, is_last)
+    if html is None:
+        return None
+    rendered = RenderedBlock(html, renderer.get_ids(html))
+    _put_rendered_block(key, rendered)
+    return rendered
+
+
+def _prefetch_blocks(blocks: list[str], definitions: str, renderer: BlockRenderer) -> None:
+    """Render the blocks not in the cache concurrently, without context IDs"""
+    keys = [_get_cache_key(renderer, block, definitions, [], i == len(blocks) - 1) for i, block in enumerate(blocks)]
+    with _render_cache_lock:
+        missing = [i for i, key in enumerate(keys) if key not in _render_cache]
+    if len(missing) <= 1:
+        return
+
+    def render(i: int) -> str | None:
+        return renderer.render(blocks[i], definitions, [], i == len(blocks) - 1)
+
+    with ThreadPoolExecutor(max_workers=min(renderer.max_workers, len(missing))) as executor:
+        for i, html in zip(missing, executor.map(render, missing)):
+            if html is not None:
+                _put_rendered_block(keys[i], RenderedBlock(html, renderer.get_ids(html)))
+
+
+def _put_rendered_block(key: tuple[str, str], rendered: RenderedBlock) -> None:
+    with _render_cache_lock:
+        _render_cache[key] = rendered
+        while len(_render_cache) > get_render_cache_size():
+            _render_cache.popitem(last=False)
+
+
+# LRU cache of rendered blocks, keyed by (renderer name, content hash of the block and its context)
+_render_cache: OrderedDict[tuple[str, str], RenderedBlock] = OrderedDict()
+_render_cache_lock = threading.Lock()
@@ -1,29 +1,213 @@
-from io import StringIO
+import itertools
+from collections.abc import Callable, Iterator
 from logging import Logger
+from pathlib import Path
+from typing import TextIO
 
-import markdown
 import pandas as pd
-from bs4 import BeautifulSoup
 
+from .document_utils import MarkdownTable, TableBlock, iter_markdown_blocks, parse_markdown_document
 from .markdown_utils import strip_markdown_wrapper
 
 SUGGESTED_SHEET_NAME = "suggested_sheet_name"
+COLUMN_ALIGNMENTS = "column_alignments"
 
+# Max length of headings suggested as sheet names
+MAX_HEADING_LENGTH = 30
 
-def extract_headings(html_str: str, extract_headings_for_sheet_names: bool) -> list[str]:
-    """Extract headings from HTML"""
-    if not extract_headings_for_sheet_names:
-        return []
+# Patterns of typed cells are compatible with both Python re and RE2 used by pyarrow backed string columns,
+# without lookarounds, backreferences or escapes of unicode characters
+_CURRENCY_SYMBOLS = "$€£¥₹₩"
+_GROUP_SPACES = " \u00a0\u202f"
+# Number formats of table cells, as (pattern of number, thousands separators, decimal separator)
+_NUMBER_PATTERNS = [
+    # 1,234.5 or 1.5e3
+    (r"(?:\d{1,3}(?:,\d{3})+|\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?", ",", "."),
+    # 1.234,5
+    (r"(?:\d{1,3}(?:\.\d{3})+|\d*)(?:,\d+)?", ".", ","),
+    # 1 234,5 or 1 234.5, grouped with spaces, no-break spaces or narrow no-break spaces
+    (rf"\d{{1,3}}(?:[{_GROUP_SPACES}]\d{{3}})+(?:[.,]\d+)?", _GROUP_SPACES, ","),
+    # 1'234.5
+    (r"\d{1,3}(?:'\d{3})+(?:\.\d+)?", "'", "."),
+]
+# Cells of number with optional sign, currency symbol and percent sign, e.g. "-$1,234.5", "12 €" or "12.5%"
+_NUMBER_FORMATS = [
+    (
+        rf"[-−]?\+?[{_CURRENCY_SYMBOLS}]?\s*[-−]?(?:{number_pattern})\s*(?:%|[{_CURRENCY_SYMBOLS}])?",
+        thousands_separators,
+        decimal_separator,
+    )
+    for number_pattern, thousands_separators, decimal_separator in _NUMBER_PATTERNS
+]
+_DATE_PATTERN = r"\d{4}(?:-\d{2}-\d{2}|/\d{2}/\d{2})(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)?"
 
-    soup = BeautifulSoup(html_str, "html.parser")
-    headings = []
-    for i in range(1, 6):
-        for tag in soup.find_all(f"h{i}"):
-            tag_text = tag.text.strip()
-            if tag_text:
-                tag_text = tag_text[0:30] if len(tag_text) > 30 else tag_text
-                headings.append(tag_text)
-    return headings
+
+def iter_md_tables(md_text: str) -> Iterator[MarkdownTable]:
+    """
+    Scan Markdown text line by line for GFM pipe tables, in a single pass without rendering to HTML
+    Each table is indexed with its span of lines and the nearest heading preceding it
+    Tables and headings in fenced code blocks are skipped
+    The rows of each table are read lazily, and the rows not consumed are skipped when moving to the next table
+    Args:
+        md_text: Markdown text
+    Returns:
+        Iterator of tables with cells in plain text, in document order
+    """
+    for block in iter_markdown_blocks(md_text):
+        if isinstance(block, TableBlock):
+            yield block.table
+
+
+def scan_md_tables(md_text: str) -> list[MarkdownTable]:
+    """
+    Scan Markdown text for GFM pipe tables, with all rows read into lists
+    The tables are shared with the parsed document memoized by parse_markdown_document, and are not to be modified
+    Args:
+        md_text: Markdown text
+    Returns:
+        Tables with cells in plain text, in document order
+    """
+    return parse_markdown_document(md_text).tables
+
+
+def write_md_tables_streaming(
+    md_text: str,
+    output_path: Path,
+    write_table: Callable[[TextIO, list[str], Iterator[list[str]]], None],
+) -> list[Path]:
+    """
+    Write tables of Markdown text to files one row at a time, without holding whole tables in memory
+    Tables are written to files named with suffix "_N" if there are multiple tables, as the other table exports do
+    Args:
+        md_text: Markdown text
+        output_path: Path of the output file
+        write_table: Function writing column names and rows of a table to an opened text file
+    Returns:
+        List of paths to the created files
+    Raises:
+        ValueError: If no table is found
+    """
+    md_text = strip_markdown_wrapper(md_text)
+    created_files = []
+    for table in iter_md_tables(md_text):
+        first_row = next(table.rows, None)
+        if first_row is None:
+            continue
+        output_file = output_path.parent / f"{output_path.stem}_{len(created_files) + 1}{output_path.suffix}"
+        with output_file.open("w", encoding="utf-8", newline="") as f:
+            write_table(f, get_column_names(table.header), itertools.chain([first_row], table.rows))
+        created_files.append(output_file)
+
+    if not created_files:
+        raise ValueError("No available tables parsed from markdown text")
+    if len(created_files) == 1:
+        created_files = [created_files[0].replace(output_path)]
+    return created_files
+
+
+def get_column_names(header: list[str]) -> list[str]:
+    """Get distinct column names, naming empty ones as "Unnamed: N" and suffixing duplicates with ".N" """
+    columns = []
+    seen: dict[str, int] = {}
+    for i, name in enumerate(header):
+        name = name or f"Unnamed: {i}"
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        seen.setdefault(name, 0)
+        columns.append(name)
+    return columns
+
+
+def _infer_column_type(column: pd.Series) -> pd.Series:
+    """
+    Convert column of text to typed values if all its non-empty values are of the same type, with vectorized string
+    operations on the whole column at once
+    Types are detected in order of booleans, numbers and dates, otherwise the column is kept as text
+    Empty cells are kept as empty text, making the column of object dtype
+    """
+    non_empty = column[column != ""]
+    if non_empty.empty:
+        return column
+    typed = _parse_booleans(non_empty)
+    if typed is None:
+        typed = _parse_numbers(non_empty)
+    if typed is None:
+        typed = _parse_dates(non_empty)
+    if typed is None:
+        return column
+    if len(non_empty) == len(column):
+        return typed
+    # keep empty cells as empty text
+    return column.astype(object).where(column == "", typed.astype(object).reindex(column.index))
+
+
+def iter_table_rows(table: pd.DataFrame) -> Iterator[tuple]:
+    """
+    Iterate over rows of table as tuples of Python objects
+    Much faster than DataFrame.itertuples for pyarrow backed string columns, by converting whole columns at once
+    """
+    return zip(*(table[col].tolist() for col in table.columns))
+
+
+def replace_empty_cells_with_none(table: pd.DataFrame) -> pd.DataFrame:
+    """
+    Replace empty cells of typed columns with None, for outputs with null values
+    Text columns keep empty cells as empty text
+    """
+    table = table.copy(deep=False)
+    for col in table.columns:
+        # typed columns with empty cells are kept as object columns by parse_md_to_tables
+        if table[col].dtype == object:
+            table[col] = table[col].where(table[col] != "", None)
+    return table
+
+
+def _parse_booleans(values: pd.Series) -> pd.Series | None:
+    """Parse "true" and "false" in any case to booleans, or None if any value is not boolean"""
+    lowered = values.str.lower()
+    if not lowered.isin(("true", "false")).all():
+        return None
+    return (lowered == "true").astype(bool)
+
+
+def _parse_numbers(values: pd.Series) -> pd.Series | None:
+    """
+    Parse numbers in any of the number formats, all the values in the same format, or None if not parsable
+    Currency symbols are dropped, and percentages are divided by 100, e.g. "$1,234.50" to 1234.5 and "12.5%" to 0.125
+    """
+    if not values.str.contains(r"\d").all():
+        return None
+    for pattern, thousands_separators, decimal_separator in _NUMBER_FORMATS:
+        if not values.str.fullmatch(pattern).all():
+            continue
+        # strip sign and currency symbol before the number, and currency symbol or percent sign after it
+        number_text = values.str.replace(r"^[^\d.,]+", "", regex=True).str.replace(r"[^\d]+$", "", regex=True)
+        # numbers with leading zeros are codes rather than quantities, e.g. zip codes or IDs
+        if number_text.str.match(r"0\d").any():
+            return None
+        number_text = number_text.str.replace(f"[{thousands_separators}]", "", regex=True)
+        if decimal_separator != ".":
+            number_text = number_text.str.replace(decimal_separator, ".", regex=False)
+        numbers = pd.to_numeric(number_text, errors="coerce")
+        if numbers.isna().any():
+            return None
+        is_negative = values.str.match(r"[^\d.,]*[-−]")
+        if is_negative.any():
+            numbers = numbers.where(~is_negative, -numbers)
+        is_percent = values.str.endswith("%")
+        if is_percent.any():
+            numbers = numbers.astype(float).where(~is_percent, numbers / 100)
+        return numbers
+    return None
+
+
+def _parse_dates(values: pd.Series) -> pd.Series | None:
+    """Parse ISO 8601 dates and date times, e.g. "2024-01-31" or "2024-01-31 08:00", or None if not parsable"""
+    if not values.str.fullmatch(_DATE_PATTERN).all():
+        return None
+    dates = pd.to_datetime(values.str.replace("/", "-", regex=False), format="ISO8601", errors="coerce")
+    return None if dates.isna().any() else dates
 
 
 def parse_md_to_tables(
@@ -35,28 +219,20 @@ def parse_md_to_tables(
     """Parse Markdown text to tables"""
     try:
         md_text = strip_markdown_wrapper(md_text)
-        if not md_text.startswith("|") and "|" in md_text:
-            md_text = md_text.replace("|", "\n|", 1)
-
-        html_str = markdown.markdown(text=md_text, extensions=["tables"])
-        tables: list[pd.DataFrame] = pd.read_html(StringIO(html_str), encoding="utf-8")
-        headings: list[str] = extract_headings(html_str, extract_headings_for_sheet_names)
-
-        def post_process_table(table: pd.DataFrame) -> pd.DataFrame:
-            table = table.fillna("")
-            if force_value_to_str:
-                for col in table.columns:
-                    if table[col].dtype not in {"object", "string"}:
-                        table[col] = table[col].astype(str)
-            return table
+        md_tables = scan_md_tables(md_text)
 
         result_tables = []
-        for i, table in enumerate(tables):
-            if not table.empty:
-                process_table = post_process_table(table)
-                if headings and i < len(headings):
-                    process_table.attrs[SUGGESTED_SHEET_NAME] = headings[i]
-                result_tables.append(process_table)
+        for md_table in md_tables:
+            if not md_table.rows:
+                continue
+            table = pd.DataFrame(md_table.rows, columns=get_column_names(md_table.header))
+            if not force_value_to_str:
+                for col in table.columns:
+                    table[col] = _infer_column_type(table[col])
+            table.attrs[COLUMN_ALIGNMENTS] = md_table.alignments
+            if extract_headings_for_sheet_names and md_table.heading:
+                table.attrs[SUGGESTED_SHEET_NAME] = md_table.heading[:MAX_HEADING_LENGTH]
+            result_tables.append(table)
 
         tables = result_tables
 
@@ -3,6 +3,9 @@ import re
 # Regex pattern for removing think tags
 THINK_TAG_REGEX = re.compile(r"<think>.*?</think>", flags=re.DOTALL)
 
+# Regex pattern for matching whitespace at the start of text
+LEADING_WHITESPACE_PATTERN = re.compile(r"\s*")
+
 # Regex pattern for matching Chinese characters
 CHINESE_CHAR_PATTERN = re.compile(r"[\u4e00-\u9fff]")
 
@@ -30,3 +33,36 @@ def normalize_line_breaks(text: str) -> str:
     if "\\n" in text:
         text = text.replace("\\n", "\n")
     return text
+
+
+def preprocess_text(
+    text: str, is_strip: bool = True, is_remove_think_tag: bool = True, is_normalize_line_breaks: bool = True
+) -> str:
+    """
+    Strip surrounding whitespace, remove think tags and normalize line breaks in one scan,
+    the same as applying strip, remove_think_tags and normalize_line_breaks in order
+    The text is copied only where it is changed, e.g. once for text with escaped line breaks and without think tags,
+    instead of a full copy for each step
+    """
+    start, end = _get_strip_bounds(text) if is_strip else (0, len(text))
+    if is_remove_think_tag:
+        # text between think tags
+        segments = []
+        for match in THINK_TAG_REGEX.finditer(text, start, end):
+            segments.append(text[start : match.start()])
+            start = match.end()
+        segments.append(text[start:end])
+        text = "".join(segments)
+    else:
+        # the whole text is sliced without copying if nothing is stripped
+        text = text[start:end]
+    return normalize_line_breaks(text) if is_normalize_line_breaks else text
+
+
+def _get_strip_bounds(text: str) -> tuple[int, int]:
+    """Get the start and end offsets of the text without surrounding whitespace, as str.strip, without copying"""
+    start = LEADING_WHITESPACE_PATTERN.match(text).end()
+    end = len(text)
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
@@ -0,0 +1,56 @@
+import io
+import zipfile
+from collections.abc import Iterable
+from pathlib import Path
+from typing import BinaryIO
+
+# Entries in these formats are compressed already, and stored as is in ZIP file
+ALREADY_COMPRESSED_SUFFIXES = {
+    ".docx",
+    ".gif",
+    ".gz",
+    ".jpeg",
+    ".jpg",
+    ".png",
+    ".pptx",
+    ".webp",
+    ".xlsx",
+    ".zip",
+}
+
+
+def get_zip_compression(arcname: str) -> int:
+    """Get compression method of ZIP entry, skipping DEFLATE for already compressed formats"""
+    if Path(arcname).suffix.lower() in ALREADY_COMPRESSED_SUFFIXES:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def write_zip(dest: Path | BinaryIO, entries: Iterable[tuple[str, bytes]]) -> int:
+    """
+    Write entries into ZIP file, streaming each entry straight to the destination
+    Args:
+        dest: Path or writable binary stream of the ZIP file
+        entries: Iterable of (name in archive, content) pairs, consumed one at a time
+    Returns:
+        Number of entries written
+    """
+    count = 0
+    with zipfile.ZipFile(dest, mode="w", compression=zipfile.ZIP_DEFLATED) as zip_file:
+        for arcname, data in entries:
+            zip_file.writestr(arcname, data, compress_type=get_zip_compression(arcname))
+            count += 1
+    return count
+
+
+def zip_to_bytes(entries: Iterable[tuple[str, bytes]]) -> bytes:
+    """
+    Write entries into an in-memory ZIP file
+    Args:
+        entries: Iterable of (name in archive, content) pairs
+    Returns:
+        Content of the ZIP file
+    """
+    buffer = io.BytesIO()
+    write_zip(buffer, entries)
+    return buffer.getvalue()
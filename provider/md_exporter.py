@@ -3,6 +3,7 @@ from typing import Any
 from dify_plugin import ToolProvider
 from dify_plugin.errors.tool import ToolProviderCredentialValidationError
 
+from tools.md_to_arrow.md_to_arrow import MarkdownToArrowTool
 from tools.md_to_codeblock.md_to_codeblock import MarkdownToCodeblockTool
 from tools.md_to_csv.md_to_csv import MarkdownToCsvTool
 from tools.md_to_docx.md_to_docx import MarkdownToDocxTool
@@ -12,9 +13,11 @@ from tools.md_to_ipynb.md_to_ipynb import MarkdownToIpynbTool
 from tools.md_to_json.md_to_json import MarkdownToJsonTool
 from tools.md_to_latex.md_to_latex import MarkdownToLatexTool
 from tools.md_to_md.md_to_md import MarkdownToMarkdownTool
+from tools.md_to_parquet.md_to_parquet import MarkdownToParquetTool
 from tools.md_to_pdf.md_to_pdf import MarkdownToPdfTool
 from tools.md_to_png.md_to_png import MarkdownToPngTool
 from tools.md_to_pptx.md_to_pptx import MarkdownToPptxTool
+from tools.md_to_sqlite.md_to_sqlite import MarkdownToSqliteTool
 from tools.md_to_xlsx.md_to_xlsx import MarkdownToXlsxTool
 from tools.md_to_xml.md_to_xml import MarkdownToXmlTool
 
@@ -26,6 +29,7 @@ class MdExporterProvider(ToolProvider):
             IMPLEMENT YOUR VALIDATION HERE
             """
             tools = [
+                MarkdownToArrowTool,
                 MarkdownToCodeblockTool,
                 MarkdownToCsvTool,
                 MarkdownToDocxTool,
@@ -34,9 +38,11 @@ class MdExporterProvider(ToolProvider):
                 MarkdownToJsonTool,
                 MarkdownToLatexTool,
                 MarkdownToMarkdownTool,
+                MarkdownToParquetTool,
                 MarkdownToPdfTool,
                 MarkdownToPngTool,
                 MarkdownToPptxTool,
+                MarkdownToSqliteTool,
                 MarkdownToXlsxTool,
                 MarkdownToXmlTool,
                 MarkdownToIpynbTool,
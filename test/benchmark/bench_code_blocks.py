@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark of code block extraction
+Compares the DOTALL regex formerly used by md_to_codeblock with the CommonMark fence scanner,
+on a generated multi-megabyte document with thousands of code blocks, with an unclosed fence,
+and with fences indented by a space, which the regex misses while scanning to the end of the text for each of them
+
+Usage:
+    uv run python test/benchmark/bench_code_blocks.py [--blocks 5000] [--input input.md]
+"""
+
+import argparse
+import re
+import time
+from pathlib import Path
+
+from md_exporter.services.svc_md_to_codeblock import extract_code_blocks
+
+# the regex formerly used by extract_code_blocks
+REGEX_PATTERN = re.compile(r"```([a-zA-Z0-9\+#\-_]*)\s*\n(.*?)\n```", re.DOTALL)
+
+
+def generate_markdown(blocks: int, indent: str = "") -> str:
+    """Generate a Markdown document with paragraphs and code blocks of backtick and tilde fences"""
+    parts = ["# Benchmark Document\n"]
+    for i in range(1, blocks + 1):
+        parts.append(f"## Section {i}\n")
+        parts.append("This is a paragraph with `inline code` and **bold** text. " * 10 + "\n")
+        if i % 2:
+            code = f"def add_{i}(a, b):\n    return a + b\n" + "# comment line\n" * 20
+            parts.append(f"{indent}```python\n{code}{indent}```\n")
+        else:
+            code = f"// nested fence\n{indent}```\nlet x = {i};\n{indent}```\n" + "x += 1;\n" * 20
+            parts.append(f"{indent}~~~~ js\n{code}{indent}~~~~\n")
+    return "\n".join(parts)
+
+
+def extract_with_regex(md_text: str) -> int:
+    return sum(1 for _ in REGEX_PATTERN.finditer(md_text))
+
+
+def extract_with_scanner(md_text: str) -> int:
+    return len(extract_code_blocks(md_text))
+
+
+def measure(extract, md_text: str) -> tuple[float, int]:
+    start = time.perf_counter()
+    count = extract(md_text)
+    return time.perf_counter() - start, count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark code block extraction")
+    parser.add_argument("--blocks", type=int, default=5000, help="Number of code blocks of the generated document")
+    parser.add_argument("--input", help="Input Markdown file path, instead of the generated document")
+    args = parser.parse_args()
+
+    md_text = Path(args.input).read_text(encoding="utf-8") if args.input else generate_markdown(args.blocks)
+    inputs = {
+        "document": md_text,
+        # an unclosed fence at the start, running to the end of the document
+        "unclosed": "```text\n" + md_text.replace("```", "'''").replace("~~~", "'''"),
+        # fewer blocks, as the regex takes quadratic time
+        "indented": generate_markdown(max(args.blocks // 10, 1), indent=" "),
+    }
+    print(f"{'input':<12}{'size (MB)':>10}  {'extractor':<12}{'seconds':>10}{'blocks':>10}")
+    for input_name, text in inputs.items():
+        for name, extract in (("regex", extract_with_regex), ("scanner", extract_with_scanner)):
+            seconds, count = measure(extract, text)
+            print(f"{input_name:<12}{len(text) / 1024 / 1024:>10.1f}  {name:<12}{seconds:>10.3f}{count:>10}")
+
+
+if __name__ == "__main__":
+    main()
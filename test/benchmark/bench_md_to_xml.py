@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark of md_to_xml
+Compares rendering the whole document to an XML tree at once with writing the XML incrementally chunk by chunk,
+on time and peak RSS, each mode measured in a fresh process, and checks that both outputs are the same
+
+Usage:
+    uv run python test/benchmark/bench_md_to_xml.py [--sections 5000] [--input input.md]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+MODES = ("tree", "streaming")
+
+
+def generate_markdown(sections: int) -> str:
+    """Generate a long Markdown document with headings, paragraphs, tables, code blocks and lists"""
+    parts = ["# Benchmark Document\n"]
+    for i in range(1, sections + 1):
+        parts.append(f"## Section {i}\n")
+        parts.append("This is a paragraph with **bold**, *italic* and [a link][home]. " * 8 + "\n")
+        parts.append("这是一段中文内容，用于测试多字节字符的输出。\n")
+        parts.append("| Name | Description | Price |\n|------|-------------|-------|")
+        parts.extend(f"| Item {j} | Description of item {j} | ${j * 10} |" for j in range(1, 11))
+        parts.append("\n```python\n# comment, not a heading\ndef add(a, b):\n    return a + b\n```\n")
+        parts.append("- List item 1\n- List item 2\n- List item 3\n")
+    parts.append("[home]: https://example.com\n")
+    return "\n".join(parts)
+
+
+def run_mode(mode: str, input_path: Path) -> dict:
+    """Convert the input in the mode in current process, and report the measurements"""
+    from md_exporter.services.svc_md_to_xml import convert_html_to_xml_bytes, convert_md_to_xml
+    from md_exporter.utils.markdown_utils import get_md_text, render_markdown
+
+    md_text = input_path.read_text(encoding="utf-8")
+    output_path = input_path.with_name(f"{input_path.stem}_{mode}.xml")
+
+    start = time.perf_counter()
+    if mode == "tree":
+        output_path.write_bytes(convert_html_to_xml_bytes(render_markdown(get_md_text(md_text))))
+    else:
+        convert_md_to_xml(md_text, output_path)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "mode": mode,
+        "seconds": round(elapsed, 3),
+        # ru_maxrss is in kilobytes on Linux
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "size_kb": round(output_path.stat().st_size / 1024, 1),
+        "sha256": hashlib.sha256(output_path.read_bytes()).hexdigest(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark md_to_xml")
+    parser.add_argument("--sections", type=int, default=5000, help="Number of sections of the generated document")
+    parser.add_argument("--input", help="Input Markdown file path, instead of the generated document")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_mode(args.worker, Path(args.input))))
+        return
+
+    output_dir = PROJECT_ROOT / "test_output" / "benchmark"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    if args.input:
+        input_path = output_dir / Path(args.input).name
+        input_path.write_text(Path(args.input).read_text(encoding="utf-8"), encoding="utf-8")
+    else:
+        input_path = output_dir / "bench_md_to_xml.md"
+        input_path.write_text(generate_markdown(args.sections), encoding="utf-8")
+
+    print(f"Input: {input_path} ({input_path.stat().st_size / 1024:.1f} KB)")
+    print(f"{'mode':<12}{'seconds':>10}{'peak RSS (MB)':>16}{'size (KB)':>12}")
+    digests = set()
+    for mode in MODES:
+        completed = subprocess.run(
+            [sys.executable, __file__, "--worker", mode, "--input", str(input_path)],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=PROJECT_ROOT,
+            env={**os.environ, "PYTHONPATH": f"{PROJECT_ROOT}:{os.environ.get('PYTHONPATH', '')}"},
+        )
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        digests.add(result["sha256"])
+        print(f"{result['mode']:<12}{result['seconds']:>10}{result['peak_rss_mb']:>16}{result['size_kb']:>12}")
+    print("Outputs are the same" if len(digests) == 1 else "Outputs differ")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the PDF engines of md_to_pdf
+Compares xhtml2pdf and PyMuPDF on page count, time and peak RSS, each engine measured in a fresh process
+
+Usage:
+    uv run python test/benchmark/bench_pdf_engines.py [--sections 200] [--input input.md]
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def generate_markdown(sections: int) -> str:
+    """Generate a long Markdown document with headings, paragraphs, tables, code blocks and CJK text"""
+    parts = ["# Benchmark Document\n"]
+    for i in range(1, sections + 1):
+        parts.append(f"## Section {i}\n")
+        parts.append("This is a paragraph with **bold** and *italic* text. " * 8 + "\n")
+        parts.append("这是一段中文内容，用于测试中日韩字体的排版。日本語のテキストも含まれています。\n")
+        parts.append("| Name | Description | Price |\n|------|-------------|-------|")
+        parts.extend(f"| Item {j} | Description of item {j} | ${j * 10} |" for j in range(1, 11))
+        parts.append("\n```python\ndef add(a, b):\n    return a + b\n```\n")
+        parts.append("- List item 1\n- List item 2\n- List item 3\n")
+    return "\n".join(parts)
+
+
+def run_engine(engine: str, input_path: Path) -> dict:
+    """Convert the input with the engine in current process, and report the measurements"""
+    import pymupdf
+
+    from md_exporter.services.svc_md_to_pdf import convert_md_to_pdf
+
+    md_text = input_path.read_text(encoding="utf-8")
+    output_path = input_path.with_name(f"{input_path.stem}_{engine}.pdf")
+
+    start = time.perf_counter()
+    convert_md_to_pdf(md_text, output_path, engine=engine)
+    elapsed = time.perf_counter() - start
+
+    with pymupdf.open(output_path) as doc:
+        page_count = doc.page_count
+    return {
+        "engine": engine,
+        "pages": page_count,
+        "seconds": round(elapsed, 3),
+        # ru_maxrss is in kilobytes on Linux
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "size_kb": round(output_path.stat().st_size / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the PDF engines of md_to_pdf")
+    parser.add_argument("--sections", type=int, default=200, help="Number of sections of the generated document")
+    parser.add_argument("--input", help="Input Markdown file path, instead of the generated document")
+    parser.add_argument("--engines", default="xhtml2pdf,pymupdf", help="Comma separated engines to benchmark")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_engine(args.worker, Path(args.input))))
+        return
+
+    output_dir = PROJECT_ROOT / "test_output" / "benchmark"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    if args.input:
+        input_path = output_dir / Path(args.input).name
+        input_path.write_text(Path(args.input).read_text(encoding="utf-8"), encoding="utf-8")
+    else:
+        input_path = output_dir / "bench_pdf_engines.md"
+        input_path.write_text(generate_markdown(args.sections), encoding="utf-8")
+
+    print(f"Input: {input_path} ({input_path.stat().st_size / 1024:.1f} KB)")
+    print(f"{'engine':<12}{'pages':>8}{'seconds':>10}{'peak RSS (MB)':>16}{'size (KB)':>12}")
+    for engine in args.engines.split(","):
+        completed = subprocess.run(
+            [sys.executable, __file__, "--worker", engine, "--input", str(input_path)],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=PROJECT_ROOT,
+            env={**os.environ, "PYTHONPATH": f"{PROJECT_ROOT}:{os.environ.get('PYTHONPATH', '')}"},
+        )
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        print(
+            f"{result['engine']:<12}{result['pages']:>8}{result['seconds']:>10}"
+            f"{result['peak_rss_mb']:>16}{result['size_kb']:>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
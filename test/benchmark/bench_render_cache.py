@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark of incremental rendering with MD_EXPORTER_RENDER_CACHE_SIZE
+Renders a document as a whole, then block by block with an empty cache, and again after editing one section,
+for the HTML of md_to_html (python-markdown) and md_to_html_text (Pandoc), and checks that the outputs are the same
+
+Usage:
+    uv run python test/benchmark/bench_render_cache.py [--sections 200] [--input input.md]
+    MD_EXPORTER_PANDOC_ENGINE=server uv run python test/benchmark/bench_render_cache.py
+"""
+
+import argparse
+import os
+import time
+from pathlib import Path
+
+from md_exporter.services.svc_md_to_html_text import convert_md_to_html_text
+from md_exporter.utils import render_cache_utils
+from md_exporter.utils.markdown_utils import convert_markdown_to_html, get_md_text
+
+
+def generate_markdown(sections: int) -> str:
+    """Generate a Markdown document with headings, paragraphs, tables and code blocks"""
+    parts = ["# Benchmark Document\n"]
+    for i in range(1, sections + 1):
+        parts.append(f"## Section {i}\n")
+        parts.append("This is a paragraph with **bold**, *italic* and [a link][home]. " * 8 + "\n")
+        parts.append("| Name | Description | Price |\n|------|-------------|-------|")
+        parts.extend(f"| Item {j} | Description of item {j} | ${j * 10} |" for j in range(1, 6))
+        parts.append("\n```python\ndef add(a, b):\n    return a + b\n```\n")
+    parts.append("[home]: https://example.com\n")
+    return "\n".join(parts)
+
+
+def edit_markdown(md_text: str) -> str:
+    """Edit the paragraph in the middle of the document"""
+    middle = md_text.index("This is a paragraph", len(md_text) // 2)
+    return f"{md_text[:middle]}Edited. {md_text[middle:]}"
+
+
+def measure(convert, md_text: str) -> tuple[float, str]:
+    start = time.perf_counter()
+    result = convert(md_text)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark incremental rendering")
+    parser.add_argument("--sections", type=int, default=200, help="Number of sections of the generated document")
+    parser.add_argument("--input", help="Input Markdown file path, instead of the generated document")
+    args = parser.parse_args()
+
+    md_text = get_md_text(
+        Path(args.input).read_text(encoding="utf-8") if args.input else generate_markdown(args.sections)
+    )
+    edited_md_text = edit_markdown(md_text) if "This is a paragraph" in md_text else f"{md_text}\n\nEdited.\n"
+    print(f"Input: {len(md_text) / 1024:.1f} KB")
+    print(f"{'renderer':<16}{'whole (s)':>12}{'cold (s)':>12}{'edited (s)':>12}{'whole edited (s)':>18}")
+    for name, convert in (("python-markdown", convert_markdown_to_html), ("pandoc", convert_md_to_html_text)):
+        os.environ["MD_EXPORTER_RENDER_CACHE_SIZE"] = "0"
+        whole_seconds, _ = measure(convert, md_text)
+        whole_edited_seconds, expected = measure(convert, edited_md_text)
+
+        os.environ["MD_EXPORTER_RENDER_CACHE_SIZE"] = "100000"
+        render_cache_utils._render_cache.clear()
+        cold_seconds, _ = measure(convert, md_text)
+        edited_seconds, result = measure(convert, edited_md_text)
+        print(
+            f"{name:<16}{whole_seconds:>12.3f}{cold_seconds:>12.3f}{edited_seconds:>12.3f}{whole_edited_seconds:>18.3f}"
+            + ("" if result == expected else "  outputs differ")
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -82,7 +82,7 @@ markdown-exporter --help || true
 
 # Test each subcommand with --help
 echo "Step 5: Testing each subcommand with --help"
-subcommands=("md_to_codeblock" "md_to_csv" "md_to_docx" "md_to_html" "md_to_html_text" "md_to_ipynb" "md_to_json" "md_to_latex" "md_to_md" "md_to_pdf" "md_to_png" "md_to_pptx" "md_to_xlsx" "md_to_xml")
+subcommands=("md_to_arrow" "md_to_codeblock" "md_to_csv" "md_to_docx" "md_to_html" "md_to_html_text" "md_to_ipynb" "md_to_json" "md_to_latex" "md_to_many" "md_to_md" "md_to_parquet" "md_to_pdf" "md_to_png" "md_to_pptx" "md_to_sqlite" "md_to_xlsx" "md_to_xml")
 
 for subcommand in "${subcommands[@]}"; do
     echo "Testing $subcommand..."
@@ -102,6 +102,7 @@ TESTS_FAILED=0
 # Run all tests
 echo "Step 7: Running all PyPI CLI tests"
 test_scripts=(
+    "test_cli_md_to_arrow.sh"
     "test_cli_md_to_codeblock.sh"
     "test_cli_md_to_csv.sh"
     "test_cli_md_to_docx.sh"
@@ -110,10 +111,13 @@ test_scripts=(
     "test_cli_md_to_ipynb.sh"
     "test_cli_md_to_json.sh"
     "test_cli_md_to_latex.sh"
+    "test_cli_md_to_many.sh"
     "test_cli_md_to_md.sh"
+    "test_cli_md_to_parquet.sh"
     "test_cli_md_to_pdf.sh"
     "test_cli_md_to_png.sh"
     "test_cli_md_to_pptx.sh"
+    "test_cli_md_to_sqlite.sh"
     "test_cli_md_to_xlsx.sh"
     "test_cli_md_to_xml.sh"
 )
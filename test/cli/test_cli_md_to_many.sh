@@ -0,0 +1,25 @@
+#!/bin/bash
+
+# Test script for md_to_many
+
+# Source common functions
+. "$(dirname "${BASH_SOURCE[0]}")/common_test_runner_pypi.sh"
+
+# Set up test environment
+setup_test_env
+
+# Run test
+input_file="$PROJECT_ROOT/test/resources/example_md.md"
+output_base="$OUTPUT_DIR/test_cli_md_to_many"
+echo "Running test for md_to_many..."
+markdown-exporter md_to_many "$input_file" "$output_base" --to docx,pdf,html
+
+# Verify the output
+for output_ext in docx pdf html; do
+    if verify_file_output "$output_base.$output_ext"; then
+        echo "✓ Test passed: md_to_many generated valid $output_ext output"
+    else
+        echo "✗ Test failed: md_to_many did not generate valid $output_ext output"
+        exit 1
+    fi
+done
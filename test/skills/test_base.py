@@ -17,13 +17,15 @@ class TestBase(unittest.TestCase):
         # List to store files and directories to clean up
         self._outputs_to_clean = []
 
-    def run_script(self, script_name, input_file, output_file):
-        """Run the specified script with given input and output files/directories."""
+    def run_script(self, script_name, input_file, output_file, extra_args=None):
+        """Run the specified script with given input and output files/directories, and optional extra arguments."""
         # Register output for cleanup
         self.register_output(output_file)
 
         subprocess.run(
-            ["uv", "run", "python", f"scripts/{script_name}", input_file, output_file], check=True, env=self.env
+            ["uv", "run", "python", f"scripts/{script_name}", input_file, output_file, *(extra_args or [])],
+            check=True,
+            env=self.env,
         )
 
     def run_script_with_output(self, script_name, input_file):
@@ -0,0 +1,17 @@
+from test_base import TestBase
+
+
+class TestMdToMany(TestBase):
+    def test_md_to_many(self):
+        # Define input and output paths
+        input_file = "test/resources/example_md.md"
+        output_base = "test_output/test_many"
+        output_files = [f"{output_base}.docx", f"{output_base}.pdf", f"{output_base}.html"]
+        self.register_outputs(output_files)
+
+        # Run the tool using the base class method
+        self.run_script("parser/cli_md_to_many.py", input_file, output_base, ["--to", "docx,pdf,html"])
+
+        # Verify the output files are not empty
+        for output_file in output_files:
+            self.verify_output_file(output_file)
@@ -1,5 +1,10 @@
+from unittest import mock
+
+import pymupdf
 from test_base import TestBase
 
+from md_exporter.services.svc_md_to_pdf import PDF_PARALLEL_WORKERS_ENV, convert_md_to_pdf_bytes
+
 
 class TestMdToPdf(TestBase):
     def test_md_to_pdf(self):
@@ -12,3 +17,19 @@ class TestMdToPdf(TestBase):
 
         # Verify the output file is not empty
         self.verify_output_file(output_file)
+
+    def test_md_to_pdf_parallel_with_footnotes(self):
+        # Footnotes are rendered with the whole document, so the text is not split into chunks
+        md_text = "\n\n".join(
+            f"# Section {i}\n\nParagraph {i} with a note[^{i}].\n\n[^{i}]: Note {i}" for i in range(4)
+        )
+
+        with mock.patch.dict("os.environ", {PDF_PARALLEL_WORKERS_ENV: "4"}):
+            pdf_bytes = convert_md_to_pdf_bytes(md_text, parallel=True)
+
+        with pymupdf.open(stream=pdf_bytes, filetype="pdf") as doc:
+            text = "".join(page.get_text() for page in doc)
+            self.assertEqual(doc.page_count, 1)
+        self.assertNotIn("[^", text)
+        for i in range(4):
+            self.assertIn(f"Note {i}", text)
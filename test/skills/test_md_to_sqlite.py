@@ -0,0 +1,34 @@
+import sqlite3
+
+from test_base import TestBase
+
+from md_exporter.services.svc_md_to_sqlite import convert_md_to_sqlite_bytes
+
+
+class TestMdToSqlite(TestBase):
+    def test_md_to_sqlite(self):
+        # Define input and output paths
+        input_file = "test/resources/example_md_table.md"
+        output_file = "test_output/test.sqlite"
+
+        # Run the tool using the base class method
+        self.run_script("parser/cli_md_to_sqlite.py", input_file, output_file)
+
+        # Verify the output file is not empty
+        self.verify_output_file(output_file)
+
+    def test_md_to_sqlite_index_names(self):
+        # index names "idx_{table}_{column}" of the two tables would be both "idx_a_b_c"
+        md_text = "# a b\n\n| c |\n|---|\n| 1 |\n\n# a\n\n| b_c |\n|---|\n| 2 |\n"
+
+        db_bytes = convert_md_to_sqlite_bytes(md_text, index_columns="c,b_c")
+
+        conn = sqlite3.connect(":memory:")
+        try:
+            conn.deserialize(db_bytes)
+            indexes = conn.execute(
+                "SELECT name, tbl_name FROM sqlite_master WHERE type = 'index' ORDER BY name"
+            ).fetchall()
+        finally:
+            conn.close()
+        self.assertEqual(indexes, [("idx_a_b_c", "a_b"), ("idx_a_b_c_2", "a")])
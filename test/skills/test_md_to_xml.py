@@ -1,5 +1,12 @@
+from pathlib import Path
+from unittest import mock
+
 from test_base import TestBase
 
+from md_exporter.services import svc_md_to_xml
+from md_exporter.services.svc_md_to_xml import convert_html_to_xml_bytes, convert_md_to_xml_bytes
+from md_exporter.utils.markdown_utils import get_md_text, render_markdown
+
 
 class TestMdToXml(TestBase):
     def test_md_to_xml(self):
@@ -12,3 +19,18 @@ class TestMdToXml(TestBase):
 
         # Verify the output file is not empty
         self.verify_output_file(output_file)
+
+    def test_md_to_xml_in_chunks(self):
+        # XML written in chunks is the same as converted from the HTML of the whole document
+        md_text = get_md_text(Path("test/resources/example_md.md").read_text(encoding="utf-8"))
+        expected = convert_html_to_xml_bytes(render_markdown(md_text))
+
+        with mock.patch.object(svc_md_to_xml, "XML_CHUNK_SIZE", 100):
+            self.assertEqual(convert_md_to_xml_bytes(md_text), expected)
+
+    def test_md_to_xml_single_element(self):
+        # a single rendered element is the root element, pretty-printed as converted from the whole HTML
+        for md_text in ["# Title", "```\ncode\n```", "<div><p>x</p></div>"]:
+            with self.subTest(md_text=md_text):
+                expected = convert_html_to_xml_bytes(render_markdown(md_text))
+                self.assertEqual(convert_md_to_xml_bytes(md_text), expected)
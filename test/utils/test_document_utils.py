@@ -0,0 +1,128 @@
+import unittest
+
+from md_exporter.utils.document_utils import (
+    BlockType,
+    FencedCodeBlock,
+    iter_fenced_code_blocks,
+    iter_markdown_blocks,
+    parse_markdown_document,
+    split_text_at_offsets,
+)
+
+DOCUMENT_MD = """---
+title: Doc
+---
+
+# Title
+
+Para with [link][r].
+
+| a | b |
+|---|---|
+| 1 | 2 |
+
+```py
+# not a heading
+```
+
+Setext
+------
+
+[r]: https://example.com
+*[HTML]: Hyper Text
+"""
+
+# Markdown text, and the (info, code, is_closed) of its fenced code blocks
+FENCE_CASES = [
+    ("```python\nprint(1)\n```\n", [("python", "print(1)\n", True)]),
+    ("~~~\ncode\n~~~\n", [("", "code\n", True)]),
+    ("~~~ `x`\ncode\n~~~", [("`x`", "code\n", True)]),
+    # backticks in the info string of a backtick fence make it inline code, and the last fence is left unclosed
+    ("```a`b\ntext\n```\n", [("", "", False)]),
+    ("```\ncode\n\nmore", [("", "code\n\nmore", False)]),
+    ("  ```js\n  x\n   y\n y\n  ```\n", [("js", "x\n y\ny\n", True)]),
+    ("    ```\ncode\n    ```\n", []),
+    ("```\ncode\n`````\n", [("", "code\n", True)]),
+    ("````\n```\ncode\n````\n", [("", "```\ncode\n", True)]),
+    ("```\n~~~\n```\n", [("", "~~~\n", True)]),
+    ("```\n``` x\n```", [("", "``` x\n", True)]),
+    ("---\n```\n---\n```\ncode\n```\n", [("", "code\n", True)]),
+    (
+        "# Title\n\n| a | b |\n|---|---|\n| 1 | 2 |\n\n~~~~ sh\n~~~\n~~~~~\n\n```\n```\n",
+        [("sh", "~~~\n", True), ("", "", True)],
+    ),
+]
+
+
+class TestParseMarkdownDocument(unittest.TestCase):
+    def test_blocks(self):
+        document = parse_markdown_document(DOCUMENT_MD)
+
+        self.assertEqual(
+            [(block.block_type, block.start_line, block.end_line) for block in document.blocks],
+            [
+                (BlockType.FRONT_MATTER, 0, 3),
+                (BlockType.HEADING, 4, 5),
+                (BlockType.PARAGRAPH, 6, 7),
+                (BlockType.TABLE, 8, 11),
+                (BlockType.CODE_BLOCK, 12, 15),
+                (BlockType.HEADING, 16, 18),
+                (BlockType.DEFINITION, 19, 20),
+                (BlockType.DEFINITION, 20, 21),
+            ],
+        )
+        self.assertEqual(document.front_matter, "title: Doc\n")
+        self.assertEqual(
+            [(heading.level, heading.text) for heading in document.headings], [(1, "Title"), (2, "Setext")]
+        )
+        self.assertEqual([code_block.code for code_block in document.code_blocks], ["# not a heading\n"])
+        self.assertEqual([(table.header, table.rows) for table in document.tables], [(["a", "b"], [["1", "2"]])])
+        self.assertEqual(
+            [document.get_block_text(block) for block in document.get_definitions("link")],
+            ["[r]: https://example.com\n"],
+        )
+        self.assertEqual(
+            [document.get_block_text(block) for block in document.get_definitions("abbreviation")],
+            ["*[HTML]: Hyper Text\n"],
+        )
+
+    def test_memoized_by_content(self):
+        document = parse_markdown_document(DOCUMENT_MD)
+
+        self.assertIs(parse_markdown_document("".join(DOCUMENT_MD.splitlines(keepends=True))), document)
+        self.assertIsNot(parse_markdown_document(f"{DOCUMENT_MD}\n"), document)
+
+
+class TestSplitTextAtOffsets(unittest.TestCase):
+    def test_remove_definitions(self):
+        cases = [
+            ("a\n\n[r]: u\n\n[s]: v\n\nb\n", ["a\n\nb\n"]),
+            ("# A\n\na [x][r]\n\n[r]: u\n\n# B\n\nb\n", ["# A\n\na [x][r]\n\n", "# B\n\nb\n"]),
+            # removing the definition would join the indented code blocks around it into one
+            ("    code1\n\n[r]: u\n\n    code2\n", ["    code1\n\n[r]: u\n\n    code2\n"]),
+        ]
+        for md_text, expected in cases:
+            with self.subTest(md_text=md_text):
+                document = parse_markdown_document(md_text)
+                boundaries = [heading.start for heading in document.headings if heading.start > 0]
+                self.assertEqual(
+                    list(split_text_at_offsets(md_text, boundaries, document.get_definitions("link"))), expected
+                )
+
+
+class TestIterFencedCodeBlocks(unittest.TestCase):
+    def test_same_as_markdown_blocks(self):
+        for md_text, expected in FENCE_CASES:
+            with self.subTest(md_text=md_text):
+                blocks = list(iter_fenced_code_blocks(md_text))
+                model_blocks = [block for block in iter_markdown_blocks(md_text) if isinstance(block, FencedCodeBlock)]
+
+                self.assertEqual(_get_signatures(blocks), _get_signatures(model_blocks))
+                self.assertEqual([(block.info, block.code, block.is_closed) for block in blocks], expected)
+
+
+def _get_signatures(blocks: list[FencedCodeBlock]) -> list[tuple]:
+    return [
+        (block.start_line, block.end_line, block.start, block.end, block.fence, block.info, block.code, block.is_closed)
+        for block in blocks
+    ]
@@ -0,0 +1,75 @@
+import unittest
+
+from md_exporter.utils.markdown_utils import split_markdown_at_top_level_headings, split_markdown_into_chunks
+
+SECTIONS_MD = """Intro
+
+## A
+
+text [ref]
+
+```
+## not a heading
+```
+
+## B
+
+### B1
+
+more
+
+[ref]: https://example.com
+"""
+
+CHUNKS_MD = """# A
+
+aaaa
+
+# B
+
+bbbb [r]
+
+*[HTML]: Hyper
+
+# C
+
+cccc
+
+[r]: https://x
+"""
+
+
+class TestSplitMarkdownAtTopLevelHeadings(unittest.TestCase):
+    def test_split_at_top_level_headings(self):
+        sections = split_markdown_at_top_level_headings(SECTIONS_MD)
+
+        # headings in fenced code blocks are ignored, and reference definitions are copied into every section
+        self.assertEqual(
+            sections,
+            [
+                "Intro\n\n[ref]: https://example.com\n",
+                "## A\n\ntext [ref]\n\n```\n## not a heading\n```\n\n[ref]: https://example.com\n",
+                "## B\n\n### B1\n\nmore\n\n[ref]: https://example.com\n",
+            ],
+        )
+
+    def test_whole_document_markers(self):
+        for marker in ("[TOC]", "a note[^1]\n\n[^1]: note", '<div markdown="1">*x*</div>'):
+            with self.subTest(marker=marker):
+                md_text = f"{SECTIONS_MD}\n{marker}\n"
+                self.assertEqual(split_markdown_at_top_level_headings(md_text), [md_text])
+
+
+class TestSplitMarkdownIntoChunks(unittest.TestCase):
+    def test_split_into_chunks(self):
+        chunks, definitions = split_markdown_into_chunks(CHUNKS_MD, 10)
+
+        # definitions are removed from the chunks, to be rendered with each chunk
+        self.assertEqual(list(chunks), ["# A\n\naaaa\n\n", "# B\n\nbbbb [r]\n\n", "# C\n\ncccc\n\n"])
+        self.assertEqual(definitions, "*[HTML]: Hyper\n[r]: https://x\n")
+
+    def test_single_chunk(self):
+        for md_text in (CHUNKS_MD[:9], f"{CHUNKS_MD}\nx[^1]\n\n[^1]: note\n"):
+            with self.subTest(md_text=md_text):
+                chunks, definitions = split_markdown_into_chunks(md_text, 10)
+                self.assertEqual((list(chunks), definitions), ([md_text], ""))
@@ -0,0 +1,90 @@
+import unittest
+from unittest import mock
+
+from md_exporter.services.svc_md_to_html_text import _PandocHtmlRenderer, _render_html
+from md_exporter.utils import render_cache_utils
+from md_exporter.utils.markdown_utils import render_markdown
+from md_exporter.utils.render_cache_utils import (
+    RENDER_CACHE_SIZE_ENV,
+    PythonMarkdownRenderer,
+    render_markdown_incrementally,
+)
+
+# Markdown texts rendered block by block, to the same HTML as rendered as a whole
+INCREMENTAL_CASES = [
+    # heading IDs made unique across blocks
+    "# Intro\n\na\n\n# Intro\n\nb\n\n## Intro\n\nc\n\n# Intro_1\n\nd\n",
+    # code blocks numbered across blocks by pandoc
+    "# A\n\n```py\nx = 1\n```\n\n# B\n\n```py\ny = 2\n```\n\ntext\n\n```sh\nz\n```\n",
+    # reference and abbreviation definitions referred to across blocks
+    "# A\n\n[x][r] and HTML\n\n# B\n\n[y][r]\n\n[r]: https://example.com\n*[HTML]: Hyper Text\n",
+    # ID set explicitly in a following block
+    "# Intro\n\ntext\n\n## Details {#intro}\n\ny\n",
+    # indented code blocks around a removed definition
+    "# A\n\n    code1\n\n[r]: http://e.com\n\n    code2\n\n# B\n\n[x][r]\n",
+]
+
+# Markdown texts with features rendered with the content of the whole document, for both renderers
+WHOLE_DOCUMENT_CASES = [
+    "# A\n\n[TOC]\n\n# B\n\ntext\n",
+    "# A\n\na note[^1]\n\n# B\n\n[^1]: note\n",
+    '# A\n\n<div markdown="1">*x*</div>\n\n# B\n\ntext\n',
+]
+
+
+class TestRenderMarkdownIncrementally(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.dict("os.environ", {RENDER_CACHE_SIZE_ENV: "100"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        render_cache_utils._render_cache.clear()
+        self.addCleanup(render_cache_utils._render_cache.clear)
+
+    def assert_same_as_whole(self, md_text, renderer, render_whole):
+        html = render_markdown_incrementally(md_text, renderer)
+        self.assertEqual(html if html is not None else render_whole(md_text), render_whole(md_text))
+
+    def test_python_markdown(self):
+        for md_text in INCREMENTAL_CASES:
+            with self.subTest(md_text=md_text):
+                self.assert_same_as_whole(md_text, PythonMarkdownRenderer(), render_markdown)
+
+    def test_pandoc(self):
+        for md_text in INCREMENTAL_CASES:
+            with self.subTest(md_text=md_text):
+                self.assert_same_as_whole(md_text, _PandocHtmlRenderer(), _render_html)
+
+    def test_unique_heading_ids(self):
+        html = render_markdown_incrementally(INCREMENTAL_CASES[0], PythonMarkdownRenderer())
+
+        self.assertEqual(
+            render_cache_utils._ID_ATTRIBUTE_PATTERN.findall(html), ["intro", "intro_1", "intro_2", "intro_3"]
+        )
+
+    def test_pandoc_code_block_numbers(self):
+        html = render_markdown_incrementally(INCREMENTAL_CASES[1], _PandocHtmlRenderer())
+
+        self.assertEqual(html, _render_html(INCREMENTAL_CASES[1]))
+        for code_block_id in ("cb1", "cb2", "cb3"):
+            self.assertIn(f'id="{code_block_id}"', html)
+
+    def test_whole_document_markers(self):
+        for md_text in [*WHOLE_DOCUMENT_CASES, "# A\n\n{#intro}\n\n# Intro\n\n## Intro {#intro}\n"]:
+            with self.subTest(md_text=md_text):
+                self.assertIsNone(render_markdown_incrementally(md_text, PythonMarkdownRenderer()))
+        for md_text in [*WHOLE_DOCUMENT_CASES, "# A\n\nnote^[inline]\n\n# B\n", "# A\n\n::: note\nx\n:::\n\n# B\n"]:
+            with self.subTest(md_text=md_text):
+                self.assertIsNone(render_markdown_incrementally(md_text, _PandocHtmlRenderer()))
+
+    def test_cache_hit_after_edit(self):
+        renderer = PythonMarkdownRenderer()
+        md_text = "# A\n\na\n\n# B\n\nb\n\n# C\n\nc\n"
+        edited = md_text.replace("\nb\n", "\nb edited\n")
+        render_markdown_incrementally(md_text, renderer)
+
+        with mock.patch.object(renderer, "render", wraps=renderer.render) as render:
+            html = render_markdown_incrementally(edited, renderer)
+
+        self.assertEqual(html, render_markdown(edited))
+        # only the edited block is rendered again
+        self.assertEqual([call.args[0] for call in render.call_args_list], ["# B\n\nb edited\n\n"])
@@ -0,0 +1,76 @@
+import unittest
+
+import pandas as pd
+
+from md_exporter.utils.table_utils import parse_md_to_tables, scan_md_tables
+
+GFM_TABLES_MD = """# Sales
+
+Here is the table: | Name | Price | Note |
+|:-----|------:|:----:|
+| **Tea** | 1.50 | a \\| b |
+| [Coffee](https://example.com) | 007 | `x \\| y` |
+
+```
+| a | b |
+|---|---|
+| 1 | 2 |
+```
+
+## Empty
+
+| only | header |
+|------|--------|
+
+Not a table
+---
+"""
+
+TYPED_TABLE_MD = """| flag | price | share | local | date | code | mixed |
+|---|---|---|---|---|---|---|
+| TRUE | $1,234.50 | 12.5% | 1.234,5 | 2024-01-31 | 007 | 1 |
+| false | -$2 | 50% | 2,5 | 2024/02/01 | 010 | x |
+|  | 3 | 100% |  | 2024-03-01 08:00 | 020 | 2 |
+"""
+
+
+class TestScanMdTables(unittest.TestCase):
+    def test_gfm_pipe_tables(self):
+        tables = scan_md_tables(GFM_TABLES_MD)
+
+        # tables in fenced code blocks are skipped, and thematic breaks are not delimiter rows
+        self.assertEqual(len(tables), 2)
+        table = tables[0]
+        self.assertEqual(table.header, ["Name", "Price", "Note"])
+        self.assertEqual(table.alignments, ["left", "right", "center"])
+        self.assertEqual(table.heading, "Sales")
+        # inline Markdown is reduced to its text, cells keep their text as written, escaped pipes stay in cells and code
+        self.assertEqual(list(table.rows), [["Tea", "1.50", "a | b"], ["Coffee", "007", "x | y"]])
+
+        self.assertEqual(tables[1].header, ["only", "header"])
+        self.assertEqual(tables[1].heading, "Empty")
+        self.assertEqual(list(tables[1].rows), [])
+
+
+class TestParseMdToTables(unittest.TestCase):
+    def test_infer_column_types(self):
+        table = parse_md_to_tables(TYPED_TABLE_MD, force_value_to_str=False)[0]
+
+        # empty cells of typed columns are kept as empty text
+        self.assertEqual(table["flag"].tolist(), [True, False, ""])
+        self.assertEqual(table["price"].tolist(), [1234.5, -2.0, 3.0])
+        self.assertEqual(table["share"].tolist(), [0.125, 0.5, 1.0])
+        self.assertEqual(table["local"].tolist(), [1234.5, 2.5, ""])
+        self.assertEqual(
+            table["date"].tolist(),
+            [pd.Timestamp("2024-01-31"), pd.Timestamp("2024-02-01"), pd.Timestamp("2024-03-01 08:00")],
+        )
+        # numbers with leading zeros are codes, and columns of mixed types are kept as text
+        self.assertEqual(table["code"].tolist(), ["007", "010", "020"])
+        self.assertEqual(table["mixed"].tolist(), ["1", "x", "2"])
+
+    def test_force_value_to_str(self):
+        table = parse_md_to_tables(TYPED_TABLE_MD)[0]
+
+        self.assertEqual(table["price"].tolist(), ["$1,234.50", "-$2", "3"])
+        self.assertEqual(table["flag"].tolist(), ["TRUE", "false", ""])
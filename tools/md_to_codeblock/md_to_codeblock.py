@@ -1,11 +1,10 @@
 from collections.abc import Generator
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 
 from dify_plugin import Tool
 from dify_plugin.entities.tool import ToolInvokeMessage
 
-from md_exporter.services.svc_md_to_codeblock import convert_md_to_codeblock
+from md_exporter.services.svc_md_to_codeblock import convert_md_to_codeblock_bytes
 from md_exporter.utils.file_utils import get_meta_data
 from md_exporter.utils.logger_utils import get_logger
 from md_exporter.utils.mimetype_utils import MimeType
@@ -25,19 +24,15 @@ class MarkdownToCodeblockTool(Tool):
         is_compress = get_param_value(tool_parameters, "is_compress", "true")
         compress = "true" == is_compress.lower()
 
-        # create a temporary output path
-        with NamedTemporaryFile(suffix=".zip" if compress else ".txt", delete=False) as temp_file:
-            temp_output_path = Path(temp_file.name)
-
         try:
-            # convert markdown to codeblocks using the shared function
-            created_files = convert_md_to_codeblock(md_text, temp_output_path, compress=compress)
+            # convert markdown to codeblocks in memory using the shared function
+            results = convert_md_to_codeblock_bytes(md_text, compress=compress)
 
-            # generate blob messages based on the created files
+            # generate blob messages based on the results
             if compress:
                 # single ZIP file
                 yield self.create_blob_message(
-                    blob=created_files[0].read_bytes(),
+                    blob=results[0][1],
                     meta=get_meta_data(
                         mime_type=MimeType.ZIP,
                         output_filename=tool_parameters.get("output_filename"),
@@ -45,9 +40,9 @@ class MarkdownToCodeblockTool(Tool):
                 )
             else:
                 # multiple code files
-                for index, file_path in enumerate(created_files):
+                for index, (file_name, file_bytes) in enumerate(results):
                     # determine MIME type based on file suffix
-                    suffix = file_path.suffix.lower()
+                    suffix = Path(file_name).suffix.lower()
                     mime_type = MimeType.TXT  # default
                     if suffix == ".css":
                         mime_type = MimeType.CSS
@@ -79,22 +74,13 @@ class MarkdownToCodeblockTool(Tool):
                         mime_type = MimeType.JAVA
 
                     yield self.create_blob_message(
-                        blob=file_path.read_bytes(),
+                        blob=file_bytes,
                         meta=get_meta_data(
                             mime_type=mime_type,
                             output_filename=(tool_parameters.get("output_filename") or "code")
-                            + (("_" + str(index + 1)) if len(created_files) > 1 else ""),
+                            + (("_" + str(index + 1)) if len(results) > 1 else ""),
                         ),
                     )
         except Exception as e:
             self.logger.exception("Failed to convert markdown to codeblocks")
             raise e
-        finally:
-            # clean up temporary files
-            if temp_output_path.exists():
-                temp_output_path.unlink()
-            # clean up any other created files if not compressed
-            if not compress and "created_files" in locals():
-                for file_path in created_files:
-                    if file_path.exists():
-                        file_path.unlink()
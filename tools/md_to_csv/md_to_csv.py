@@ -1,11 +1,9 @@
 from collections.abc import Generator
-from pathlib import Path
-from tempfile import NamedTemporaryFile
 
 from dify_plugin import Tool
 from dify_plugin.entities.tool import ToolInvokeMessage
 
-from md_exporter.services.svc_md_to_csv import convert_md_to_csv
+from md_exporter.services.svc_md_to_csv import convert_md_to_csv_bytes
 from md_exporter.utils.file_utils import get_meta_data
 from md_exporter.utils.logger_utils import get_logger
 from md_exporter.utils.mimetype_utils import MimeType
@@ -25,20 +23,13 @@ class MarkdownToCsvTool(Tool):
         output_filename = tool_parameters.get("output_filename")
 
         try:
-            # create a temporary output CSV file
-            with NamedTemporaryFile(suffix=".csv", delete=False) as temp_csv_file:
-                temp_csv_output_path = Path(temp_csv_file.name)
-
-            # convert markdown to csv using the shared function
-            created_files = convert_md_to_csv(md_text, temp_csv_output_path)
-
-            # read the result bytes for each created file
-            for i, file_path in enumerate(created_files):
-                result_file_bytes = file_path.read_bytes()
+            # convert markdown to csv in memory using the shared function
+            results = convert_md_to_csv_bytes(md_text)
 
+            for i, result_file_bytes in enumerate(results):
                 result_filename: str | None = None
                 if output_filename:
-                    if len(created_files) > 1:
+                    if len(results) > 1:
                         result_filename = f"{output_filename}_{i + 1}.csv"
                     else:
                         result_filename = output_filename
@@ -55,12 +46,5 @@ class MarkdownToCsvTool(Tool):
             self.logger.exception("Failed to convert markdown text to CSV file")
             yield self.create_text_message(f"Failed to convert markdown text to CSV file, error: {str(e)}")
             return
-        finally:
-            # clean up temporary files
-            if "temp_csv_output_path" in locals():
-                temp_csv_output_path.unlink(missing_ok=True)
-            if "created_files" in locals():
-                for file_path in created_files:
-                    file_path.unlink(missing_ok=True)
 
         return
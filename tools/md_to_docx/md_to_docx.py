@@ -8,7 +8,7 @@ from dify_plugin import Tool
 from dify_plugin.entities.tool import ToolInvokeMessage
 from dify_plugin.file.file import File
 
-from md_exporter.services.svc_md_to_docx import convert_md_to_docx, get_default_template
+from md_exporter.services.svc_md_to_docx import convert_md_to_docx_bytes, get_default_template
 from md_exporter.utils.file_utils import get_meta_data
 from md_exporter.utils.mimetype_utils import MimeType
 from md_exporter.utils.param_utils import get_md_text_from_tool_params
@@ -43,28 +43,16 @@ class MarkdownToDocxTool(Tool):
                 scripts_dir = current_script_folder.parent.parent / "scripts"
                 template_path = get_default_template()
 
-            # Create temporary output file
-            with NamedTemporaryFile(suffix=".docx", delete=False) as temp_output_file:
-                temp_output_path = Path(temp_output_file.name)
+            # Convert to DOCX in memory using the public service
+            result_file_bytes = convert_md_to_docx_bytes(md_text, template_path, is_strip_wrapper=True)
 
-            try:
-                # Convert to DOCX using the public service
-                convert_md_to_docx(md_text, temp_output_path, template_path, is_strip_wrapper=True)
-
-                # Read the converted file content
-                result_file_bytes = temp_output_path.read_bytes()
-
-                yield self.create_blob_message(
-                    blob=result_file_bytes,
-                    meta=get_meta_data(
-                        mime_type=MimeType.DOCX,
-                        output_filename=tool_parameters.get("output_filename"),
-                    ),
-                )
-            finally:
-                # Clean up temporary output file
-                if temp_output_path.exists():
-                    temp_output_path.unlink()
+            yield self.create_blob_message(
+                blob=result_file_bytes,
+                meta=get_meta_data(
+                    mime_type=MimeType.DOCX,
+                    output_filename=tool_parameters.get("output_filename"),
+                ),
+            )
         except Exception as e:
             self.logger.exception("Failed to convert markdown text to DOCX file")
             yield self.create_text_message(f"Failed to convert markdown text to DOCX file, error: {str(e)}")
@@ -1,11 +1,9 @@
 from collections.abc import Generator
-from pathlib import Path
-from tempfile import NamedTemporaryFile
 
 from dify_plugin import Tool
 from dify_plugin.entities.tool import ToolInvokeMessage
 
-from md_exporter.services.svc_md_to_html import convert_md_to_html
+from md_exporter.services.svc_md_to_html import convert_md_to_html_bytes
 from md_exporter.utils.file_utils import get_meta_data
 from md_exporter.utils.logger_utils import get_logger
 from md_exporter.utils.mimetype_utils import MimeType
@@ -23,28 +21,16 @@ class MarkdownToHtmlTool(Tool):
         md_text = get_md_text_from_tool_params(tool_parameters)
 
         try:
-            # Create temporary output file
-            with NamedTemporaryFile(suffix=".html", delete=False) as temp_output_file:
-                temp_output_path = Path(temp_output_file.name)
-
-            try:
-                # Convert to HTML using the public service
-                convert_md_to_html(md_text, temp_output_path, is_strip_wrapper=True)
-
-                # Read the converted file content
-                result_file_bytes = temp_output_path.read_bytes()
-
-                yield self.create_blob_message(
-                    blob=result_file_bytes,
-                    meta=get_meta_data(
-                        mime_type=MimeType.HTML,
-                        output_filename=tool_parameters.get("output_filename"),
-                    ),
-                )
-            finally:
-                # Clean up temporary output file
-                if temp_output_path.exists():
-                    temp_output_path.unlink()
+            # Convert to HTML in memory using the public service
+            result_file_bytes = convert_md_to_html_bytes(md_text, is_strip_wrapper=True)
+
+            yield self.create_blob_message(
+                blob=result_file_bytes,
+                meta=get_meta_data(
+                    mime_type=MimeType.HTML,
+                    output_filename=tool_parameters.get("output_filename"),
+                ),
+            )
         except Exception as e:
             self.logger.exception("Failed to convert file")
             yield self.create_text_message(f"Failed to convert markdown text to HTML file, error: {str(e)}")
@@ -1,16 +1,14 @@
 from collections.abc import Generator
 from enum import StrEnum
-from pathlib import Path
-from tempfile import NamedTemporaryFile
 
 from dify_plugin import Tool
 from dify_plugin.entities.tool import ToolInvokeMessage
 
-from md_exporter.services.svc_md_to_json import convert_md_to_json
+from md_exporter.services.svc_md_to_json import convert_md_to_json_bytes
 from md_exporter.utils.file_utils import get_meta_data
 from md_exporter.utils.logger_utils import get_logger
 from md_exporter.utils.mimetype_utils import MimeType
-from md_exporter.utils.param_utils import get_md_text_from_tool_params
+from md_exporter.utils.param_utils import get_md_text_from_tool_params, get_param_value
 
 
 class JsonOutputStyle(StrEnum):
@@ -30,24 +28,21 @@ class MarkdownToJsonTool(Tool):
         md_text = get_md_text_from_tool_params(tool_parameters)
         output_filename = tool_parameters.get("output_filename")
         output_style = tool_parameters.get("output_style", JsonOutputStyle.JSONL)
+        force_text_value: bool = "true" == get_param_value(tool_parameters, "force_text_value", "true").lower()
 
         try:
-            # create a temporary output JSON file
-            with NamedTemporaryFile(suffix=".json", delete=False) as temp_json_file:
-                temp_json_output_path = Path(temp_json_file.name)
-
-            # convert markdown to json using the shared function
-            created_files = convert_md_to_json(
-                md_text, temp_json_output_path, style=output_style, is_strip_wrapper=True
+            # convert markdown to json in memory using the shared function
+            results = convert_md_to_json_bytes(
+                md_text,
+                style=output_style,
+                is_strip_wrapper=True,
+                force_text=force_text_value,
             )
 
-            # read the result bytes for each created file
-            for i, file_path in enumerate(created_files):
-                result_file_bytes = file_path.read_bytes()
-
+            for i, result_file_bytes in enumerate(results):
                 result_filename: str | None = None
                 if output_filename:
-                    if len(created_files) > 1:
+                    if len(results) > 1:
                         result_filename = f"{output_filename}_{i + 1}"
                     else:
                         result_filename = output_filename
@@ -64,12 +59,5 @@ class MarkdownToJsonTool(Tool):
             self.logger.exception("Failed to convert markdown text to JSON file")
             yield self.create_text_message(f"Failed to convert markdown text to JSON file, error: {str(e)}")
             return
-        finally:
-            # clean up temporary files
-            if "temp_json_output_path" in locals():
-                temp_json_output_path.unlink(missing_ok=True)
-            if "created_files" in locals():
-                for file_path in created_files:
-                    file_path.unlink(missing_ok=True)
 
         return
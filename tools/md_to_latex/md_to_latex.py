@@ -1,15 +1,13 @@
 from collections.abc import Generator
-from pathlib import Path
-from tempfile import NamedTemporaryFile
 
 from dify_plugin import Tool
 from dify_plugin.entities.tool import ToolInvokeMessage
 
-from md_exporter.services.svc_md_to_latex import convert_md_to_latex
+from md_exporter.services.svc_md_to_latex import convert_md_to_latex_bytes
 from md_exporter.utils.file_utils import get_meta_data
 from md_exporter.utils.logger_utils import get_logger
 from md_exporter.utils.mimetype_utils import MimeType
-from md_exporter.utils.param_utils import get_md_text_from_tool_params
+from md_exporter.utils.param_utils import get_md_text_from_tool_params, get_param_value
 
 
 class MarkdownToLatexTool(Tool):
@@ -23,22 +21,19 @@ class MarkdownToLatexTool(Tool):
         # get parameters
         md_text = get_md_text_from_tool_params(tool_parameters)
         output_filename = tool_parameters.get("output_filename")
+        longtable: bool = "true" == get_param_value(tool_parameters, "longtable", "false").lower()
+        single_document: bool = "true" == get_param_value(tool_parameters, "single_document", "false").lower()
 
         try:
-            # create a temporary output LaTeX file
-            with NamedTemporaryFile(suffix=".tex", delete=False) as temp_latex_file:
-                temp_latex_output_path = Path(temp_latex_file.name)
-
-            # convert markdown to latex using the shared function
-            created_files = convert_md_to_latex(md_text, temp_latex_output_path, is_strip_wrapper=True)
-
-            # read the result bytes for each created file
-            for i, file_path in enumerate(created_files):
-                result_file_bytes = file_path.read_bytes()
+            # convert markdown to latex in memory using the shared function
+            results = convert_md_to_latex_bytes(
+                md_text, is_strip_wrapper=True, longtable=longtable, single_document=single_document
+            )
 
+            for i, result_file_bytes in enumerate(results):
                 result_filename: str | None = None
                 if output_filename:
-                    if len(created_files) > 1:
+                    if len(results) > 1:
                         result_filename = f"{output_filename}_{i + 1}"
                     else:
                         result_filename = output_filename
@@ -55,12 +50,5 @@ class MarkdownToLatexTool(Tool):
             self.logger.exception("Failed to convert markdown text to LaTeX file")
             yield self.create_text_message(f"Failed to convert markdown text to LaTeX file, error: {str(e)}")
             return
-        finally:
-            # clean up temporary files
-            if "temp_latex_output_path" in locals():
-                temp_latex_output_path.unlink(missing_ok=True)
-            if "created_files" in locals():
-                for file_path in created_files:
-                    file_path.unlink(missing_ok=True)
 
         return
@@ -0,0 +1,51 @@
+from collections.abc import Generator
+
+from dify_plugin import Tool
+from dify_plugin.entities.tool import ToolInvokeMessage
+
+from md_exporter.services.svc_md_to_parquet import convert_md_to_parquet_bytes
+from md_exporter.utils.file_utils import get_meta_data
+from md_exporter.utils.logger_utils import get_logger
+from md_exporter.utils.mimetype_utils import MimeType
+from md_exporter.utils.param_utils import get_md_text_from_tool_params, get_param_value
+
+
+class MarkdownToParquetTool(Tool):
+    logger = get_logger(__name__)
+
+    def _invoke(self, tool_parameters: dict) -> Generator[ToolInvokeMessage, None, None]:
+        """
+        invoke tools
+        """
+
+        # get parameters
+        md_text = get_md_text_from_tool_params(tool_parameters)
+        output_filename = tool_parameters.get("output_filename")
+        force_text_value: bool = "true" == get_param_value(tool_parameters, "force_text_value", "true").lower()
+
+        try:
+            # convert markdown to parquet in memory using the shared function
+            results = convert_md_to_parquet_bytes(md_text, is_strip_wrapper=True, force_text=force_text_value)
+
+            for i, result_file_bytes in enumerate(results):
+                result_filename: str | None = None
+                if output_filename:
+                    if len(results) > 1:
+                        result_filename = f"{output_filename}_{i + 1}.parquet"
+                    else:
+                        result_filename = output_filename
+
+                yield self.create_blob_message(
+                    blob=result_file_bytes,
+                    meta=get_meta_data(
+                        mime_type=MimeType.PARQUET,
+                        output_filename=result_filename,
+                    ),
+                )
+
+        except Exception as e:
+            self.logger.exception("Failed to convert markdown text to Parquet file")
+            yield self.create_text_message(f"Failed to convert markdown text to Parquet file, error: {str(e)}")
+            return
+
+        return
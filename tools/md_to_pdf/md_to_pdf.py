@@ -1,11 +1,9 @@
 from collections.abc import Generator
-from pathlib import Path
-from tempfile import NamedTemporaryFile
 
 from dify_plugin import Tool
 from dify_plugin.entities.tool import ToolInvokeMessage
 
-from md_exporter.services.svc_md_to_pdf import convert_md_to_pdf
+from md_exporter.services.svc_md_to_pdf import PdfEngine, convert_md_to_pdf_bytes
 from md_exporter.utils.file_utils import get_meta_data
 from md_exporter.utils.logger_utils import get_logger
 from md_exporter.utils.mimetype_utils import MimeType
@@ -21,26 +19,15 @@ class MarkdownToPdfTool(Tool):
         """
         # get parameters
         md_text = get_md_text_from_tool_params(tool_parameters, is_strip_wrapper=True)
+        engine = tool_parameters.get("pdf_engine") or PdfEngine.XHTML2PDF
 
         try:
-            # create a temporary output PDF file
-            with NamedTemporaryFile(suffix=".pdf", delete=False) as temp_pdf_file:
-                temp_pdf_output_path = Path(temp_pdf_file.name)
-
-            # convert markdown to pdf using the shared function
-            convert_md_to_pdf(md_text, temp_pdf_output_path, is_strip_wrapper=True)
-
-            # read the result bytes
-            result_file_bytes = temp_pdf_output_path.read_bytes()
-
+            # convert markdown to pdf in memory using the shared function
+            result_file_bytes = convert_md_to_pdf_bytes(md_text, is_strip_wrapper=True, engine=engine)
         except Exception as e:
             self.logger.exception("Failed to convert markdown text to PDF file")
             yield self.create_text_message(f"Failed to convert markdown text to PDF file, error: {str(e)}")
             return
-        finally:
-            # clean up temporary files
-            if "temp_pdf_output_path" in locals():
-                temp_pdf_output_path.unlink(missing_ok=True)
 
         yield self.create_blob_message(
             blob=result_file_bytes,
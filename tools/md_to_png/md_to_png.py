@@ -1,11 +1,11 @@
 from collections.abc import Generator
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 
 from dify_plugin import Tool
 from dify_plugin.entities.tool import ToolInvokeMessage
 
-from md_exporter.services.svc_md_to_png import convert_md_to_png
+from md_exporter.services.svc_md_to_pdf import PdfEngine
+from md_exporter.services.svc_md_to_png import DEFAULT_PNG_DPI, convert_md_to_png_bytes
 from md_exporter.utils.file_utils import get_meta_data
 from md_exporter.utils.logger_utils import get_logger
 from md_exporter.utils.mimetype_utils import MimeType
@@ -24,21 +24,27 @@ class MarkdownToPngTool(Tool):
         output_filename = tool_parameters.get("output_filename", "output")
         is_compress = "true" == get_param_value(tool_parameters, "is_compress", "true").lower()
         compress = is_compress
+        engine = tool_parameters.get("pdf_engine") or PdfEngine.XHTML2PDF
+        pages = tool_parameters.get("pages")
 
         try:
-            # create a temporary output file
-            suffix = ".zip" if compress else ".png"
-            with NamedTemporaryFile(suffix=suffix, delete=False) as temp_output_file:
-                temp_output_path = Path(temp_output_file.name)
+            dpi = int(tool_parameters.get("dpi") or DEFAULT_PNG_DPI)
 
-            # convert markdown to png using the shared function
-            created_files = convert_md_to_png(md_text, temp_output_path, compress=compress, is_strip_wrapper=True)
+            # convert markdown to png in memory using the shared function
+            results = convert_md_to_png_bytes(
+                md_text,
+                compress=compress,
+                is_strip_wrapper=True,
+                engine=engine,
+                dpi=dpi,
+                pages=pages,
+            )
 
-            # generate blob messages based on the created files
+            # generate blob messages based on the results
             if compress:
                 # single ZIP file
                 yield self.create_blob_message(
-                    blob=created_files[0].read_bytes(),
+                    blob=results[0][1],
                     meta=get_meta_data(
                         mime_type=MimeType.ZIP,
                         output_filename=output_filename,
@@ -46,14 +52,14 @@ class MarkdownToPngTool(Tool):
                 )
             else:
                 # multiple PNG files
-                for file_path in created_files:
+                for file_name, file_bytes in results:
                     yield self.create_blob_message(
-                        blob=file_path.read_bytes(),
+                        blob=file_bytes,
                         meta=get_meta_data(
                             mime_type=MimeType.PNG,
                             output_filename=output_filename
-                            if len(created_files) == 1
-                            else f"{output_filename}_{file_path.stem.split('_')[-1]}",
+                            if len(results) == 1
+                            else f"{output_filename}_{Path(file_name).stem}",
                         ),
                     )
 
@@ -61,12 +67,5 @@ class MarkdownToPngTool(Tool):
             self.logger.exception("Failed to convert markdown text to PNG files")
             yield self.create_text_message(f"Failed to convert markdown text to PNG files, error: {str(e)}")
             return
-        finally:
-            # clean up temporary files
-            if "temp_output_path" in locals():
-                temp_output_path.unlink(missing_ok=True)
-            if "created_files" in locals():
-                for file_path in created_files:
-                    file_path.unlink(missing_ok=True)
 
         return
@@ -6,7 +6,7 @@ from dify_plugin import Tool
 from dify_plugin.entities.tool import ToolInvokeMessage
 from dify_plugin.file.file import File
 
-from md_exporter.services.svc_md_to_pptx import convert_md_to_pptx
+from md_exporter.services.svc_md_to_pptx import convert_md_to_pptx_bytes
 from md_exporter.utils.file_utils import get_meta_data
 from md_exporter.utils.logger_utils import get_logger
 from md_exporter.utils.mimetype_utils import MimeType
@@ -38,15 +38,8 @@ class MarkdownToPptxTool(Tool):
                 temp_pptx_template_file.close()
                 temp_pptx_template_file_path = Path(temp_pptx_template_file.name)
 
-            # create a temporary output PPTX file
-            with NamedTemporaryFile(suffix=".pptx", delete=False) as temp_pptx_file:
-                temp_pptx_output_path = Path(temp_pptx_file.name)
-
-            # convert markdown to pptx using the shared function
-            output_path = convert_md_to_pptx(md_text, temp_pptx_output_path, temp_pptx_template_file_path)
-
-            # read the result bytes
-            result_file_bytes = output_path.read_bytes()
+            # convert markdown to pptx in memory using the shared function
+            result_file_bytes = convert_md_to_pptx_bytes(md_text, temp_pptx_template_file_path)
 
         except Exception as e:
             self.logger.exception("Failed to convert markdown text to PPTX file")
@@ -55,8 +48,6 @@ class MarkdownToPptxTool(Tool):
             # clean up temporary files
             if temp_pptx_template_file:
                 Path(temp_pptx_template_file.name).unlink(missing_ok=True)
-            if "temp_pptx_output_path" in locals():
-                temp_pptx_output_path.unlink(missing_ok=True)
 
         yield self.create_blob_message(
             blob=result_file_bytes,
@@ -0,0 +1,46 @@
+from collections.abc import Generator
+
+from dify_plugin import Tool
+from dify_plugin.entities.tool import ToolInvokeMessage
+
+from md_exporter.services.svc_md_to_sqlite import convert_md_to_sqlite_bytes
+from md_exporter.utils.file_utils import get_meta_data
+from md_exporter.utils.logger_utils import get_logger
+from md_exporter.utils.mimetype_utils import MimeType
+from md_exporter.utils.param_utils import get_md_text_from_tool_params, get_param_value
+
+
+class MarkdownToSqliteTool(Tool):
+    logger = get_logger(__name__)
+
+    def _invoke(self, tool_parameters: dict) -> Generator[ToolInvokeMessage, None, None]:
+        """
+        invoke tools
+        """
+
+        # get parameters
+        md_text = get_md_text_from_tool_params(tool_parameters)
+        force_text_value: bool = "true" == get_param_value(tool_parameters, "force_text_value", "true").lower()
+        index_columns = tool_parameters.get("index_columns")
+
+        # generate SQLite file using shared service
+        try:
+            # Convert to SQLite in memory using the public service
+            result_file_bytes = convert_md_to_sqlite_bytes(
+                md_text,
+                is_strip_wrapper=True,
+                force_text=force_text_value,
+                index_columns=index_columns,
+            )
+
+            yield self.create_blob_message(
+                blob=result_file_bytes,
+                meta=get_meta_data(
+                    mime_type=MimeType.SQLITE,
+                    output_filename=tool_parameters.get("output_filename"),
+                ),
+            )
+        except Exception as e:
+            self.logger.exception("Failed to convert file")
+            yield self.create_text_message(f"Failed to convert markdown text to SQLite file, error: {str(e)}")
+            return
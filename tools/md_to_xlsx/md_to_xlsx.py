@@ -1,11 +1,9 @@
 from collections.abc import Generator
-from pathlib import Path
-from tempfile import NamedTemporaryFile
 
 from dify_plugin import Tool
 from dify_plugin.entities.tool import ToolInvokeMessage
 
-from md_exporter.services.svc_md_to_xlsx import convert_md_to_xlsx
+from md_exporter.services.svc_md_to_xlsx import convert_md_to_xlsx_bytes
 from md_exporter.utils.file_utils import get_meta_data
 from md_exporter.utils.logger_utils import get_logger
 from md_exporter.utils.mimetype_utils import MimeType
@@ -26,28 +24,16 @@ class MarkdownToXlsxTool(Tool):
 
         # generate XLSX file using shared service
         try:
-            # Create temporary output file
-            with NamedTemporaryFile(suffix=".xlsx", delete=False) as temp_xlsx_file:
-                temp_output_path = Path(temp_xlsx_file.name)
-
-            try:
-                # Convert to XLSX using the public service
-                convert_md_to_xlsx(md_text, temp_output_path, is_strip_wrapper=True, force_text=force_text_value)
-
-                # Read the converted file content
-                result_file_bytes = temp_output_path.read_bytes()
-
-                yield self.create_blob_message(
-                    blob=result_file_bytes,
-                    meta=get_meta_data(
-                        mime_type=MimeType.XLSX,
-                        output_filename=tool_parameters.get("output_filename"),
-                    ),
-                )
-            finally:
-                # Clean up temporary output file
-                if temp_output_path.exists():
-                    temp_output_path.unlink()
+            # Convert to XLSX in memory using the public service
+            result_file_bytes = convert_md_to_xlsx_bytes(md_text, is_strip_wrapper=True, force_text=force_text_value)
+
+            yield self.create_blob_message(
+                blob=result_file_bytes,
+                meta=get_meta_data(
+                    mime_type=MimeType.XLSX,
+                    output_filename=tool_parameters.get("output_filename"),
+                ),
+            )
         except Exception as e:
             self.logger.exception("Failed to convert file")
             yield self.create_text_message(f"Failed to convert markdown text to XLSX file, error: {str(e)}")
@@ -1,11 +1,9 @@
 from collections.abc import Generator
-from pathlib import Path
-from tempfile import NamedTemporaryFile
 
 from dify_plugin import Tool
 from dify_plugin.entities.tool import ToolInvokeMessage
 
-from md_exporter.services.svc_md_to_xml import convert_md_to_xml
+from md_exporter.services.svc_md_to_xml import convert_md_to_xml_bytes
 from md_exporter.utils.file_utils import get_meta_data
 from md_exporter.utils.logger_utils import get_logger
 from md_exporter.utils.mimetype_utils import MimeType
@@ -24,24 +22,12 @@ class MarkdownToXmlTool(Tool):
         md_text = get_md_text_from_tool_params(tool_parameters, is_strip_wrapper=True)
 
         try:
-            # create a temporary output XML file
-            with NamedTemporaryFile(suffix=".xml", delete=False) as temp_xml_file:
-                temp_xml_output_path = Path(temp_xml_file.name)
-
-            # convert markdown to xml using the shared function
-            created_file = convert_md_to_xml(md_text, temp_xml_output_path, is_strip_wrapper=True)
-
-            # read the result bytes
-            result_file_bytes = created_file.read_bytes()
-
+            # convert markdown to xml in memory using the shared function
+            result_file_bytes = convert_md_to_xml_bytes(md_text, is_strip_wrapper=True)
         except Exception as e:
             self.logger.exception("Failed to convert markdown text to XML file")
             yield self.create_text_message(f"Failed to convert markdown text to XML file, error: {str(e)}")
             return
-        finally:
-            # clean up temporary files
-            if "temp_xml_output_path" in locals():
-                temp_xml_output_path.unlink(missing_ok=True)
 
         yield self.create_blob_message(
             blob=result_file_bytes,